@@ -0,0 +1,120 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from pydantic import TypeAdapter
+
+from app.utils.cache import BoundedCache
+
+from .mongo import db
+
+
+##### Backends #####
+
+
+class CacheBackend[V](ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[V]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: V) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+
+class MemoryCacheBackend[V](CacheBackend[V]):
+    """In-process LRU store with per-entry expiry."""
+
+    def __init__(self, name: str, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max(1, max_size)
+        self._entries: BoundedCache[str, V] = BoundedCache(
+            name, max_size=self.max_size, ttl=ttl
+        )
+
+    async def get(self, key: str) -> Optional[V]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: V) -> None:
+        self._entries.set(key, value)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class MongoCacheBackend[V](CacheBackend[V]):
+    """Shared store backed by a Mongo collection with a TTL index."""
+
+    def __init__(
+        self,
+        adapter: TypeAdapter[V],
+        ttl: int,
+        collection: str,
+        field: str = "value",
+    ):
+        self.adapter = adapter  # (De)serializes values to/from JSON documents
+        self.ttl = ttl
+        self.collection = collection
+        self.field = field
+        self._indexed = False
+
+    async def get(self, key: str) -> Optional[V]:
+        now = datetime.now(tz=timezone.utc)
+        document = await self._collection().find_one(
+            {"_id": key, "expires_at": {"$gt": now}}
+        )
+        if document is None:
+            return None
+        return self.adapter.validate_python(document[self.field])
+
+    async def set(self, key: str, value: V) -> None:
+        collection = self._collection()
+        if not self._indexed:  # Let Mongo purge expired entries
+            await collection.create_index("expires_at", expireAfterSeconds=0)
+            self._indexed = True
+        expires_at = datetime.now(tz=timezone.utc) + timedelta(seconds=self.ttl)
+        await collection.update_one(
+            {"_id": key},
+            {
+                "$set": {
+                    self.field: self.adapter.dump_python(value, mode="json"),
+                    "expires_at": expires_at,
+                }
+            },
+            upsert=True,
+        )
+
+    async def clear(self) -> None:
+        await self._collection().delete_many({})
+
+    def _collection(self):
+        return db.get_database()[self.collection]
+
+
+##### Tiered Cache #####
+
+
+class TieredCache[V]:
+    def __init__(self, backends: List[CacheBackend[V]]):
+        self.backends = backends  # Ordered from fastest to slowest tier
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.backends)
+
+    async def get(self, key: str) -> Optional[V]:
+        for idx, backend in enumerate(self.backends):
+            value = await backend.get(key)
+            if value is not None:
+                for faster in self.backends[:idx]:  # Promote to faster tiers
+                    await faster.set(key, value)
+                return value
+        return None
+
+    async def set(self, key: str, value: V) -> None:
+        for backend in self.backends:
+            await backend.set(key, value)
+
+    async def clear(self) -> None:
+        for backend in self.backends:
+            await backend.clear()
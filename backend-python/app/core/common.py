@@ -37,3 +37,9 @@ type PlaceId = PydanticObjectId
 
 
 type Model = Literal["openai", "gemini"]
+
+
+type AssignerStrategy = Literal["model", "heuristic", "hybrid"]
+
+
+type PromptFormat = Literal["full", "compact"]
@@ -1,9 +1,9 @@
-from typing import Annotated, Any, List, Optional
+from typing import Annotated, Any, List, Literal, Optional
 from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from datetime import timezone, timedelta
 
-from .common import Model
+from .common import AssignerStrategy, Model, PromptFormat
 
 
 def parse_csv(v: Any) -> List[str]:
@@ -33,6 +33,39 @@ class Settings(BaseSettings):
 
     # Google Maps
     GOOGLE_MAPS_API_KEY: str
+    ROUTES_MAX_CONCURRENCY: int = 8  # Max in-flight Routes API calls per request
+    ROUTES_CLIENT_POOL_SIZE: int = 2  # Shared gRPC channels to the Routes API
+    ROUTES_TIMEOUT: float = 10.0  # Per-call deadline (seconds)
+    ROUTES_MAX_RETRIES: int = 2  # Retries for retryable gRPC status codes
+    ROUTES_RETRY_BACKOFF: float = 0.2  # First retry delay (seconds)
+    ROUTES_HEDGE_PERCENTILE: Optional[float] = None  # e.g. 95 to enable hedging
+
+    # Routing provider (local: WALK/DRIVE from an offline road graph)
+    ROUTING_PROVIDER: Literal["google", "local"] = "google"
+    LOCAL_ROUTING_GRAPH: Optional[str] = None  # Path to a built graph (.npz)
+
+    @model_validator(mode="after")
+    def validate_routing_config(self):
+        if self.ROUTING_PROVIDER == "local" and not self.LOCAL_ROUTING_GRAPH:
+            raise ValueError(
+                "LOCAL_ROUTING_GRAPH is required when ROUTING_PROVIDER='local'"
+            )
+        return self
+
+    # Route leg cache
+    ROUTES_CACHE_ENABLED: bool = True
+    ROUTES_CACHE_BACKEND: Literal["memory", "mongo"] = "memory"  # mongo: + shared tier
+    ROUTES_CACHE_TTL: int = 86400  # Unit: seconds
+    ROUTES_CACHE_MAX_SIZE: int = 10000  # Max in-process entries
+    ROUTES_CACHE_BUCKET_MINUTES: int = 60  # Departure time quantization
+
+    # Route warm-up (precompute legs between popular places)
+    ROUTES_WARMUP_ENABLED: bool = False  # Run periodically in the app lifespan
+    ROUTES_WARMUP_INTERVAL: int = 86400  # Unit: seconds between runs
+    ROUTES_WARMUP_TOP_K: int = 10  # Places per region (by ranking)
+    ROUTES_WARMUP_DAYS: int = 7  # Upcoming days covered
+    ROUTES_WARMUP_BUDGET: int = 500  # Max Routes API calls per run
+    ROUTES_WARMUP_RATE: float = 2.0  # Max Routes API calls per second
 
     # Itinerary LLM
     MODEL_PROVIDER: Model = "openai"
@@ -49,6 +82,18 @@ class Settings(BaseSettings):
             raise ValueError("GEMINI_API_KEY is required when MODEL_PROVIDER='gemini'")
         return self
 
+    # Itinerary planning (model: LLM, heuristic: local solver, hybrid: LLM groups days)
+    ITINERARY_ASSIGNER: AssignerStrategy = "model"
+    ITINERARY_PROMPT: PromptFormat = "full"  # compact: JSON-lines places, fewer tokens
+
+    # Itinerary plan cache (same places and weekdays: reuse the plan)
+    ITINERARY_CACHE_ENABLED: bool = True
+    ITINERARY_CACHE_BACKEND: Literal["memory", "mongo"] = (
+        "memory"  # mongo: + shared tier
+    )
+    ITINERARY_CACHE_TTL: int = 86400  # Unit: seconds
+    ITINERARY_CACHE_MAX_SIZE: int = 1000  # Max in-process entries
+
     # CORS
     CORS_ORIGINS: Annotated[List[str], NoDecode] = []
 
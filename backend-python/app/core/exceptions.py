@@ -32,16 +32,25 @@ class ErrorCode(StrEnum):
     ROUTES_PLACES_FORMAT = "routes.places.format"
     ROUTES_PLACES_REGIONS = "routes.places.regions"
     ROUTES_PLACES_NOTFOUND = "routes.places.notFound"
+    ROUTES_SIMPLIFY_INVALID = "routes.simplify.invalid"
     ROUTES_COMPUTE_FAILED = "routes.compute.failed"
 
+    # POST /routes/matrix
+    ROUTES_MATRIX_FAILED = "routes.matrix.failed"
+
     # POST /itinerary/plan
     ITINERARY_DATE_FORMAT = "itinerary.date.format"
     ITINERARY_DURATION_INVALID = "itinerary.duration.invalid"
     ITINERARY_PLACES_FORMAT = "itinerary.places.format"
     ITINERARY_PLACES_REGIONS = "itinerary.places.regions"
     ITINERARY_PLACES_NOTFOUND = "itinerary.places.notFound"
+    ITINERARY_ASSIGNER_INVALID = "itinerary.assigner.invalid"
     ITINERARY_PLAN_FAILED = "itinerary.plan.failed"
 
+    # POST /fares/estimate
+    FARES_LEGS_FORMAT = "fares.legs.format"
+    FARES_ESTIMATE_FAILED = "fares.estimate.failed"
+
     # General
     SERVER_INTERNAL_GENERAL = "server.internal.general"
 
@@ -156,6 +165,9 @@ async def unhandled_exception_handler(_: Request, __: Exception):
 ##### Utilities #####
 
 
+ROUTES_PATHS = ("/routes/compute", "/routes/matrix")
+
+
 def _map_validation_error_code(
     request: Request,
     errors: list[dict[str, Any]] = [],
@@ -194,8 +206,8 @@ def _map_validation_error_code(
             if loc[1] == "id":
                 return ErrorCode.PLACE_ID_FORMAT
 
-        # POST /routes/compute
-        if method == "POST" and path == "/routes/compute" and loc[0] == "body":
+        # POST /routes/compute, POST /routes/matrix
+        if method == "POST" and path in ROUTES_PATHS and loc[0] == "body":
             if loc[1] == "date" and "between" in msg:
                 return ErrorCode.ROUTES_DATE_RANGE
             if loc[1] == "date":
@@ -204,6 +216,8 @@ def _map_validation_error_code(
                 return ErrorCode.ROUTES_PLACES_FORMAT
             if loc[1] in ("mode", "method"):
                 return ErrorCode.ROUTES_METHOD_INVALID
+            if loc[1] == "simplify":
+                return ErrorCode.ROUTES_SIMPLIFY_INVALID
 
         # POST /itinerary/plan
         if method == "POST" and path == "/itinerary/plan" and loc[0] == "body":
@@ -213,6 +227,13 @@ def _map_validation_error_code(
                 return ErrorCode.ITINERARY_DURATION_INVALID
             if loc[1] == "places":
                 return ErrorCode.ITINERARY_PLACES_FORMAT
+            if loc[1] == "assigner":
+                return ErrorCode.ITINERARY_ASSIGNER_INVALID
+
+        # POST /fares/estimate
+        if method == "POST" and path == "/fares/estimate" and loc[0] == "body":
+            if loc[1] == "legs":
+                return ErrorCode.FARES_LEGS_FORMAT
 
     # Fallback: Unknown
     return ErrorCode.UNKNOWN
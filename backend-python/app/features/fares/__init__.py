@@ -0,0 +1,3 @@
+from .router import fares_router
+
+__all__ = ["fares_router"]
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, HTTPException
+
+from app.core.exceptions import ErrorCode, error_models
+
+from .schemas import FaresRequest, FaresResponse
+from .service import FareService
+
+fares_router = APIRouter()
+
+
+@fares_router.post(
+    "/estimate",
+    operation_id="estimate_fares",
+    responses=error_models([422, 500]),
+)
+def estimate_fares(body: FaresRequest) -> FaresResponse:
+    # CPU-bound: runs in the threadpool
+    try:
+        return FaresResponse(fares=FareService.estimate(body.legs))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": ErrorCode.FARES_ESTIMATE_FAILED,
+                "message": "Failed to estimate fares",
+                "details": {"reason": str(e)},
+            },
+        )
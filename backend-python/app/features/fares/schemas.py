@@ -0,0 +1,60 @@
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.core.common import Region
+
+from ..routing.schemas import TravelMode, Vehicle
+
+
+FARES_MAX_LEGS = 50_000
+
+
+class FareStep(BaseModel):
+    mode: TravelMode
+    vehicle: Optional[Vehicle] = None  # Transit steps only
+    stops: int = Field(0, ge=0)
+    origin: str = ""  # Departure stop name
+    destination: str = ""  # Arrival stop name
+
+    @field_validator("vehicle")
+    @classmethod
+    def validate_vehicle(cls, v):
+        if v == Vehicle.MIXED:
+            raise ValueError("A step has a single vehicle type")
+        return v
+
+    @model_validator(mode="after")
+    def validate_transit_vehicle(self):
+        if self.mode == TravelMode.TRANSIT and self.vehicle is None:
+            raise ValueError("Transit steps require a vehicle")
+        return self
+
+
+class FareLeg(BaseModel):
+    region: Region
+    start: Tuple[float, float]  # (latitude, longitude)
+    end: Tuple[float, float]  # (latitude, longitude)
+    distance: int = Field(ge=0)  # Unit: meters
+    duration: int = Field(ge=0)  # Unit: seconds
+    polyline: str = ""  # Encoded polyline string (for tolls)
+    steps: List[FareStep]
+
+
+##### Public Schemas #####
+
+
+class FaresRequest(BaseModel):
+    legs: List[FareLeg]
+
+    @field_validator("legs")
+    @classmethod
+    def validate_legs(cls, v):
+        if not v:
+            raise ValueError("Legs list cannot be empty")
+        if len(v) > FARES_MAX_LEGS:
+            raise ValueError(f"Legs list cannot exceed {FARES_MAX_LEGS} items")
+        return v
+
+
+class FaresResponse(BaseModel):
+    fares: List[Optional[float]]  # Same order as the requested legs
@@ -0,0 +1,58 @@
+from typing import List, Optional, Sequence
+
+from google.maps import routing_v2
+
+from app.integrations.fares import LegSummary, StepSummary, compute_fares
+
+from ..routing.schemas import Vehicle
+from ..routing.service import MODE_MAP, VEHICLE_MAP
+from .schemas import FareLeg, FareStep
+
+
+INVERSE_VEHICLE_MAP = {v: k for k, v in VEHICLE_MAP.items()}
+
+
+class FareService:
+    @classmethod
+    def estimate(cls, legs: Sequence[FareLeg]) -> List[Optional[float]]:
+        """Estimate fares for a batch of legs without requesting routes.
+        Args:
+            legs (Sequence[FareLeg]): Leg summaries (e.g. from past routes).
+        Returns:
+            List[Optional[float]]: Fare per leg in the same order (None if not applicable).
+        """
+        regions = [leg.region for leg in legs]
+        return compute_fares(regions, [cls.summarize(leg) for leg in legs])
+
+    @staticmethod
+    def summarize(leg: FareLeg) -> LegSummary:
+        return LegSummary(
+            start=leg.start,
+            end=leg.end,
+            distance=leg.distance,
+            duration=leg.duration,
+            polyline=leg.polyline,
+            steps=tuple(_to_step(step) for step in leg.steps),
+        )
+
+
+def _to_step(step: FareStep) -> StepSummary:
+    travel_mode = MODE_MAP[step.mode]
+    if travel_mode != routing_v2.RouteTravelMode.TRANSIT:
+        return StepSummary(travel_mode=travel_mode)
+    return StepSummary(
+        travel_mode=travel_mode,
+        vehicle=_to_vehicle_type(step.vehicle),
+        stops=step.stops,
+        origin=step.origin,
+        destination=step.destination,
+    )
+
+
+def _to_vehicle_type(
+    vehicle: Optional[Vehicle],
+) -> routing_v2.TransitVehicle.TransitVehicleType:
+    return INVERSE_VEHICLE_MAP.get(
+        vehicle,
+        routing_v2.TransitVehicle.TransitVehicleType.TRANSIT_VEHICLE_TYPE_UNSPECIFIED,
+    )
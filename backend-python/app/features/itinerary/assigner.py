@@ -1,11 +1,15 @@
 import json
 import jsonschema
+import math
 import re
+import numpy as np
 from typing import List, Optional
 from datetime import date as _date
 
-from app.core.common import PlaceId
+from app.core.common import PlaceId, PromptFormat
+from app.core.config import settings
 from app.integrations.model import ModelClient, ModelMessage, ModelRequest
+from app.utils.geometry import haversine_array
 
 from ..places import Place
 
@@ -29,6 +33,223 @@ class RoundRobinAssigner:
         return assignments
 
 
+class HeuristicAssigner:
+    """Local solver: balanced k-medoids day groups, then short-hop routes per day."""
+
+    MAX_ITERATIONS = 20  # k-medoids rounds (converges in a few on real trips)
+
+    @classmethod
+    def assign(
+        cls,
+        dates: List[_date],
+        places: List[Place],
+    ) -> List[List[PlaceId]]:
+        assignments: List[List[PlaceId]] = [[] for _ in dates]
+        if not dates or not places:
+            return assignments
+
+        distances = cls._distances(places)
+        open_days = cls._open_days(dates, places)
+
+        # Group by location, then give each group the day most of its places are open
+        k = min(len(dates), len(places))
+        labels = cls._cluster(distances, k)
+        days = cls._match_days(labels, k, open_days)[labels]
+        days = cls._repair_closed(days, distances, open_days)
+
+        for day, assignment in enumerate(assignments):
+            members = np.flatnonzero(days == day)
+            route = cls._route(distances[np.ix_(members, members)])
+            assignment.extend(places[members[idx]].id for idx in route)
+        return assignments
+
+    @classmethod
+    def order(
+        cls,
+        assignments: List[List[PlaceId]],
+        places: List[Place],
+    ) -> List[List[PlaceId]]:
+        """Reorder each day of existing assignments into a short-hop route.
+        Args:
+            assignments (List[List[PlaceId]]): Place IDs per day (any order).
+            places (List[Place]): Places referenced by the assignments.
+        Returns:
+            List[List[PlaceId]]: Same days and places, in visit order.
+        """
+        by_id = {place.id: place for place in places}
+        ordered = []
+        for day in assignments:
+            day_places = [by_id[pid] for pid in day]
+            route = cls._route(cls._distances(day_places)) if day_places else []
+            ordered.append([day_places[idx].id for idx in route])
+        return ordered
+
+    @staticmethod
+    def _distances(places: List[Place]) -> np.ndarray:
+        # (N, N) haversine matrix, in meters
+        points = np.array(
+            [(p.location.latitude, p.location.longitude) for p in places],
+            dtype=np.float64,
+        )
+        return haversine_array(
+            points[:, 0, None],
+            points[:, 1, None],
+            points[None, :, 0],
+            points[None, :, 1],
+        )
+
+    ##### Day grouping #####
+
+    @staticmethod
+    def _open_days(dates: List[_date], places: List[Place]) -> np.ndarray:
+        """Build a (places, days) mask of opening days.
+        Args:
+            dates (List[date]): Trip days.
+            places (List[Place]): Places (no hours: always open).
+        Returns:
+            np.ndarray: True where the place is open on the day.\\
+                        Places closed on every trip day count as open on all of them.
+        """
+        weekdays = [(date.weekday() + 1) % 7 for date in dates]  # Sunday is day 0
+        mask = np.ones((len(places), len(dates)), dtype=bool)
+        for idx, place in enumerate(places):
+            if place.hours is None:
+                continue
+            days = {row.day % 7 for row in place.hours.regular}
+            row = np.array([weekday in days for weekday in weekdays])
+            mask[idx] = row if row.any() else True
+        return mask
+
+    @classmethod
+    def _cluster(cls, distances: np.ndarray, k: int) -> np.ndarray:
+        """Split places into `k` groups of near-equal size (balanced k-medoids).
+        Args:
+            distances (np.ndarray): (N, N) distance matrix.
+            k (int): Number of groups (1 <= k <= N).
+        Returns:
+            np.ndarray: Group label per place.
+        """
+        n = len(distances)
+        capacity = math.ceil(n / k)
+
+        # Seed with spread-out places: the most remote, then farthest-first
+        medoids = [int(np.argmax(distances.sum(axis=1)))]
+        while len(medoids) < k:
+            gaps = distances[:, medoids].min(axis=1)
+            gaps[medoids] = -1  # Never reseed a medoid (places may share coordinates)
+            medoids.append(int(np.argmax(gaps)))
+
+        labels = np.zeros(n, dtype=np.intp)
+        for _ in range(cls.MAX_ITERATIONS):
+            # Assign places with the most to lose first, to their nearest open group
+            costs = distances[:, medoids]
+            ordered = np.sort(costs, axis=1)
+            regret = ordered[:, 1] - ordered[:, 0] if k > 1 else ordered[:, 0]
+            labels[medoids] = np.arange(k)  # Medoids anchor their group
+            sizes = np.ones(k, dtype=np.intp)
+            for idx in np.argsort(-regret, kind="stable"):
+                if idx in medoids:
+                    continue
+                for group in np.argsort(costs[idx], kind="stable"):
+                    if sizes[group] < capacity:
+                        labels[idx], sizes[group] = group, sizes[group] + 1
+                        break
+
+            # Move each medoid to the member closest to the rest of its group
+            updated = []
+            for group in range(k):
+                members = np.flatnonzero(labels == group)
+                if not len(members):  # Keep the medoid of an empty group
+                    updated.append(medoids[group])
+                    continue
+                within = distances[np.ix_(members, members)].sum(axis=1)
+                updated.append(int(members[np.argmin(within)]))
+            if updated == medoids:
+                break
+            medoids = updated
+        return labels
+
+    @staticmethod
+    def _match_days(labels: np.ndarray, k: int, open_days: np.ndarray) -> np.ndarray:
+        """Map groups to days, fewest closed places first (greedy matching).
+        Returns:
+            np.ndarray: Day index per group.
+        """
+        day_count = open_days.shape[1]
+        closed = np.array([(~open_days[labels == g]).sum(axis=0) for g in range(k)])
+
+        mapping = np.full(k, -1, dtype=np.intp)
+        free_days = np.ones(day_count, dtype=bool)
+        # Ties keep input order: group g goes to day g when nothing is closed
+        for flat in np.argsort(closed, axis=None, kind="stable"):
+            group, day = divmod(int(flat), day_count)
+            if mapping[group] < 0 and free_days[day]:
+                mapping[group], free_days[day] = day, False
+        return mapping
+
+    @staticmethod
+    def _repair_closed(
+        days: np.ndarray,
+        distances: np.ndarray,
+        open_days: np.ndarray,
+    ) -> np.ndarray:
+        """Move places closed on their day to the nearest day they are open."""
+        days = days.copy()
+        for idx in np.flatnonzero(~open_days[np.arange(len(days)), days]):
+            best, best_cost = days[idx], math.inf
+            for day in np.flatnonzero(open_days[idx]):
+                members = np.flatnonzero(days == day)
+                cost = distances[idx, members].min() if len(members) else 0.0
+                if cost < best_cost:
+                    best, best_cost = day, cost
+            days[idx] = best
+        return days
+
+    ##### Day routes #####
+
+    @staticmethod
+    def _route(distances: np.ndarray) -> List[int]:
+        """Order a day's places as an open short-hop path (nearest neighbour + 2-opt).
+        Args:
+            distances (np.ndarray): (M, M) distance matrix of the day's places.
+        Returns:
+            List[int]: Visit order (indices into the matrix).
+        """
+        m = len(distances)
+        if m <= 2:
+            return list(range(m))
+
+        # Nearest neighbour from the most remote place (an end of the route)
+        route = [int(np.argmax(distances.sum(axis=1)))]
+        unvisited = np.ones(m, dtype=bool)
+        unvisited[route[0]] = False
+        while unvisited.any():
+            hops = np.where(unvisited, distances[route[-1]], np.inf)
+            route.append(int(np.argmin(hops)))
+            unvisited[route[-1]] = False
+
+        # 2-opt: reverse route[i + 1 : j + 1] while it shortens the path
+        path = np.array(route)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(-1, m - 2):
+                j = np.arange(i + 2, m)
+                nxt = np.minimum(j + 1, m - 1)
+                has_next = j + 1 < m
+                old = np.where(has_next, distances[path[j], path[nxt]], 0.0)
+                new = np.where(has_next, distances[path[i + 1], path[nxt]], 0.0)
+                if i >= 0:  # Edge into the reversed section
+                    old = old + distances[path[i], path[i + 1]]
+                    new = new + distances[path[i], path[j]]
+                gains = old - new
+                best = int(np.argmax(gains))
+                if gains[best] > 1e-9:
+                    path[i + 1 : j[best] + 1] = path[i + 1 : j[best] + 1][::-1]
+                    improved = True
+        return path.tolist()
+
+
 class ModelAssigner:
     MAX_RETRIES = 2
     RESPONSE_SCHEMA = {
@@ -43,38 +264,59 @@ class ModelAssigner:
         },
     }
 
-    def __init__(self, client: Optional[ModelClient] = None):
+    def __init__(
+        self,
+        client: Optional[ModelClient] = None,
+        prompt_format: Optional[PromptFormat] = None,
+    ):
         self._client = client or ModelClient()
+        self.prompt_format = prompt_format or settings.ITINERARY_PROMPT
 
     async def assign(
         self,
         dates: List[_date],
         places: List[Place],
     ) -> List[List[PlaceId]]:
-        payload = self._build_payload(dates, places)
+        payload = self._build_payload(
+            dates, places, compact=self.prompt_format == "compact"
+        )
         expected_days = len(dates)
         expected_places = len(places)
 
-        # Generate with retries
+        # Generate with retries (only unparseable responses are retried)
         for attempt in range(self.MAX_RETRIES + 1):
             response = await self._client.generate(payload)
             try:
                 assignments = self._parse_assignments(response.text, places)
-                self._validate_assignments(assignments, expected_days, expected_places)
-                return assignments
             except RuntimeError:
                 if attempt == self.MAX_RETRIES:
                     raise
+                continue
+
+            # Fix near misses (duplicates, missing places, day count) locally
+            assignments = self._repair_assignments(assignments, dates, places)
+            self._validate_assignments(assignments, expected_days, expected_places)
+            return assignments
 
     ##### Request/response handling ######
 
     @staticmethod
-    def _build_payload(dates: List[_date], places: List[Place]) -> ModelRequest:
+    def _build_payload(
+        dates: List[_date],
+        places: List[Place],
+        compact: bool = False,
+    ) -> ModelRequest:
         """Construct model request payload with dates and places."""
+        if compact:
+            instruction = ItineraryPrompt.compact_instruction()
+            body = ItineraryPrompt.compact_body(dates, places)
+        else:
+            instruction = ItineraryPrompt.instruction()
+            body = ItineraryPrompt.body(dates, places)
         return ModelRequest(
             messages=[
-                ModelMessage(role="system", content=ItineraryPrompt.instruction()),
-                ModelMessage(role="user", content=ItineraryPrompt.body(dates, places)),
+                ModelMessage(role="system", content=instruction),
+                ModelMessage(role="user", content=body),
             ],
             response_type=ModelAssigner.RESPONSE_SCHEMA,
         )
@@ -103,6 +345,72 @@ class ModelAssigner:
         if len(set(flat)) != expected_places:
             raise RuntimeError("Duplicate place assignment")
 
+    @staticmethod
+    def _repair_assignments(
+        assignments: List[List[PlaceId]],
+        dates: List[_date],
+        places: List[Place],
+    ) -> List[List[PlaceId]]:
+        """Deterministically fix a near-miss assignment instead of re-prompting.
+        Args:
+            assignments (List[List[PlaceId]]): Parsed assignments (may be invalid).
+            dates (List[date]): Trip days (one list of places per day).
+            places (List[Place]): All places to assign.
+        Returns:
+            List[List[PlaceId]]: Assignments with each place exactly once over\\
+                                 the trip days. Valid input is returned as is.\\
+                                 Missing places only go to days they are open.
+        """
+        expected_days = len(dates)
+        index = {place.id: idx for idx, place in enumerate(places)}
+        distances = None  # Built on first use (valid outputs never need it)
+
+        def nearest(targets: List[int], day_indices: List[List[int]]) -> int:
+            # Day holding the place closest to any of the targets
+            nonlocal distances
+            if distances is None:
+                distances = HeuristicAssigner._distances(places)
+            gaps = [
+                distances[np.ix_(targets, day)].min() if day else np.inf
+                for day in day_indices
+            ]
+            return int(np.argmin(gaps))
+
+        # Drop duplicates (first occurrence wins)
+        seen: set[int] = set()
+        days: List[List[int]] = []
+        for day in assignments:
+            days.append([])
+            for pid in day:
+                if index[pid] not in seen:
+                    seen.add(index[pid])
+                    days[-1].append(index[pid])
+
+        # Too many days: merge the smallest day into its nearest neighbour
+        while len(days) > expected_days:
+            smallest = min(range(len(days)), key=lambda idx: len(days[idx]))
+            merged = days.pop(smallest)
+            if merged and days:
+                days[nearest(merged, days)].extend(merged)
+
+        # Too few days: pad with empty days
+        days.extend([] for _ in range(expected_days - len(days)))
+
+        # Missing places: fill empty open days first, else next to the nearest place
+        missing = [idx for idx in range(len(places)) if idx not in seen]
+        open_days = HeuristicAssigner._open_days(dates, places) if missing else None
+        for idx in missing:
+            candidates = [day for day, is_open in zip(days, open_days[idx]) if is_open]
+            empty = next((day for day in candidates if not day), None)
+            if empty is not None:
+                empty.append(idx)
+                continue
+            day = candidates[nearest([idx], candidates)]
+            closest = int(np.argmin(distances[idx, day]))
+            day.insert(closest + 1, idx)
+
+        return [[places[idx].id for idx in day] for day in days]
+
     ##### Helpers #####
 
     @staticmethod
@@ -134,3 +442,34 @@ class ModelAssigner:
             raise RuntimeError("Model response JSON is not an object")
 
         return data
+
+
+class HybridAssigner(ModelAssigner):
+    """Model groups places into days (short prompt); each day is ordered locally."""
+
+    async def assign(
+        self,
+        dates: List[_date],
+        places: List[Place],
+    ) -> List[List[PlaceId]]:
+        assignments = await super().assign(dates, places)
+        return HeuristicAssigner.order(assignments, places)
+
+    @staticmethod
+    def _build_payload(
+        dates: List[_date],
+        places: List[Place],
+        compact: bool = False,
+    ) -> ModelRequest:
+        """Construct a grouping-only request (no route ordering instructions)."""
+        instruction = ItineraryPrompt.grouping_instruction()
+        if compact:
+            instruction += f"\n{ItineraryPrompt.COMPACT_LEGEND}"
+        body = ItineraryPrompt.grouping_body(dates, places, compact=compact)
+        return ModelRequest(
+            messages=[
+                ModelMessage(role="system", content=instruction),
+                ModelMessage(role="user", content=body),
+            ],
+            response_type=ModelAssigner.RESPONSE_SCHEMA,
+        )
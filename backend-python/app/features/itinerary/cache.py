@@ -0,0 +1,108 @@
+import hashlib
+from typing import List, Optional
+from datetime import date as _date
+from pydantic import TypeAdapter
+
+from app.core.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    MongoCacheBackend,
+    TieredCache,
+)
+from app.core.common import AssignerStrategy, PlaceId
+from app.core.config import settings
+
+from ..places import Place
+
+
+# Cached plans hold indices into the sorted place IDs (independent of request order)
+type CachedPlan = List[List[int]]
+
+MODEL_NAMES = {  # Model settings by provider (plans differ across models)
+    "openai": "OPENAI_MODEL",
+    "gemini": "GEMINI_MODEL",
+}
+
+PLAN_ADAPTER: TypeAdapter[CachedPlan] = TypeAdapter(CachedPlan)
+
+
+class PlanCache(TieredCache[CachedPlan]):
+    @classmethod
+    def from_settings(cls) -> "PlanCache":
+        backends: List[CacheBackend[CachedPlan]] = []
+        if settings.ITINERARY_CACHE_ENABLED:
+            backends.append(
+                MemoryCacheBackend(
+                    "itinerary.plans",
+                    ttl=settings.ITINERARY_CACHE_TTL,
+                    max_size=settings.ITINERARY_CACHE_MAX_SIZE,
+                )
+            )
+            if settings.ITINERARY_CACHE_BACKEND == "mongo":
+                backends.append(
+                    MongoCacheBackend(
+                        PLAN_ADAPTER,
+                        ttl=settings.ITINERARY_CACHE_TTL,
+                        collection="plan_cache",
+                        field="plan",
+                    )
+                )
+        return cls(backends=backends)
+
+    @staticmethod
+    def key(
+        strategy: AssignerStrategy,
+        dates: List[_date],
+        place_ids: List[PlaceId],
+    ) -> str:
+        """Build a key from everything the assigners depend on.
+        Args:
+            strategy (AssignerStrategy): Assigner used for the plan.
+            dates (List[date]): Assignable dates (only their weekdays matter).
+            place_ids (List[PlaceId]): Place IDs, in any order.
+        Returns:
+            str: e.g. "model:full:openai:gpt-4o-mini:456:<sha1 of the sorted IDs>".\\
+                 Changing the prompt format or model starts a fresh keyspace.
+        """
+        provider = settings.MODEL_PROVIDER
+        model = getattr(settings, MODEL_NAMES.get(provider, ""), "")
+        weekdays = "".join(str((date.weekday() + 1) % 7) for date in dates)
+        digest = hashlib.sha1(",".join(sorted(map(str, place_ids))).encode())
+        return (
+            f"{strategy}:{settings.ITINERARY_PROMPT}:{provider}:{model}:"
+            f"{weekdays}:{digest.hexdigest()}"
+        )
+
+    async def lookup(
+        self,
+        strategy: AssignerStrategy,
+        dates: List[_date],
+        places: List[Place],
+    ) -> Optional[List[List[PlaceId]]]:
+        """
+        Get a cached plan mapped onto the request's places (None on a miss).
+        """
+        if not self.enabled:
+            return None
+        ordered = sorted(places, key=lambda place: str(place.id))
+        cached = await self.get(self.key(strategy, dates, [p.id for p in ordered]))
+        if cached is None:
+            return None
+        return [[ordered[idx].id for idx in day] for day in cached]
+
+    async def store(
+        self,
+        strategy: AssignerStrategy,
+        dates: List[_date],
+        places: List[Place],
+        assignments: List[List[PlaceId]],
+    ) -> None:
+        if not self.enabled:
+            return
+        ordered = sorted(str(place.id) for place in places)
+        index = {pid: idx for idx, pid in enumerate(ordered)}
+        plan = [[index[str(pid)] for pid in day] for day in assignments]
+        await self.set(self.key(strategy, dates, ordered), plan)
+
+
+plan_cache = PlanCache.from_settings()
@@ -1,11 +1,27 @@
+import json
 from datetime import date as _date
 
+from app.utils.cache import memoize
+
 from ..places import Place
 from ..places.schemas import Hours
 
 
+# Place fragments are keyed by place ID: edits show up after the TTL
+PLACE_CACHE_SIZE, PLACE_CACHE_TTL = 2048, 3600  # Unit: seconds
+
+# Compact format: ~110 m coordinate precision is plenty for grouping and ordering
+COORDINATE_DECIMALS = 3
+
+
 class ItineraryPrompt:
     WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+    COMPACT_LEGEND = (
+        "Input: a DAYS line, then one JSON object per place:\n"
+        '{"i": index, "n": name, "c": category, "ll": [lat, lng], "o": open days}\n'
+        '"o" has one character per weekday from Sunday to Saturday: '
+        'the weekday letter when open, "-" when closed (e.g. "-MTWTF-").'
+    )
 
     @classmethod
     def instruction(cls) -> str:
@@ -31,6 +47,79 @@ class ItineraryPrompt:
             f"{cls.rules(len(dates))}"
         )
 
+    ##### Compact format (static instruction, JSON-lines places) #####
+
+    @classmethod
+    def compact_instruction(cls) -> str:
+        # Identical for every request, so providers can cache the prompt prefix
+        return (
+            "You are an itinerary optimizer. Assign place indices to trip days.\n"
+            f"{cls.COMPACT_LEGEND}\n"
+            "Rules, in priority order:\n"
+            "1. Use every place index exactly once, with exactly one list per day.\n"
+            "2. Assign places to days when they are open.\n"
+            "3. Group nearby places on the same day and order each day as a short route "
+            "without backtracking. Index order means nothing.\n"
+            "4. Balance day workloads and avoid empty days when possible.\n"
+            'Output only JSON: {"assignments": list[list[int]]}. No markdown or prose.'
+        )
+
+    @classmethod
+    def compact_body(cls, dates: list[_date], places: list[Place]) -> str:
+        return f"{cls.compact_dates(dates)}\n{cls.compact_places(places)}"
+
+    @classmethod
+    def compact_dates(cls, dates: list[_date]) -> str:
+        # e.g., DAYS (2): 1=Thu 2=Fri
+        days = " ".join(
+            f"{idx}={date.strftime('%a')}" for idx, date in enumerate(dates, start=1)
+        )
+        return f"DAYS ({len(dates)}): {days}"
+
+    @classmethod
+    def compact_places(cls, places: list[Place]) -> str:
+        # e.g., {"i":0,"n":"The Peak","c":"landmarks","ll":[22.276,114.146],"o":"SMTWTFS"}
+        return "\n".join(
+            f'{{"i":{idx},{cls._compact_place(place)}'
+            for idx, place in enumerate(places)
+        )
+
+    ##### Grouping only (hybrid: days are ordered locally) #####
+
+    @classmethod
+    def grouping_instruction(cls) -> str:
+        return (
+            "You are an itinerary planner.\n"
+            "Group place indices into trip days. Order within a day does not matter.\n"
+            'Output only JSON: {"assignments": list[list[int]]}.\n'
+            "Do not return markdown, prose, or explanations."
+        )
+
+    @classmethod
+    def grouping_body(
+        cls, dates: list[_date], places: list[Place], compact: bool = False
+    ) -> str:
+        if compact:
+            return (
+                f"{cls.compact_body(dates, places)}\n\n{cls.grouping_rules(len(dates))}"
+            )
+        return (
+            f"{cls.dates(dates)}\n\n"
+            f"{cls.places(places)}\n\n"
+            f"{cls.grouping_rules(len(dates))}"
+        )
+
+    @classmethod
+    def grouping_rules(cls, day_count: int) -> str:
+        return (
+            "# Rules\n"
+            f"- Outer list length must equal {day_count}\n"
+            "- Use each place index exactly once\n"
+            "- Put geographically close places on the same day\n"
+            "- Prefer days when places are open\n"
+            "- Balance day workloads; avoid empty days when feasible"
+        )
+
     ##### Partial components #####
 
     @classmethod
@@ -97,12 +186,7 @@ class ItineraryPrompt:
     def places(cls, places: list[Place]) -> str:
         prompt = "# Places\n"
         for idx, place in enumerate(places):
-            prompt += (
-                f"- Place #{idx}: {place.name}\n"
-                f"  - Category: {place.category.value}\n"
-                f"  - Location: ({place.location.latitude},{place.location.longitude})\n"
-                f"  - Business hours: {cls._hours(place.hours) if place.hours else 'Open 24 hours\n'}"
-            )
+            prompt += f"- Place #{idx}: {cls._place(place)}"
         return prompt
 
     @classmethod
@@ -126,6 +210,21 @@ class ItineraryPrompt:
 
     ###### Helpers ######
 
+    @classmethod
+    @memoize(
+        "itinerary.prompt.places",
+        max_size=PLACE_CACHE_SIZE,
+        ttl=PLACE_CACHE_TTL,
+        key=lambda cls, place: place.id,
+    )
+    def _place(cls, place: Place) -> str:
+        return (
+            f"{place.name}\n"
+            f"  - Category: {place.category.value}\n"
+            f"  - Location: ({place.location.latitude},{place.location.longitude})\n"
+            f"  - Business hours: {cls._hours(place.hours) if place.hours else 'Open 24 hours\n'}"
+        )
+
     @classmethod
     def _hours(cls, hours: Hours) -> str:
         # Simplify hours objects to format: [["Sun", "Closed"], ["Mon", "09:00 - 17:00"]]
@@ -139,3 +238,33 @@ class ItineraryPrompt:
         for entry in hours_map:
             prompt += f"    - {entry[0]}: {entry[1]}\n"
         return prompt
+
+    @classmethod
+    @memoize(
+        "itinerary.prompt.compact_places",
+        max_size=PLACE_CACHE_SIZE,
+        ttl=PLACE_CACHE_TTL,
+        key=lambda cls, place: place.id,
+    )
+    def _compact_place(cls, place: Place) -> str:
+        # JSON object without its opening brace (the index goes first)
+        fields = {
+            "n": place.name,
+            "c": place.category.value,
+            "ll": [
+                round(place.location.latitude, COORDINATE_DECIMALS),
+                round(place.location.longitude, COORDINATE_DECIMALS),
+            ],
+            "o": cls._open_days(place.hours),
+        }
+        return json.dumps(fields, ensure_ascii=False, separators=(",", ":"))[1:]
+
+    @classmethod
+    def _open_days(cls, hours: Hours | None) -> str:
+        # One character per weekday from Sunday: letter if open, "-" if closed
+        if hours is None:
+            return "".join(day[0] for day in cls.WEEKDAYS)
+        open_days = {row.day % 7 for row in hours.regular}
+        return "".join(
+            day[0] if idx in open_days else "-" for idx, day in enumerate(cls.WEEKDAYS)
+        )
@@ -26,6 +26,8 @@ async def plan_itinerary(
             dates=dates,
             places=places,
             skip_past_dates=True,
+            assigner=body.assigner,
+            use_cache=body.use_cache,
         )
         return ItineraryResponse(plan=plan)
     except Exception as e:
@@ -1,8 +1,8 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, field_validator
 from datetime import datetime, date as _date
 
-from app.core.common import PlaceId
+from app.core.common import AssignerStrategy, PlaceId
 
 
 class DayPlan(BaseModel):
@@ -18,6 +18,8 @@ class ItineraryRequest(BaseModel):
     start_date: _date
     duration: int
     places: List[PlaceId]
+    assigner: Optional[AssignerStrategy] = None  # Default: ITINERARY_ASSIGNER
+    use_cache: bool = True  # False: plan afresh (the new plan is still cached)
 
     @field_validator("start_date", mode="before")
     @classmethod
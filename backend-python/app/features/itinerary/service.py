@@ -1,8 +1,12 @@
-from typing import List
+from typing import List, Optional
 from datetime import date as _date
 
+from app.core.common import AssignerStrategy, PlaceId
+from app.core.config import settings
+
 from ..places import Place
-from .assigner import ModelAssigner
+from .assigner import HeuristicAssigner, HybridAssigner, ModelAssigner
+from .cache import plan_cache
 from .schemas import DayPlan
 
 
@@ -13,12 +17,18 @@ class ItineraryService:
         dates: List[_date],
         places: List[Place],
         skip_past_dates: bool = True,
+        assigner: Optional[AssignerStrategy] = None,
+        use_cache: bool = True,
     ) -> List[DayPlan]:
         """Plan an itinerary by distributing places across the provided dates.
         Args:
             dates (List[date]): List of dates for the trip.
             places (List[Place]): List of places to visit.
             skip_past_dates (bool): If True, places will not be assigned to dates in the past.
+            assigner (Optional[AssignerStrategy]): "model" (LLM), "heuristic" (local solver)\\
+                                                   or "hybrid" (LLM groups, local ordering).\\
+                                                   Defaults to the ITINERARY_ASSIGNER setting.
+            use_cache (bool): If False, skip the plan cache lookup (the new plan is still stored).
         Returns:
             List[DayPlan]: A list of daily plans with assigned places.
         """
@@ -35,11 +45,18 @@ class ItineraryService:
         # Identify days available for assignment
         assignable_dates = cls._exclude_past_dates(dates) if skip_past_dates else dates
 
-        # Assign with LLM
-        assignments = await ModelAssigner().assign(
-            dates=assignable_dates,
-            places=places,
-        )
+        # Reuse a cached plan (the local solver is faster than a lookup)
+        strategy = assigner or settings.ITINERARY_ASSIGNER
+        cacheable = strategy != "heuristic"
+        assignments = None
+        if cacheable and use_cache:
+            assignments = await plan_cache.lookup(strategy, assignable_dates, places)
+
+        # Assign with the local solver or the LLM
+        if assignments is None:
+            assignments = await cls._assign(strategy, assignable_dates, places)
+            if cacheable:
+                await plan_cache.store(strategy, assignable_dates, places, assignments)
 
         for date, assignment in zip(assignable_dates, assignments):
             # Populate places to the mapped plan
@@ -51,6 +68,17 @@ class ItineraryService:
 
     ##### Helpers ######
 
+    @staticmethod
+    async def _assign(
+        strategy: AssignerStrategy,
+        dates: List[_date],
+        places: List[Place],
+    ) -> List[List[PlaceId]]:
+        if strategy == "heuristic":
+            return HeuristicAssigner.assign(dates=dates, places=places)
+        assigner = HybridAssigner() if strategy == "hybrid" else ModelAssigner()
+        return await assigner.assign(dates=dates, places=places)
+
     @staticmethod
     def _exclude_past_dates(dates: List[_date], nonempty: bool = True) -> List[_date]:
         """Filter non-past dates.
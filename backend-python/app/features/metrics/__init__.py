@@ -0,0 +1,3 @@
+from .router import metrics_router
+
+__all__ = ["metrics_router"]
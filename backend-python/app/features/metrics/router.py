@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+
+from app.core.exceptions import error_models
+from app.integrations.routes import routes_caller, routes_pool
+from app.utils.cache import cache_stats
+
+from .schemas import MetricsResponse, RoutesCallMetrics, RoutesClientMetrics
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get(
+    "",
+    operation_id="get_metrics",
+    responses=error_models([500]),
+)
+async def get_metrics() -> MetricsResponse:
+    pool = routes_pool.stats()
+    return MetricsResponse(
+        caches=cache_stats(),
+        routes_client=RoutesClientMetrics(
+            pool_size=pool.pool_size,
+            channels_created=pool.channels_created,
+            requests=pool.requests,
+            requests_per_channel=pool.requests_per_channel,
+            reuse_rate=pool.reuse_rate,
+        ),
+        routes_calls=RoutesCallMetrics(**routes_caller.stats()),
+    )
@@ -0,0 +1,38 @@
+from typing import Dict, List
+from pydantic import BaseModel
+
+
+class CacheStats(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int  # Dropped to stay within max_size
+    expirations: int  # Dropped after their TTL
+    hit_rate: float  # hits / (hits + misses)
+
+
+class RoutesClientMetrics(BaseModel):
+    pool_size: int
+    channels_created: int
+    requests: int
+    requests_per_channel: List[int]
+    reuse_rate: float  # Share of requests served by an already-open channel
+
+
+class RoutesCallMetrics(BaseModel):
+    success: int = 0
+    failure: int = 0  # Gave up (non-retryable error or retries exhausted)
+    retry: int = 0
+    timeout: int = 0  # Attempts past the per-call deadline
+    hedged: int = 0  # Duplicate requests sent for slow calls
+    hedge_won: int = 0  # Duplicates that finished first
+
+
+##### Public Schemas #####
+
+
+class MetricsResponse(BaseModel):
+    caches: Dict[str, CacheStats]
+    routes_client: RoutesClientMetrics
+    routes_calls: RoutesCallMetrics
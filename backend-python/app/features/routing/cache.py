@@ -0,0 +1,85 @@
+from datetime import datetime
+from typing import List
+from pydantic import TypeAdapter
+
+from app.core.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    MongoCacheBackend,
+    TieredCache,
+)
+from app.core.common import PlaceId
+from app.core.config import settings
+
+from .schemas import Route, TravelMode
+
+
+ROUTE_ADAPTER: TypeAdapter[Route] = TypeAdapter(Route)
+
+
+##### Backends #####
+
+
+type LegCacheBackend = CacheBackend[Route]
+
+
+class MemoryLegCacheBackend(MemoryCacheBackend[Route]):
+    def __init__(self, ttl: int, max_size: int):
+        super().__init__("routes.legs", ttl=ttl, max_size=max_size)
+
+
+class MongoLegCacheBackend(MongoCacheBackend[Route]):
+    def __init__(self, ttl: int, collection: str = "route_cache"):
+        super().__init__(ROUTE_ADAPTER, ttl=ttl, collection=collection, field="route")
+
+
+##### Leg Cache #####
+
+
+class LegCache(TieredCache[Route]):
+    def __init__(self, backends: List[LegCacheBackend], bucket_minutes: int = 60):
+        super().__init__(backends)
+        self.bucket_minutes = max(1, bucket_minutes)
+
+    @classmethod
+    def from_settings(cls) -> "LegCache":
+        backends: List[LegCacheBackend] = []
+        if settings.ROUTES_CACHE_ENABLED:
+            backends.append(
+                MemoryLegCacheBackend(
+                    ttl=settings.ROUTES_CACHE_TTL,
+                    max_size=settings.ROUTES_CACHE_MAX_SIZE,
+                )
+            )
+            if settings.ROUTES_CACHE_BACKEND == "mongo":
+                backends.append(MongoLegCacheBackend(ttl=settings.ROUTES_CACHE_TTL))
+        return cls(
+            backends=backends, bucket_minutes=settings.ROUTES_CACHE_BUCKET_MINUTES
+        )
+
+    def bucket(self, mode: TravelMode, departure: datetime) -> str:
+        """Quantize a departure time into a cache bucket.
+        Args:
+            mode (TravelMode): Travel mode of the leg.
+            departure (datetime): Departure time of the leg.
+        Returns:
+            str: Bucket label. TRANSIT buckets are date-specific (timetables vary by date),\\
+                 DRIVE/WALK buckets repeat weekly (traffic follows a weekly pattern).
+        """
+        local = departure.astimezone(settings.TIMEZONE)
+        slot = (local.hour * 60 + local.minute) // self.bucket_minutes
+        if mode == TravelMode.TRANSIT:
+            return f"{local.date().isoformat()}/{slot}"
+        return f"w{local.isoweekday()}/{slot}"
+
+    def key(
+        self,
+        origin: PlaceId,
+        destination: PlaceId,
+        mode: TravelMode,
+        departure: datetime,
+    ) -> str:
+        return f"{origin}:{destination}:{mode.value}:{self.bucket(mode, departure)}"
+
+
+leg_cache = LegCache.from_settings()
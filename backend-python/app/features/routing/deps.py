@@ -1,16 +1,25 @@
 from typing import List
 from fastapi import HTTPException
 
+from app.core.common import PlaceId
 from app.core.exceptions import ErrorCode, ErrorModel
 
 from ..places import Place, PlaceService, PlaceNotFoundError, PlaceRegionError
-from .schemas import RoutesRequest
+from .schemas import MatrixRequest, RoutesRequest
 
 
 async def places_dep(body: RoutesRequest) -> List[Place]:
+    return await _get_validated_places(body.places)
+
+
+async def matrix_places_dep(body: MatrixRequest) -> List[Place]:
+    return await _get_validated_places(body.places)
+
+
+async def _get_validated_places(ids: List[PlaceId]) -> List[Place]:
     try:
         return await PlaceService.get_validated(
-            body.places,
+            ids,
             same_region=True,
         )
     except PlaceNotFoundError as e:
@@ -1,31 +1,136 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
-from app.core.exceptions import ErrorCode, error_models
+from app.core.exceptions import ErrorCode, ErrorModel, error_models
+from app.utils.geometry import simplify_polyline
 
 from ..places import Place
-from .deps import places_dep
-from .schemas import RoutesRequest, RoutesResponse, TravelMode
+from .deps import matrix_places_dep, places_dep
+from .schemas import (
+    MatrixRequest,
+    MatrixResponse,
+    Route,
+    RouteEvent,
+    RoutesRequest,
+    RoutesResponse,
+    TravelMode,
+)
 from .service import RouteService
 
 routing_router = APIRouter()
 
+STREAM_MEDIA_TYPES = ("application/x-ndjson", "text/event-stream")
+JSON_MEDIA_RANGES = ("application/json", "application/*", "*/*")
+
+
+def _negotiate_stream(request: Request) -> str | None:
+    """Pick a streaming media type from the Accept header, if the client prefers one.
+    Args:
+        request (Request): Incoming request.
+    Returns:
+        str | None: Streaming media type, or None for a plain JSON response.\\
+                    Media ranges are tried by q-value (then order); q=0 excludes.
+    """
+    ranges = []
+    for entry in request.headers.get("accept", "").split(","):
+        media_type, *params = (part.strip() for part in entry.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            ranges.append((media_type.lower(), quality))
+
+    for media_type, _ in sorted(ranges, key=lambda item: -item[1]):  # Stable
+        if media_type in STREAM_MEDIA_TYPES:
+            return media_type
+        if media_type in JSON_MEDIA_RANGES:
+            return None
+    return None
+
+
+def _format_event(event: str, payload: str, media_type: str) -> str:
+    """
+    Frame a JSON payload as an NDJSON line or a server-sent event.
+    """
+    if media_type == "text/event-stream":
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"{payload}\n"
+
+
+def _simplify_route(route: Route, tolerance: Optional[float]) -> Route:
+    """
+    Copy a route with a simplified polyline (computed and cached routes are shared).
+    """
+    if not tolerance:
+        return route
+    polyline = simplify_polyline(route.polyline, tolerance)
+    return route.model_copy(update={"polyline": polyline})
+
+
+async def _stream_routes(
+    events: AsyncIterator[RouteEvent],
+    media_type: str,
+    tolerance: Optional[float] = None,
+) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            event = RouteEvent(
+                leg=event.leg, route=_simplify_route(event.route, tolerance)
+            )
+            yield _format_event("route", event.model_dump_json(), media_type)
+    except Exception as e:  # Headers are sent already: report in-band
+        error = ErrorModel(
+            status=500,
+            code=ErrorCode.ROUTES_COMPUTE_FAILED,
+            message="Failed to compute routes",
+            details={"reason": str(e)},
+        )
+        yield _format_event("error", error.model_dump_json(), media_type)
+        return
+    if media_type == "text/event-stream":
+        yield _format_event("end", "{}", media_type)
+
 
 @routing_router.post(
     "/compute",
     operation_id="compute_routes",
-    responses=error_models([404, 422, 500]),
+    responses={
+        200: {"content": {t: {} for t in STREAM_MEDIA_TYPES}},
+        **error_models([404, 422, 500]),
+    },
 )
 async def compute_routes(
+    request: Request,
     body: RoutesRequest,
     places: list[Place] = Depends(places_dep),  # Prepare places
 ) -> RoutesResponse:
+    # Streaming mode: emit each route as soon as its segment finishes
+    if media_type := _negotiate_stream(request):
+        events = RouteService.compute_stream(
+            places=places,
+            date=body.date,
+            mode=body.mode or TravelMode.TRANSIT,  # Default to transit mode
+        )
+        return StreamingResponse(
+            _stream_routes(events, media_type, body.simplify),
+            media_type=media_type,
+        )
+
     try:
         routes = await RouteService.compute(
             places=places,
             date=body.date,
             mode=body.mode or TravelMode.TRANSIT,  # Default to transit mode
         )
-        return RoutesResponse(routes=routes)
+        return RoutesResponse(
+            routes=[_simplify_route(route, body.simplify) for route in routes]
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -35,3 +140,30 @@ async def compute_routes(
                 "details": {"reason": str(e)},
             },
         )
+
+
+@routing_router.post(
+    "/matrix",
+    operation_id="compute_route_matrix",
+    responses=error_models([404, 422, 500]),
+)
+async def compute_route_matrix(
+    body: MatrixRequest,
+    places: list[Place] = Depends(matrix_places_dep),  # Prepare places
+) -> MatrixResponse:
+    try:
+        matrix = await RouteService.compute_matrix(
+            places=places,
+            date=body.date,
+            mode=body.mode or TravelMode.TRANSIT,  # Default to transit mode
+        )
+        return MatrixResponse(places=[p.id for p in places], matrix=matrix)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "code": ErrorCode.ROUTES_MATRIX_FAILED,
+                "message": "Failed to compute route matrix",
+                "details": {"reason": str(e)},
+            },
+        )
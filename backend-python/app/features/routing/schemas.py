@@ -1,11 +1,14 @@
 from typing import List, Literal, Optional
 from enum import Enum
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime, date as _date, timedelta
 
 from app.core.common import PlaceId
 
 
+MATRIX_MAX_PLACES = 50
+
+
 class TravelMode(str, Enum):
     WALK = "walk"
     DRIVE = "drive"
@@ -47,10 +50,16 @@ class TransitRoute(RouteBase):
 type Route = WalkRoute | DriveRoute | TransitRoute
 
 
+class RouteMatrix(BaseModel):
+    # Row: origin index, column: destination index (None if no route exists)
+    durations: List[List[Optional[int]]]  # Unit: seconds
+    distances: List[List[Optional[int]]]  # Unit: meters
+
+
 ##### Public Schemas #####
 
 
-class RoutesRequest(BaseModel):
+class RoutesRequestBase(BaseModel):
     date: _date
     mode: Optional[TravelMode] = TravelMode.TRANSIT
     places: List[PlaceId]
@@ -80,5 +89,28 @@ class RoutesRequest(BaseModel):
         return v
 
 
+class RoutesRequest(RoutesRequestBase):
+    simplify: Optional[float] = Field(None, ge=0)  # Polyline tolerance (unit: meters)
+
+
 class RoutesResponse(BaseModel):
     routes: List[Route]
+
+
+class RouteEvent(BaseModel):
+    leg: int  # Index of the leg within the requested places (leg i: place i -> i + 1)
+    route: Route
+
+
+class MatrixRequest(RoutesRequestBase):
+    @field_validator("places")
+    @classmethod
+    def validate_places_count(cls, v):
+        if len(v) > MATRIX_MAX_PLACES:
+            raise ValueError(f"Places list cannot exceed {MATRIX_MAX_PLACES} items")
+        return v
+
+
+class MatrixResponse(BaseModel):
+    places: List[PlaceId]
+    matrix: RouteMatrix
@@ -1,16 +1,34 @@
-from typing import List
+import math
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from functools import partial
 from pydantic import BaseModel, Field
 from datetime import datetime, date as _date, time, timedelta
 
-from google.api_core.client_options import ClientOptions
 from google.maps import routing_v2
 from google.protobuf import timestamp_pb2
 
 from app.core.config import settings
-from app.integrations.fares import FARE_FIELDS, compute_fare
+from app.integrations.fares import (
+    FARE_FIELDS,
+    StepSummary,
+    compute_fares,
+    summarize_leg,
+)
+from app.integrations.routes import routes_caller, routes_pool
+from app.utils.concurrency import SingleFlight, gather_bounded, iterate_bounded
 
 from ..places import Place
-from .schemas import TravelMode, Vehicle, Route, DriveRoute, TransitRoute, WalkRoute
+from .cache import leg_cache
+from .schemas import (
+    TravelMode,
+    Vehicle,
+    Route,
+    RouteEvent,
+    RouteMatrix,
+    DriveRoute,
+    TransitRoute,
+    WalkRoute,
+)
 
 
 MODE_MAP = {
@@ -36,15 +54,55 @@ SERVICE_FIELDS = [
 ]
 FIELD_MASK = list(set().union(SERVICE_FIELDS, FARE_FIELDS))
 
+MATRIX_FIELD_MASK = [
+    "originIndex",
+    "destinationIndex",
+    "status",
+    "condition",
+    "distanceMeters",
+    "duration",
+]
+MATRIX_MAX_ELEMENTS = {  # Per request: origins x destinations
+    TravelMode.TRANSIT: 100,
+    TravelMode.WALK: 625,
+    TravelMode.DRIVE: 625,
+}
+
+# (origin index, destination index, duration, distance)
+type MatrixEntry = Tuple[int, int, int, int]
+
+MAX_INTERMEDIATES = {  # Per ComputeRoutes request
+    TravelMode.TRANSIT: 0,  # Intermediates are not supported for transit
+    TravelMode.WALK: 25,
+    TravelMode.DRIVE: 25,
+}
+
 
 class Segment(BaseModel):
     places: List[Place]
     mode: TravelMode = TravelMode.DRIVE  # Default: DRIVE
+    offset: int = 0  # Index of the first leg within the planned route
     departure: datetime = Field(
         default_factory=lambda: datetime.now(tz=settings.TIMEZONE)  # Default: now
     )
 
 
+class SegmentPlan(BaseModel):
+    places: List[Place]  # Places after removing zero-length legs
+    segments: List[Segment]
+    legs: List[int] = Field(default_factory=list)  # Requested leg index per planned leg
+
+    @property
+    def calls(self) -> int:
+        """Number of upstream Routes API calls needed (before caching)."""
+        return len(self.segments)
+
+
+# Coalesce identical in-flight computations (whole requests and upstream calls)
+route_flight: SingleFlight[List[Route]] = SingleFlight()
+segment_flight: SingleFlight[List[Route]] = SingleFlight()
+
+
 class RouteService:
     @staticmethod
     def linspace_datetime(
@@ -98,24 +156,62 @@ class RouteService:
             )
         )
 
+    @staticmethod
+    def dedupe_places(places: List[Place]) -> List[Place]:
+        """Drop consecutive places that would produce zero-length legs.
+        Args:
+            places (List[Place]): List of waypoint places.
+        Returns:
+            List[Place]: Places without consecutive repeats (same ID or same coordinates).
+        """
+        return [places[idx] for idx in RouteService._kept_indices(places)]
+
+    @staticmethod
+    def _kept_indices(places: List[Place]) -> List[int]:
+        # Index of the first place of each run of consecutive repeats
+        kept: List[int] = []
+        for idx, place in enumerate(places):
+            if kept and (
+                place.id == places[kept[-1]].id
+                or (place.location.latitude, place.location.longitude)
+                == (
+                    places[kept[-1]].location.latitude,
+                    places[kept[-1]].location.longitude,
+                )
+            ):
+                continue
+            kept.append(idx)
+        return kept
+
     @classmethod
-    def create_segments(
+    def plan_segments(
         cls,
         places: List[Place],
         date: _date,
         mode: TravelMode,
-    ) -> List[Segment]:
+    ) -> SegmentPlan:
+        """Pack places into as few Routes API requests as the travel mode allows.
+        Args:
+            places (List[Place]): List of waypoint places.
+            date (date): Date of travel.
+            mode (TravelMode): The selected travel mode.
+        Returns:
+            SegmentPlan: Deduplicated places, the segments covering their legs\\
+                         and the requested leg index of each remaining leg.
+        """
+        kept = cls._kept_indices(places)
+        # Planned leg k ends a run of repeats: it starts at the run's last place
+        legs = [end - 1 for end in kept[1:]]
+        places = [places[idx] for idx in kept]
         segments: List[Segment] = []
 
-        if mode == TravelMode.TRANSIT:  # No intermediates, 2 places per segment
-            chunk_size = 2
-        else:  # (DRIVE/WALK) Up to 10 places per segment
-            chunk_size = 10
+        # Origin + destination + intermediates, overlapping one place between segments
+        chunk_size = MAX_INTERMEDIATES[mode] + 2
 
         idx = 0
         while idx < len(places) - 1:
             place_chunk = places[idx : idx + chunk_size]  # Place slice
-            segments.append(Segment(places=place_chunk, mode=mode))
+            segments.append(Segment(places=place_chunk, mode=mode, offset=idx))
             idx += chunk_size - 1  # Overlap last place as first of next segment
 
         departure_times = cls.linspace_datetime(
@@ -134,13 +230,51 @@ class RouteService:
                     offset=timedelta(minutes=5),  # 5-minute buffer
                 )
 
-        return segments
+        return SegmentPlan(places=places, segments=segments, legs=legs)
+
+    @classmethod
+    def create_segments(
+        cls,
+        places: List[Place],
+        date: _date,
+        mode: TravelMode,
+    ) -> List[Segment]:
+        return cls.plan_segments(places=places, date=date, mode=mode).segments
+
+    @staticmethod
+    def routing_preference(
+        travel_mode: routing_v2.RouteTravelMode,
+    ) -> routing_v2.RoutingPreference:
+        return (
+            routing_v2.RoutingPreference.TRAFFIC_AWARE
+            if travel_mode == routing_v2.RouteTravelMode.DRIVE  # DRIVING: Traffic-aware
+            else routing_v2.RoutingPreference.ROUTING_PREFERENCE_UNSPECIFIED
+        )
+
+    @staticmethod
+    def create_matrix_chunks(count: int, mode: TravelMode) -> List[Tuple[range, range]]:
+        """Split an N x N matrix into blocks that fit the per-request element limit.
+        Args:
+            count (int): Number of places (N).
+            mode (TravelMode): The selected travel mode.
+        Returns:
+            List[Tuple[range, range]]: (origin indices, destination indices) per request.\\
+                                       Single-place diagonal blocks are skipped.
+        """
+        side = math.isqrt(MATRIX_MAX_ELEMENTS[mode])
+        blocks = [range(i, min(i + side, count)) for i in range(0, count, side)]
+        return [
+            (origins, destinations)
+            for origins in blocks
+            for destinations in blocks
+            if not (len(origins) == 1 and origins == destinations)
+        ]
 
     @staticmethod
-    def extract_vehicle(steps: List[routing_v2.RouteLegStep]) -> Vehicle | None:
+    def extract_vehicle(steps: Sequence[StepSummary]) -> Vehicle | None:
         # Extract unique vehicle types from transit steps
         vehicles = {
-            step.transit_details.transit_line.vehicle.type_
+            step.vehicle
             for step in steps
             if step.travel_mode == routing_v2.RouteTravelMode.TRANSIT
         }
@@ -153,6 +287,69 @@ class RouteService:
 
     @classmethod
     async def compute_segment(cls, segment: Segment) -> List[Route]:
+        """Compute routes for a segment, serving cached legs without network I/O.
+        Args:
+            segment (Segment): The segment to compute.
+        Returns:
+            List[Route]: Routes for each leg of the segment (empty if any leg has none).
+        Raises:
+            RuntimeError: If the Routes API request fails.
+        """
+        if not leg_cache.enabled:
+            return await cls.fetch_segment(segment)
+
+        # Look up cached legs
+        keys = [
+            leg_cache.key(origin.id, destination.id, segment.mode, segment.departure)
+            for origin, destination in zip(segment.places, segment.places[1:])
+        ]
+        cached = [await leg_cache.get(key) for key in keys]
+        missing = [idx for idx, route in enumerate(cached) if route is None]
+        if not missing:
+            return cached
+
+        # Request the narrowest span covering all uncached legs (still a single call)
+        first, last = missing[0], missing[-1]
+        span = segment.model_copy(update={"places": segment.places[first : last + 2]})
+        fetched = await cls.fetch_segment(span)
+
+        # Store fetched legs
+        for route in fetched:
+            key = leg_cache.key(
+                route.origin, route.destination, segment.mode, segment.departure
+            )
+            await leg_cache.set(key, route)
+
+        # All or nothing: joining cached legs across a gap would shift their positions
+        if len(fetched) != last - first + 1:
+            return []
+        return [*cached[:first], *fetched, *cached[last + 1 :]]
+
+    @staticmethod
+    def segment_key(segment: Segment) -> Tuple:
+        return (
+            tuple(place.id for place in segment.places),
+            segment.mode,
+            segment.departure,
+        )
+
+    @classmethod
+    async def fetch_segment(cls, segment: Segment) -> List[Route]:
+        """Request a segment, joining an identical request already in flight.
+        Args:
+            segment (Segment): The segment to request.
+        Returns:
+            List[Route]: Routes for each leg of the segment.
+        Raises:
+            RuntimeError: If the Routes API request fails.
+        """
+        routes = await segment_flight.do(
+            cls.segment_key(segment), partial(cls.request_segment, segment)
+        )
+        return list(routes)  # Callers own their list
+
+    @classmethod
+    async def request_segment(cls, segment: Segment) -> List[Route]:
         # ================================
         #  Prepare Request
         # ================================
@@ -167,30 +364,28 @@ class RouteService:
         departure_timestamp.FromDatetime(segment.departure)
 
         field_mask = ",".join(FIELD_MASK)
-        routing_preference = (
-            routing_v2.RoutingPreference.TRAFFIC_AWARE
-            if travel_mode == routing_v2.RouteTravelMode.DRIVE  # DRIVING: Traffic-aware
-            else routing_v2.RoutingPreference.ROUTING_PREFERENCE_UNSPECIFIED
-        )
+        routing_preference = cls.routing_preference(travel_mode)
 
         # ================================
         #  Make Request
         # ================================
 
+        request = routing_v2.ComputeRoutesRequest(
+            origin=origin,
+            destination=destination,
+            intermediates=intermediates,
+            travel_mode=travel_mode,
+            routing_preference=routing_preference,
+            departure_time=departure_timestamp,
+            compute_alternative_routes=False,
+        )
+
         try:
-            options = ClientOptions(api_key=settings.GOOGLE_MAPS_API_KEY)
-            client = routing_v2.RoutesAsyncClient(client_options=options)
-            response = await client.compute_routes(
-                request=routing_v2.ComputeRoutesRequest(
-                    origin=origin,
-                    destination=destination,
-                    intermediates=intermediates,
-                    travel_mode=travel_mode,
-                    routing_preference=routing_preference,
-                    departure_time=departure_timestamp,
-                    compute_alternative_routes=False,
-                ),
-                metadata=[("x-goog-fieldmask", field_mask)],
+            response = await routes_caller.call(
+                lambda: routes_pool.get_client().compute_routes(
+                    request=request,
+                    metadata=[("x-goog-fieldmask", field_mask)],
+                )
             )
         except Exception as e:
             raise RuntimeError(f"Routes API Error: {str(e)}")
@@ -204,40 +399,152 @@ class RouteService:
 
         results = []
 
-        for idx, leg in enumerate(response.routes[0].legs):
-            # Index bound check
-            if idx >= len(segment.places) - 1:
-                break
+        # Index bound check
+        legs = list(response.routes[0].legs)[: len(segment.places) - 1]
+
+        # Read each leg once (the response protos are left untouched)
+        summaries = [summarize_leg(leg) for leg in legs]
 
+        # Compute fares if applicable (all legs at once)
+        regions = [place.region for place in segment.places[: len(legs)]]
+        fares = compute_fares(regions, summaries)
+
+        for idx, leg in enumerate(summaries):
             base_args = {
                 "origin": segment.places[idx].id,
                 "destination": segment.places[idx + 1].id,
-                "distance": leg.distance_meters,
-                "duration": leg.duration.seconds,
-                "polyline": leg.polyline.encoded_polyline,
+                "distance": leg.distance,
+                "duration": leg.duration,
+                "polyline": leg.polyline,
             }
 
             mode = segment.mode
 
             # Override segment mode if all steps share the same travel mode
-            if len({step.travel_mode for step in leg.steps}) == 1:
-                mode = INVERSE_MODE_MAP.get(leg.steps[0].travel_mode, segment.mode)
-
-            # Compute fare if applicable
-            fare = compute_fare(segment.places[idx].region, leg)
+            if leg.mode is not None:
+                mode = INVERSE_MODE_MAP.get(leg.mode, segment.mode)
 
             # Extract vehicle type
-            vehicle = cls.extract_vehicle(list(leg.steps or []))
+            vehicle = cls.extract_vehicle(leg.steps)
 
             if mode == TravelMode.WALK:
                 results.append(WalkRoute(**base_args))
             elif mode == TravelMode.DRIVE:
-                results.append(DriveRoute(**base_args, fare=fare))
+                results.append(DriveRoute(**base_args, fare=fares[idx]))
             elif mode == TravelMode.TRANSIT:
-                results.append(TransitRoute(**base_args, fare=fare, vehicle=vehicle))
+                results.append(
+                    TransitRoute(**base_args, fare=fares[idx], vehicle=vehicle)
+                )
 
         return results
 
+    @classmethod
+    async def request_matrix_chunk(
+        cls,
+        places: List[Place],
+        origins: range,
+        destinations: range,
+        mode: TravelMode,
+        departure: datetime,
+    ) -> List[MatrixEntry]:
+        travel_mode = MODE_MAP.get(mode, routing_v2.RouteTravelMode.DRIVE)
+
+        departure_timestamp = timestamp_pb2.Timestamp()
+        departure_timestamp.FromDatetime(departure)
+
+        request = routing_v2.ComputeRouteMatrixRequest(
+            origins=[
+                routing_v2.RouteMatrixOrigin(
+                    waypoint=cls.place_to_waypoint(places[idx])
+                )
+                for idx in origins
+            ],
+            destinations=[
+                routing_v2.RouteMatrixDestination(
+                    waypoint=cls.place_to_waypoint(places[idx])
+                )
+                for idx in destinations
+            ],
+            travel_mode=travel_mode,
+            routing_preference=cls.routing_preference(travel_mode),
+            departure_time=departure_timestamp,
+        )
+
+        async def _call() -> List[routing_v2.RouteMatrixElement]:
+            stream = await routes_pool.get_client().compute_route_matrix(
+                request=request,
+                metadata=[("x-goog-fieldmask", ",".join(MATRIX_FIELD_MASK))],
+            )
+            return [element async for element in stream]
+
+        try:
+            elements = await routes_caller.call(_call)
+        except Exception as e:
+            raise RuntimeError(f"Routes API Error: {str(e)}")
+
+        # Map chunk-local indices back to the full matrix
+        return [
+            (
+                origins[element.origin_index],
+                destinations[element.destination_index],
+                element.duration.seconds,
+                element.distance_meters,
+            )
+            for element in elements
+            if element.status.code == 0  # OK
+            and element.condition == routing_v2.RouteMatrixElementCondition.ROUTE_EXISTS
+        ]
+
+    @classmethod
+    async def compute_matrix(
+        cls,
+        places: List[Place],
+        date: _date,
+        mode: TravelMode,
+    ) -> RouteMatrix:
+        """Compute an N x N duration/distance matrix between places.
+        Args:
+            places (List[Place]): List of places (used as both origins and destinations).
+            date (date): Date of travel.
+            mode (TravelMode): The selected travel mode.
+        Returns:
+            RouteMatrix: Durations and distances, indexed by [origin][destination].
+        Raises:
+            RuntimeError: If matrix computation fails.
+        """
+        count = len(places)
+        durations: List[List[Optional[int]]] = [[None] * count for _ in range(count)]
+        distances: List[List[Optional[int]]] = [[None] * count for _ in range(count)]
+        for idx in range(count):  # Staying put is free
+            durations[idx][idx] = distances[idx][idx] = 0
+
+        # Depart at 9:00 (DRIVE/WALK: shifted into the future like segments)
+        departure = datetime.combine(date, time(9, 0), tzinfo=settings.TIMEZONE)
+        if mode != TravelMode.TRANSIT:
+            departure = cls.shift_datetime_to_future(
+                dt=departure,
+                step=timedelta(days=7),  # Weekly increments
+                offset=timedelta(minutes=5),  # 5-minute buffer
+            )
+
+        # Request chunks concurrently
+        chunks = cls.create_matrix_chunks(count, mode)
+        results = await gather_bounded(
+            [
+                partial(cls.request_matrix_chunk, places, o, d, mode, departure)
+                for o, d in chunks
+            ],
+            limit=settings.ROUTES_MAX_CONCURRENCY,
+        )
+
+        for entries in results:
+            for origin, destination, duration, distance in entries:
+                if origin != destination:
+                    durations[origin][destination] = duration
+                    distances[origin][destination] = distance
+
+        return RouteMatrix(durations=durations, distances=distances)
+
     @classmethod
     async def compute(
         cls,
@@ -255,18 +562,67 @@ class RouteService:
         Raises:
             RuntimeError: If route computation fails.
         """
+        # Identical concurrent requests share one computation
+        key = (tuple(place.id for place in places), date, mode)
+        routes = await route_flight.do(
+            key, partial(cls.compute_routes, places, date, mode)
+        )
+        return list(routes)  # Callers own their list
+
+    @classmethod
+    async def compute_routes(
+        cls,
+        places: List[Place],
+        date: _date,
+        mode: TravelMode,
+    ) -> List[Route]:
         # Form route segments
         segments = cls.create_segments(places=places, date=date, mode=mode)
 
-        # Compute routes for segments
-        routes = []
-        for segment in segments:
-            try:
-                segment_routes = await cls.compute_segment(segment)
-                routes.extend(segment_routes)
-            except RuntimeError:  # Re-raise as is
-                raise
-            except ValueError as e:  # Wrap non-runtime errors
-                raise RuntimeError(str(e)) from e
-
-        return routes
+        # Compute routes for segments concurrently (output order is preserved)
+        try:
+            results = await gather_bounded(
+                [partial(cls.compute_segment, segment) for segment in segments],
+                limit=settings.ROUTES_MAX_CONCURRENCY,
+            )
+        except RuntimeError:  # Re-raise as is
+            raise
+        except ValueError as e:  # Wrap non-runtime errors
+            raise RuntimeError(str(e)) from e
+
+        return [route for segment_routes in results for route in segment_routes]
+
+    @classmethod
+    async def compute_stream(
+        cls,
+        places: List[Place],
+        date: _date,
+        mode: TravelMode,
+    ) -> AsyncIterator[RouteEvent]:
+        """Compute routes like `compute`, yielding each route as soon as its segment finishes.
+        Args:
+            places (List[Place]): List of waypoint places.
+            date (date): Date of travel.
+            mode (TravelMode): The selected travel mode.
+        Yields:
+            RouteEvent: A route with its leg index in the requested places\\
+                        (zero-length legs between repeats are skipped).\\
+                        Segments may complete out of order.
+        Raises:
+            RuntimeError: If route computation fails.
+        """
+        plan = cls.plan_segments(places=places, date=date, mode=mode)
+        segments = plan.segments
+
+        try:
+            async for idx, segment_routes in iterate_bounded(
+                [partial(cls.compute_segment, segment) for segment in segments],
+                limit=settings.ROUTES_MAX_CONCURRENCY,
+            ):
+                for offset, route in enumerate(segment_routes):
+                    leg = plan.legs[segments[idx].offset + offset]
+                    yield RouteEvent(leg=leg, route=route)
+        except RuntimeError:  # Re-raise as is
+            raise
+        except ValueError as e:  # Wrap non-runtime errors
+            raise RuntimeError(str(e)) from e
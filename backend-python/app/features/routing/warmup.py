@@ -0,0 +1,273 @@
+"""Precompute route legs between popular places into the leg cache.
+
+Usage: python -m app.features.routing.warmup [--top-k K] [--modes drive walk transit]
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date as _date, datetime, time, timedelta
+from functools import partial
+from typing import List, Optional, Sequence
+
+from pymongo import ASCENDING, DESCENDING
+
+from app.core.common import Region
+from app.core.config import settings
+from app.core.mongo import db
+from app.integrations.routes import routes_pool
+from app.utils.concurrency import RateLimiter, gather_bounded
+
+from ..places import Place
+from .cache import LegCache, MongoLegCacheBackend, leg_cache
+from .schemas import TravelMode
+from .service import RouteService, Segment
+
+
+logger = logging.getLogger(__name__)
+
+WARMUP_HOURS = range(9, 19)  # Departure buckets covered: 9:00 to 18:00
+
+
+@dataclass
+class WarmupReport:
+    calls: int = 0  # Routes API calls made
+    legs: int = 0  # Legs stored
+    skipped: int = 0  # Segments already cached
+    failed: int = 0  # Segments whose request failed
+    exhausted: bool = False  # Stopped by the call budget
+
+
+class RouteWarmer:
+    """Stores legs between every ordered pair of the top-K places per region."""
+
+    def __init__(
+        self,
+        cache: LegCache,
+        top_k: int,
+        modes: Sequence[TravelMode],
+        days: int,
+        budget: int,
+        rate: float,
+    ):
+        self.cache = cache
+        self.top_k = top_k
+        self.modes = list(modes)
+        self.days = max(1, days)
+        self.budget = budget
+        self.rate = rate
+
+    @classmethod
+    def from_settings(cls, cache: LegCache = leg_cache) -> "RouteWarmer":
+        return cls(
+            cache=cache,
+            top_k=settings.ROUTES_WARMUP_TOP_K,
+            modes=list(TravelMode),
+            days=settings.ROUTES_WARMUP_DAYS,
+            budget=settings.ROUTES_WARMUP_BUDGET,
+            rate=settings.ROUTES_WARMUP_RATE,
+        )
+
+    @staticmethod
+    async def top_places(region: Region, k: int) -> List[Place]:
+        # Best ranking first (rank 1 is the most popular), rating as tiebreaker
+        return (
+            await Place.find({"region": region, "ranking": {"$ne": None}})
+            .sort([("ranking", ASCENDING), ("rating", DESCENDING)])
+            .limit(k)
+            .to_list()
+        )
+
+    @staticmethod
+    def tour(count: int) -> List[int]:
+        """Closed walk visiting every ordered pair of distinct nodes exactly once.
+        Args:
+            count (int): Number of nodes.
+        Returns:
+            List[int]: Node indices; consecutive entries form the legs to compute.\\
+                       Chaining the pairs lets one request cover many legs.
+        """
+        if count < 2:
+            return []
+        # Hierholzer's algorithm on the complete digraph (in-degree == out-degree)
+        unused = {node: [n for n in range(count) if n != node] for node in range(count)}
+        stack, walk = [0], []
+        while stack:
+            node = stack[-1]
+            if unused[node]:
+                stack.append(unused[node].pop())
+            else:
+                walk.append(stack.pop())
+        return walk[::-1]
+
+    def departures(self, mode: TravelMode, start: _date) -> List[datetime]:
+        """Departure times whose cache buckets interactive requests are likely to hit.
+        Args:
+            mode (TravelMode): Travel mode.
+            start (date): First day covered.
+        Returns:
+            List[datetime]: One departure per distinct cache bucket, nearest day first.
+        """
+        departures, buckets = [], set()
+        for day in range(self.days):
+            for hour in WARMUP_HOURS:
+                dt = datetime.combine(
+                    start + timedelta(days=day), time(hour, 0), tzinfo=settings.TIMEZONE
+                )
+                if mode != TravelMode.TRANSIT:  # Shifted like segments
+                    dt = RouteService.shift_datetime_to_future(
+                        dt=dt, step=timedelta(days=7), offset=timedelta(minutes=5)
+                    )
+                bucket = self.cache.bucket(mode, dt)
+                if bucket not in buckets:  # DRIVE/WALK buckets repeat weekly
+                    buckets.add(bucket)
+                    departures.append(dt)
+        return departures
+
+    def segments(
+        self,
+        places: List[Place],
+        mode: TravelMode,
+        departure: datetime,
+    ) -> List[Segment]:
+        tour = [places[idx] for idx in self.tour(len(places))]
+        plan = RouteService.plan_segments(tour, departure.date(), mode)
+        for segment in plan.segments:  # Pin every segment to the warmed bucket
+            segment.departure = departure
+        return plan.segments
+
+    async def run(
+        self,
+        regions: Optional[Sequence[Region]] = None,
+        start: Optional[_date] = None,
+    ) -> WarmupReport:
+        """Warm the cache, stopping once the call budget is spent.
+        Args:
+            regions (Optional[Sequence[Region]]): Regions to cover. Defaults to all.
+            start (Optional[date]): First day covered. Defaults to today.
+        Returns:
+            WarmupReport: Counts of calls, stored legs, skipped and failed segments.
+        """
+        report = WarmupReport()
+        if not self.cache.enabled:  # Nowhere to store the legs: spend no calls
+            logger.warning("Route warm-up skipped: the leg cache is disabled")
+            return report
+        limiter = RateLimiter(self.rate)
+        start = start or datetime.now(tz=settings.TIMEZONE).date()
+
+        # Nearest departures first, so a small budget covers the likeliest requests
+        places = {r: await self.top_places(r, self.top_k) for r in regions or Region}
+        jobs = sorted(
+            (
+                (departure, region, mode)
+                for region in places
+                for mode in self.modes
+                for departure in self.departures(mode, start)
+            ),
+            key=lambda job: job[0],
+        )
+        segments = [
+            segment
+            for departure, region, mode in jobs
+            for segment in self.segments(places[region], mode, departure)
+        ]
+
+        async def _warm(segment: Segment) -> None:
+            if report.calls >= self.budget:  # Spent: skip the cache lookups too
+                report.exhausted = True
+                return
+            keys = [
+                self.cache.key(
+                    origin.id, destination.id, segment.mode, segment.departure
+                )
+                for origin, destination in zip(segment.places, segment.places[1:])
+            ]
+            if all([await self.cache.get(key) is not None for key in keys]):
+                report.skipped += 1
+                return
+            if report.calls >= self.budget:  # Spent during the lookup
+                report.exhausted = True
+                return
+            report.calls += 1
+
+            await limiter.acquire()
+            try:
+                routes = await RouteService.fetch_segment(segment)
+            except RuntimeError:
+                report.failed += 1
+                return
+
+            for route in routes:
+                key = self.cache.key(
+                    route.origin, route.destination, segment.mode, segment.departure
+                )
+                await self.cache.set(key, route)
+            report.legs += len(routes)
+
+        await gather_bounded(
+            [partial(_warm, segment) for segment in segments],
+            limit=settings.ROUTES_MAX_CONCURRENCY,
+        )
+        return report
+
+
+async def warmup_loop(warmer: RouteWarmer, interval: int) -> None:
+    """
+    Run the warm-up forever, pausing `interval` seconds between runs.
+    """
+    if not warmer.cache.enabled:
+        logger.warning("Route warm-up disabled: ROUTES_CACHE_ENABLED is false")
+        return
+    while True:
+        try:
+            report = await warmer.run()
+            logger.info("Route warm-up finished: %s", report)
+        except Exception:
+            logger.exception("Route warm-up failed")
+        await asyncio.sleep(interval)
+
+
+##### CLI #####
+
+
+async def _main(args: argparse.Namespace) -> None:
+    # Standalone runs only help other processes through the shared Mongo tier
+    cache = LegCache(
+        backends=[MongoLegCacheBackend(ttl=settings.ROUTES_CACHE_TTL)],
+        bucket_minutes=settings.ROUTES_CACHE_BUCKET_MINUTES,
+    )
+    warmer = RouteWarmer(
+        cache=cache,
+        top_k=args.top_k,
+        modes=args.modes,
+        days=args.days,
+        budget=args.budget,
+        rate=args.rate,
+    )
+
+    await db.connect()
+    await routes_pool.connect()
+    try:
+        report = await warmer.run(regions=args.regions)
+    finally:
+        await routes_pool.close()
+        await db.close()
+    print(report)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Precompute routes between popular places."
+    )
+    parser.add_argument("--top-k", type=int, default=settings.ROUTES_WARMUP_TOP_K)
+    parser.add_argument("--regions", type=Region, nargs="+", default=list(Region))
+    parser.add_argument("--modes", type=TravelMode, nargs="+", default=list(TravelMode))
+    parser.add_argument("--days", type=int, default=settings.ROUTES_WARMUP_DAYS)
+    parser.add_argument("--budget", type=int, default=settings.ROUTES_WARMUP_BUDGET)
+    parser.add_argument("--rate", type=float, default=settings.ROUTES_WARMUP_RATE)
+    asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
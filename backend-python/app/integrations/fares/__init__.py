@@ -1,3 +1,11 @@
-from .registry import FARE_FIELDS, compute_fare
+from .registry import FARE_FIELDS, compute_fare, compute_fares
+from .summary import LegSummary, StepSummary, summarize_leg
 
-__all__ = ["FARE_FIELDS", "compute_fare"]
+__all__ = [
+    "FARE_FIELDS",
+    "compute_fare",
+    "compute_fares",
+    "LegSummary",
+    "StepSummary",
+    "summarize_leg",
+]
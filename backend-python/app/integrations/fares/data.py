@@ -32,21 +32,64 @@ MACAU_LRT_STATIONS = [
     ("橫琴", "Hengqin", "Hengqin"),
 ]
 
+# Alternative names seen in transit data -> a name in MACAU_LRT_STATIONS
+MACAU_LRT_STATION_ALIASES = {
+    "Seak Pai Van": "Seac Pai Van",
+    "氹仔客運碼頭": "氹仔碼頭",
+    "Terminal Marítimo de Passageiros da Taipa": "Terminal Marítimo da Taipa",
+    "Universidade de Ciência e Tecnologia de Macau": "UCTM",
+    "Macau University of Science and Technology": "MUST",
+    "Estádio de Macau": "Estádio",
+    "Macau Stadium": "Stadium",
+    "Macau International Airport": "Airport",
+}
+
+
+HONG_KONG_GEOFENCE_POLYLINES = {
+    # Taxi operating areas (approximate)
+    "LANTAU": "o~lfC_nuuT_g^??o|k@~f^?",
+    "NEW_TERRITORIES": "oewhC_nuuT?o`zBnggA??f`g@wjY?_|BfxGn}@nwHv|AnzD?~uJozD~zm@",
+    # Tolled tunnels and bridges (mid sections, so only crossings match)
+    "CROSS_HARBOUR": "kl`gCok{wTgw@??od@fw@?",
+    "EASTERN_HARBOUR": "wu`gCgfbxTwj@??w|Avj@?",
+    "WESTERN_HARBOUR": "wu`gCg}twTgw@??wcAfw@?",
+    "LION_ROCK": "_akgC__{wTgpA??_q@fpA?",
+    "TATES_CAIRN": "_zkgCwg`xTgiB??gw@fiB?",
+    "SHING_MUN": "_iqgC_~swTod@??_|Bnd@?",
+    "TAI_LAM": "gasgCwjcwTwyE??w|AvyE?",
+    "ABERDEEN": "_{yfCge{wTgw@??wj@fw@?",
+    "LANTAU_LINK": "g`lgCoagwTwj@??_jAvj@?",
+}
 
-MACAU_LRT_DISTANCE_TABLE = [
-    [0, 2, 3, 4, 5, 6, 7, 8, 8, 9,10,11,12, 9, 9],
-    [2, 0, 1, 2, 3, 4, 5, 6, 6, 7, 8, 9,10, 7, 7],
-    [3, 1, 0, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9, 6, 6],
-    [4, 2, 1, 0, 1, 2, 3, 4, 4, 5, 6, 7, 8, 5, 5],
-    [5, 3, 2, 1, 0, 1, 2, 3, 3, 4, 5, 6, 7, 4, 4],
-    [6, 4, 3, 2, 1, 0, 1, 2, 2, 3, 4, 5, 6, 3, 3],
-    [7, 5, 4, 3, 2, 1, 0, 1, 1, 2, 3, 4, 5, 2, 2],
-    [8, 6, 5, 4, 3, 2, 1, 0, 1, 2, 3, 4, 5, 1, 3],
-    [8, 6, 5, 4, 3, 2, 1, 1, 0, 1, 2, 3, 4, 2, 3],
-    [9, 7, 6, 5, 4, 3, 2, 2, 1, 0, 1, 2, 3, 3, 4],
-    [10,8, 7, 6, 5, 4, 3, 3, 2, 1, 0, 1, 2, 4, 5],
-    [11,9, 8, 7, 6, 5, 4, 4, 3, 2, 1, 0, 1, 5, 6],
-    [12,10,9, 8, 7, 6, 5, 5, 4, 3, 2, 1, 0, 6, 7],
-    [9, 7, 6, 5, 4, 3, 2, 1, 2, 3, 4, 5, 6, 0, 4],
-    [9, 7, 6, 5, 4, 3, 2, 3, 3, 4, 5, 6, 7, 4, 0],
-]  # fmt: skip
+# MTR stations covered by the offline fare table (major stations only)
+HONG_KONG_MTR_STATIONS = [
+    # Hong Kong Island
+    ("中環", "Central"),
+    ("金鐘", "Admiralty"),
+    ("灣仔", "Wan Chai"),
+    ("銅鑼灣", "Causeway Bay"),
+    ("北角", "North Point"),
+    ("海洋公園", "Ocean Park"),
+    # Kowloon
+    ("尖沙咀", "Tsim Sha Tsui"),
+    ("佐敦", "Jordan"),
+    ("旺角", "Mong Kok"),
+    ("太子", "Prince Edward"),
+    ("九龍塘", "Kowloon Tong"),
+    ("紅磡", "Hung Hom"),
+    ("九龍", "Kowloon"),
+    ("鑽石山", "Diamond Hill"),
+    ("觀塘", "Kwun Tong"),
+    # New Territories & Lantau
+    ("沙田", "Sha Tin"),
+    ("荃灣", "Tsuen Wan"),
+    ("東涌", "Tung Chung"),
+    ("迪士尼", "Disneyland Resort"),
+]
+
+HONG_KONG_MTR_STATION_ALIASES = {
+    "香港": "中環",  # Linked to Central
+    "Hong Kong": "Central",
+    "East Tsim Sha Tsui": "Tsim Sha Tsui",  # Linked to Tsim Sha Tsui
+    "尖東": "尖沙咀",
+}
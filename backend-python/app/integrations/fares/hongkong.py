@@ -0,0 +1,221 @@
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from google.maps.routing_v2 import TransitVehicle
+
+from app.utils.geometry import Coordinate, GeofenceIndex
+from app.utils.polyline import decode_polyline
+
+from .data import (
+    HONG_KONG_GEOFENCE_POLYLINES,
+    HONG_KONG_MTR_STATION_ALIASES,
+    HONG_KONG_MTR_STATIONS,
+)
+from .stations import NOT_FOUND, StationIndex
+from .summary import LegSummary
+from .tables import load_table
+
+
+FARE_FIELDS_HK = [
+    "routes.legs.startLocation",
+    "routes.legs.endLocation",
+    "routes.legs.duration.seconds",
+    "routes.legs.distanceMeters",
+    "routes.legs.polyline.encodedPolyline",
+    "routes.legs.steps.transitDetails.stopCount",
+    "routes.legs.steps.transitDetails.transitLine.vehicle.type",
+    "routes.legs.steps.transitDetails.stopDetails.arrivalStop.name",
+    "routes.legs.steps.transitDetails.stopDetails.departureStop.name",
+]
+
+
+##### Constants #####
+
+
+VehicleType = TransitVehicle.TransitVehicleType
+
+# Taxi: (flag fare for the first 2 km, jump fare, jump fare threshold, jump fare after)
+TAXI_TARIFFS = {
+    "URBAN": (29.0, 2.1, 102.5, 1.4),
+    "NEW_TERRITORIES": (25.5, 1.9, 82.5, 1.4),
+    "LANTAU": (24.0, 1.9, 195.0, 1.6),
+}
+FLAG_DISTANCE = 2000  # meters
+JUMP_DISTANCE, JUMP_DURATION = 200, 60  # meters, seconds (waiting)
+WAITING_REFERENCE = 0.12  # seconds per meter (30 km/h): slower counts as waiting
+
+# Taxi: Tunnel and bridge tolls paid by passengers (approximate, incl. return tolls)
+TOLLS = {
+    "CROSS_HARBOUR": 50.0,
+    "EASTERN_HARBOUR": 50.0,
+    "WESTERN_HARBOUR": 50.0,
+    "LION_ROCK": 8.0,
+    "TATES_CAIRN": 20.0,
+    "SHING_MUN": 5.0,
+    "TAI_LAM": 18.0,
+    "ABERDEEN": 5.0,
+    "LANTAU_LINK": 30.0,
+}
+
+# MTR (fallback when a station is not in the fare table)
+MTR_VEHICLES = {
+    VehicleType.SUBWAY,
+    VehicleType.METRO_RAIL,
+    VehicleType.HEAVY_RAIL,
+    VehicleType.COMMUTER_TRAIN,
+    VehicleType.RAIL,
+}
+MTR_BASE_FARE, MTR_STOP_FARE = 5.0, 1.2
+
+# Bus, minibus, tram, ferry and Peak Tram (typical flat fares)
+FLAT_FARES = {
+    VehicleType.BUS: 8.0,
+    VehicleType.INTERCITY_BUS: 8.0,
+    VehicleType.TROLLEYBUS: 8.0,
+    VehicleType.SHARE_TAXI: 7.0,  # Minibus
+    VehicleType.TRAM: 3.3,
+    VehicleType.FERRY: 5.0,
+    VehicleType.FUNICULAR: 62.0,  # Peak Tram
+}
+
+# Lookup indexes (built once)
+HONG_KONG_GEOFENCES = GeofenceIndex(HONG_KONG_GEOFENCE_POLYLINES)
+HONG_KONG_MTR_STATION_INDEX = StationIndex(
+    HONG_KONG_MTR_STATIONS,
+    HONG_KONG_MTR_STATION_ALIASES,
+    partial=False,  # Many names extend others ("Kowloon Bay", "Mong Kok East")
+    name="stations.hong_kong_mtr",
+)
+
+
+##### Fare Estimators #####
+
+
+class HongKongTaxiFareEstimator:
+    @classmethod
+    def compute(cls, leg: LegSummary) -> Optional[float]:
+        tariff = TAXI_TARIFFS[cls._select_tariff(leg.start, leg.end)]
+        jumps = cls._count_jumps(leg.duration, leg.distance)
+
+        fare = cls._compute_meter_fare(tariff, jumps)
+        fare += cls._compute_tolls(leg.polyline)
+        return round(fare, 1)
+
+    @classmethod
+    def compute_many(cls, legs: Sequence[LegSummary]) -> List[Optional[float]]:
+        """Estimate fares for many legs, classifying all endpoints in one vectorized pass.
+        Args:
+            legs (Sequence[LegSummary]): Driving legs.
+        Returns:
+            List[Optional[float]]: Fare per leg, in the same order.
+        """
+        if not legs:
+            return []
+
+        # Rows 0..N-1: pickups, rows N..2N-1: dropoffs
+        points = np.array(
+            [leg.start for leg in legs] + [leg.end for leg in legs],
+            dtype=np.float64,
+        )
+        areas = HONG_KONG_GEOFENCES.areas_many(points)
+
+        fares: List[Optional[float]] = []
+        for idx, leg in enumerate(legs):
+            tariff = cls._select_area_tariff(areas[idx], areas[len(legs) + idx])
+            jumps = cls._count_jumps(leg.duration, leg.distance)
+            fare = cls._compute_meter_fare(TAXI_TARIFFS[tariff], jumps)
+            fare += cls._compute_tolls(leg.polyline)
+            fares.append(round(fare, 1))
+        return fares
+
+    @staticmethod
+    def _select_tariff(pickup: Coordinate, dropoff: Coordinate) -> str:
+        # Look up each point once
+        return HongKongTaxiFareEstimator._select_area_tariff(
+            HONG_KONG_GEOFENCES.areas(pickup), HONG_KONG_GEOFENCES.areas(dropoff)
+        )
+
+    @staticmethod
+    def _select_area_tariff(origin: frozenset[str], destination: frozenset[str]) -> str:
+        # Green/blue taxis only when the trip stays within their area
+        if "LANTAU" in origin and "LANTAU" in destination:
+            return "LANTAU"
+        if "NEW_TERRITORIES" in origin and "NEW_TERRITORIES" in destination:
+            return "NEW_TERRITORIES"
+        return "URBAN"
+
+    @staticmethod
+    def _count_jumps(duration: int, distance: int) -> int:
+        extra_distance = max(0.0, float(distance) - FLAG_DISTANCE)
+        waiting = max(0.0, float(duration) - float(distance) * WAITING_REFERENCE)
+        return math.ceil(extra_distance / JUMP_DISTANCE) + math.ceil(
+            waiting / JUMP_DURATION
+        )
+
+    @staticmethod
+    def _compute_meter_fare(
+        tariff: Tuple[float, float, float, float],
+        jumps: int,
+    ) -> float:
+        flag_fare, jump_fare, threshold, jump_fare_after = tariff
+        # Jumps charged at the higher rate until the meter reaches the threshold
+        high_jumps = min(
+            jumps, math.ceil(round((threshold - flag_fare) / jump_fare, 6))
+        )
+        return (
+            flag_fare + high_jumps * jump_fare + (jumps - high_jumps) * jump_fare_after
+        )
+
+    @staticmethod
+    def _compute_tolls(polyline: str) -> float:
+        if not polyline:
+            return 0.0
+        crossed = HONG_KONG_GEOFENCES.areas_along(decode_polyline(polyline))
+        return sum(TOLLS[area] for area in crossed if area in TOLLS)
+
+
+class HongKongTransitFareEstimator:
+    @classmethod
+    def compute(cls, leg: LegSummary) -> Optional[float]:
+        fare = 0.0
+        ride = None  # Ongoing MTR journey: (origin, destination, stops)
+
+        for step in leg.steps:
+            vehicle = step.vehicle
+
+            # MTR: Interchanges are one journey (fare by entry and exit stations)
+            if vehicle in MTR_VEHICLES:
+                ride = (
+                    ride[0] if ride else step.origin,
+                    step.destination,
+                    (ride[2] if ride else 0) + step.stops,
+                )
+                continue
+
+            # Walking (e.g. between linked stations) does not end the journey
+            if vehicle is None:
+                continue
+
+            # No fare known for this vehicle: leave the leg unpriced rather than cheap
+            if vehicle not in FLAT_FARES:
+                return None
+
+            if ride:
+                fare += cls._compute_mtr_fare(*ride)
+                ride = None
+            fare += FLAT_FARES[vehicle]
+
+        if ride:
+            fare += cls._compute_mtr_fare(*ride)
+        return round(fare, 1)
+
+    @staticmethod
+    def _compute_mtr_fare(origin: str, destination: str, stops: int) -> float:
+        origin = HONG_KONG_MTR_STATION_INDEX.lookup(origin)
+        destination = HONG_KONG_MTR_STATION_INDEX.lookup(destination)
+
+        if origin == NOT_FOUND or destination == NOT_FOUND:
+            return MTR_BASE_FARE + MTR_STOP_FARE * stops  # Estimate by stop count
+        return float(load_table("hong_kong_mtr_fares")[origin, destination])
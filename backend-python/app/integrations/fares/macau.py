@@ -1,10 +1,19 @@
 import math
-from typing import Optional
-from google.maps.routing_v2 import RouteLeg, TransitVehicle
+from typing import List, Optional, Sequence
 
-from app.utils.geometry import Coordinate, in_geofence, location_to_tuple
+import numpy as np
+from google.maps.routing_v2 import TransitVehicle
 
-from .data import MACAU_GEOFENCE_POLYLINES, MACAU_LRT_STATIONS, MACAU_LRT_DISTANCE_TABLE
+from app.utils.geometry import Coordinate, GeofenceIndex
+
+from .data import (
+    MACAU_GEOFENCE_POLYLINES,
+    MACAU_LRT_STATIONS,
+    MACAU_LRT_STATION_ALIASES,
+)
+from .stations import StationIndex
+from .summary import LegSummary
+from .tables import load_table
 
 
 FARE_FIELDS_MO = [
@@ -37,30 +46,19 @@ BUS_FLAT_FARE = 6.0
 # LRT
 LRT_FARE_RULES = [(3, 6.0), (6, 8.0), (9, 10.0), (12, 12.0)]
 
+# Lookup indexes (built once)
+MACAU_GEOFENCES = GeofenceIndex(MACAU_GEOFENCE_POLYLINES)
+MACAU_LRT_STATION_INDEX = StationIndex(
+    MACAU_LRT_STATIONS, MACAU_LRT_STATION_ALIASES, name="stations.macau_lrt"
+)
 
-##### Helper Functions #####
-
-
-def _in_areas(point: Coordinate, *areas: str) -> bool:
-    """Check if a point is located within certain areas of Macau"""
-    return any(in_geofence(point, MACAU_GEOFENCE_POLYLINES[a]) for a in areas)
 
-
-def _compare_station_names(name1: str, name2: str) -> bool:
-    """Compare two LRT station names"""
-    # Case insensitive
-    a = name1.upper()
-    b = name2.upper()
-    # Test partial match
-    return a == b or a in b or b in a
+##### Helper Functions #####
 
 
 def _get_station_key(name: str) -> int:
     """Get LRT station index by its name (in any supported language)"""
-    for idx, station in enumerate(MACAU_LRT_STATIONS):
-        if any(_compare_station_names(name, n) for n in station):
-            return idx
-    return -1  # Not found
+    return MACAU_LRT_STATION_INDEX.lookup(name)  # -1 if not found
 
 
 ##### Fare Estimators #####
@@ -68,18 +66,38 @@ def _get_station_key(name: str) -> int:
 
 class MacauTaxiFareEstimator:
     @classmethod
-    def compute(cls, leg: RouteLeg) -> Optional[float]:
-        # Extract key data
-        pickup = location_to_tuple(leg.start_location)
-        dropoff = location_to_tuple(leg.end_location)
-        duration = leg.duration.seconds
-        distance = leg.distance_meters
-
-        fare = cls._compute_distance_fare(distance)
-        fare += cls._compute_stopping_fare(duration, distance)
-        fare += cls._compute_surcharges(pickup, dropoff)
+    def compute(cls, leg: LegSummary) -> Optional[float]:
+        fare = cls._compute_distance_fare(leg.distance)
+        fare += cls._compute_stopping_fare(leg.duration, leg.distance)
+        fare += cls._compute_surcharges(leg.start, leg.end)
         return fare
 
+    @classmethod
+    def compute_many(cls, legs: Sequence[LegSummary]) -> List[Optional[float]]:
+        """Estimate fares for many legs, classifying all endpoints in one vectorized pass.
+        Args:
+            legs (Sequence[LegSummary]): Driving legs.
+        Returns:
+            List[Optional[float]]: Fare per leg, in the same order.
+        """
+        if not legs:
+            return []
+
+        # Rows 0..N-1: pickups, rows N..2N-1: dropoffs
+        points = np.array(
+            [leg.start for leg in legs] + [leg.end for leg in legs],
+            dtype=np.float64,
+        )
+        areas = MACAU_GEOFENCES.areas_many(points)
+
+        fares: List[Optional[float]] = []
+        for idx, leg in enumerate(legs):
+            fare = cls._compute_distance_fare(leg.distance)
+            fare += cls._compute_stopping_fare(leg.duration, leg.distance)
+            fare += cls._compute_area_surcharges(areas[idx], areas[len(legs) + idx])
+            fares.append(fare)
+        return fares
+
     @staticmethod
     def _compute_distance_fare(distance: int) -> float:
         extra_distance = max(0.0, float(distance) - BASE_DISTANCE)
@@ -95,54 +113,62 @@ class MacauTaxiFareEstimator:
 
     @staticmethod
     def _compute_surcharges(pickup: Coordinate, dropoff: Coordinate) -> float:
+        # Look up each point once
+        return MacauTaxiFareEstimator._compute_area_surcharges(
+            MACAU_GEOFENCES.areas(pickup), MACAU_GEOFENCES.areas(dropoff)
+        )
+
+    @staticmethod
+    def _compute_area_surcharges(
+        origin: frozenset[str],
+        destination: frozenset[str],
+    ) -> float:
         surcharge = 0.0
-        if _in_areas(pickup, "TAIPA", "UM") and _in_areas(dropoff, "COLOANE"):
+        if origin & {"TAIPA", "UM"} and "COLOANE" in destination:
             surcharge += SURCHARGE_TAIPA_COLOANE
-        elif _in_areas(pickup, "MACAU") and _in_areas(dropoff, "COLOANE"):
+        elif "MACAU" in origin and "COLOANE" in destination:
             surcharge += SURCHARGE_MACAU_COLOANE
-        if _in_areas(pickup, "HZMB", "AIRPORT", "TAIPAFERRY", "HENGQIN"):
+        if origin & {"HZMB", "AIRPORT", "TAIPAFERRY", "HENGQIN"}:
             surcharge += SURCHARGE_PORTS
-        if _in_areas(pickup, "UM"):
+        if "UM" in origin:
             surcharge += SURCHARGE_UM
         return surcharge
 
 
 class MacauTransitFareEstimator:
     @classmethod
-    def compute(cls, leg: RouteLeg) -> Optional[float]:
-        steps = list(leg.steps or [])
+    def compute(cls, leg: LegSummary) -> Optional[float]:
+        steps = leg.steps
         fare = 0.0
+        journey = None  # Ongoing LRT journey: (origin, stops)
 
         # Track for transfer discounts
         # previous_bus_fare = None
         # previous_bus_time = None
 
         for idx, step in enumerate(steps):
-            # Extract vehicle type
-            vehicle = step.transit_details.transit_line.vehicle.type_
-
             # Bus
-            if vehicle == TransitVehicle.TransitVehicleType.BUS:
+            if step.vehicle == TransitVehicle.TransitVehicleType.BUS:
                 fare += cls._compute_bus_fare()
 
             # LRT
-            elif vehicle == TransitVehicle.TransitVehicleType.TRAM:
-                stops = step.transit_details.stop_count
-                origin = step.transit_details.stop_details.departure_stop.name
-                destination = step.transit_details.stop_details.arrival_stop.name
+            elif step.vehicle == TransitVehicle.TransitVehicleType.TRAM:
+                origin, stops = step.origin, step.stops
+                if journey:  # Continues from the previous LRT step
+                    origin, stops = journey[0], journey[1] + stops - 1
 
                 # Merge consecutive LRT steps
                 nxt = idx + 1
                 if (
                     nxt < len(steps)  # Next step exists
-                    and steps[nxt].transit_details.transit_line.vehicle.type_
+                    and steps[nxt].vehicle
                     == TransitVehicle.TransitVehicleType.TRAM  # Is (also) LRT
                 ):
-                    steps[nxt].transit_details.stop_count += stops - 1
-                    steps[nxt].transit_details.stop_details.departure_stop.name = origin
+                    journey = (origin, stops)
                     continue
 
-                fare += cls._compute_lrt_fare(origin, destination, stops)
+                journey = None
+                fare += cls._compute_lrt_fare(origin, step.destination, stops)
 
         return fare
 
@@ -158,7 +184,7 @@ class MacauTransitFareEstimator:
         station_count = (
             stops  # Use inaccurate stop count
             if origin == -1 or destination == -1  # If either station key not found
-            else MACAU_LRT_DISTANCE_TABLE[origin][destination]
+            else load_table("macau_lrt_distances")[origin, destination]
         )
 
         for max_station, fare in LRT_FARE_RULES:
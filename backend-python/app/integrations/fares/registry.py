@@ -1,17 +1,33 @@
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
 
-from google.maps.routing_v2 import RouteLeg, RouteTravelMode
+from google.maps.routing_v2 import RouteTravelMode
 
 from app.core.common import Region
 
+from .hongkong import (
+    FARE_FIELDS_HK,
+    HongKongTaxiFareEstimator,
+    HongKongTransitFareEstimator,
+)
 from .macau import FARE_FIELDS_MO, MacauTaxiFareEstimator, MacauTransitFareEstimator
+from .summary import LegSummary
 
 
-FARE_FIELDS = set().union(["routes.legs.steps.travelMode"], FARE_FIELDS_MO)
+FARE_FIELDS = set().union(
+    ["routes.legs.steps.travelMode"], FARE_FIELDS_MO, FARE_FIELDS_HK
+)
 
+TRANSIT_MODES = {RouteTravelMode.TRANSIT, RouteTravelMode.WALK}
 
-def compute_fare(region: Region, leg: RouteLeg) -> Optional[float]:
-    steps = {step.travel_mode for step in leg.steps or []}
+# Taxi estimators with a batch (`compute_many`) variant
+TAXI_ESTIMATORS = {
+    Region.MACAU: MacauTaxiFareEstimator,
+    Region.HONG_KONG: HongKongTaxiFareEstimator,
+}
+
+
+def compute_fare(region: Region, leg: LegSummary) -> Optional[float]:
+    steps = leg.modes
     if not steps:
         return None
 
@@ -24,13 +40,46 @@ def compute_fare(region: Region, leg: RouteLeg) -> Optional[float]:
         if region == Region.MACAU:
             return MacauTaxiFareEstimator.compute(leg)
         if region == Region.HONG_KONG:
-            return None  # Not implemented yet
+            return HongKongTaxiFareEstimator.compute(leg)
 
-    # TRANSIT & WALK: Estimate transit fare
-    if steps == {RouteTravelMode.TRANSIT, RouteTravelMode.WALK}:
+    # TRANSIT (& WALK): Estimate transit fare
+    if RouteTravelMode.TRANSIT in steps and steps <= TRANSIT_MODES:
         if region == Region.MACAU:
             return MacauTransitFareEstimator.compute(leg)
         if region == Region.HONG_KONG:
-            return None  # Not implemented yet
+            return HongKongTransitFareEstimator.compute(leg)
 
     return None
+
+
+def compute_fares(
+    regions: Sequence[Region],
+    legs: Sequence[LegSummary],
+) -> List[Optional[float]]:
+    """Estimate fares for all legs of a response.
+    Args:
+        regions (Sequence[Region]): Region of each leg's origin.
+        legs (Sequence[LegSummary]): Summaries of the legs to estimate.
+    Returns:
+        List[Optional[float]]: Fare per leg (same as `compute_fare`), in the same order.\\
+                               Taxi legs are estimated together in one batch per region.
+    """
+    fares: List[Optional[float]] = [None] * len(legs)
+
+    # Batch: DRIVE-only legs, grouped by region
+    batches: Dict[Region, List[int]] = {region: [] for region in TAXI_ESTIMATORS}
+    for idx, (region, leg) in enumerate(zip(regions, legs)):
+        if region in batches and leg.modes == {RouteTravelMode.DRIVE}:
+            batches[region].append(idx)
+    for region, batch in batches.items():
+        estimates = TAXI_ESTIMATORS[region].compute_many([legs[i] for i in batch])
+        for idx, fare in zip(batch, estimates):
+            fares[idx] = fare
+
+    # Others: One by one
+    batched = {idx for batch in batches.values() for idx in batch}
+    for idx, (region, leg) in enumerate(zip(regions, legs)):
+        if idx not in batched:
+            fares[idx] = compute_fare(region, leg)
+
+    return fares
@@ -0,0 +1,118 @@
+import difflib
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Mapping, Optional, Sequence
+
+from app.utils.cache import memoize
+
+
+NOT_FOUND = -1
+MIN_PARTIAL_LENGTH = 2  # Shortest normalized name used for partial matches
+MAX_UNMATCHED_NAMES = 100  # Distinct unmatched names kept for reporting
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a station name for lookups: strip accents, casefold, drop spaces and punctuation.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return re.sub(r"[\W_]+", "", stripped.casefold())
+
+
+class StationIndex:
+    """Station name -> station key lookups across languages, aliases and partial names.
+
+    Partial and fuzzy matching suit networks with distinctive names. Turn it off
+    (`partial=False`) where many names share a prefix (e.g. "Kowloon Bay" and
+    "Kowloon"), so unknown stations are reported instead of mismatched.
+    """
+
+    def __init__(
+        self,
+        stations: Sequence[Sequence[str]],
+        aliases: Optional[Mapping[str, str]] = None,
+        cutoff: float = 0.85,
+        partial: bool = True,
+        cache_size: int = 1024,
+        max_unmatched: int = MAX_UNMATCHED_NAMES,
+        name: str = "stations",
+    ):
+        self.name = name  # Prefix of the cache names in metrics
+        self.cutoff = cutoff
+        self.partial = partial  # Fall back to partial/fuzzy matches
+        self.max_unmatched = max_unmatched
+        # Raw names that found no station (client-supplied: only the first few are kept)
+        self.unmatched: Counter[str] = Counter()
+        self.unmatched_total = 0
+
+        # Exact index: every normalized name (in any language) -> station key
+        self._names: Dict[str, int] = {}
+        for key, names in enumerate(stations):
+            for name in names:
+                self._names.setdefault(normalize_name(name), key)
+        for alias, name in (aliases or {}).items():
+            self._names.setdefault(
+                normalize_name(alias), self._names[normalize_name(name)]
+            )
+
+        # Partial/fuzzy matching is slow: memoize per normalized name
+        fallback = memoize(f"{self.name}.fallback", max_size=cache_size)
+        normalize = memoize(f"{self.name}.names", max_size=cache_size)
+        self._fallback = fallback(self._match)
+        self._normalize = normalize(normalize_name)
+
+    def lookup(self, name: str) -> int:
+        """Get the station key for a name.
+        Args:
+            name (str): Station name, in any supported language or alias.
+        Returns:
+            int: Station key, or -1 (NOT_FOUND) if no station matches unambiguously.
+        """
+        normalized = self._normalize(name)
+        key = self._names.get(normalized)
+        if key is None:
+            key = self._fallback(normalized) if self.partial else NOT_FOUND
+        if key == NOT_FOUND:
+            self.unmatched_total += 1
+            if name in self.unmatched or len(self.unmatched) < self.max_unmatched:
+                self.unmatched[name] += 1
+        return key
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get lookup counters (indexed names, fallback cache usage, unmatched lookups).
+        """
+        fallback = self._fallback.cache.stats()
+        return {
+            "names": len(self._names),
+            "fallback_hits": fallback["hits"],
+            "fallback_misses": fallback["misses"],
+            "unmatched": self.unmatched_total,
+        }
+
+    ##### Helpers #####
+
+    def _match(self, normalized: str) -> int:
+        if len(normalized) < MIN_PARTIAL_LENGTH:
+            return NOT_FOUND
+
+        # Partial: a known name inside the query (e.g. "Lotus Checkpoint") or vice versa
+        matches: Dict[int, int] = {}  # Station key -> longest matching name
+        for name, key in self._names.items():
+            if len(name) >= MIN_PARTIAL_LENGTH and (
+                name in normalized or normalized in name
+            ):
+                matches[key] = max(matches.get(key, 0), len(name))
+        if matches:
+            ranked = sorted(matches.items(), key=lambda item: -item[1])
+            if len(ranked) == 1 or ranked[0][1] > ranked[1][1]:
+                return ranked[0][0]
+            return NOT_FOUND  # Ambiguous (e.g. "Cotai" for Cotai East/West)
+
+        # Fuzzy: closest spelling (e.g. typos and transliteration variants)
+        close = difflib.get_close_matches(
+            normalized, self._names, n=1, cutoff=self.cutoff
+        )
+        return self._names[close[0]] if close else NOT_FOUND
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+from typing import FrozenSet, Optional, Tuple
+
+from google.maps.routing_v2 import (
+    RouteLeg,
+    RouteLegStep,
+    RouteTravelMode,
+    TransitVehicle,
+)
+
+from app.utils.geometry import Coordinate, location_to_tuple
+
+
+VehicleType = TransitVehicle.TransitVehicleType
+
+
+@dataclass(frozen=True, slots=True)
+class StepSummary:
+    """Fare-relevant data of a leg step (read once from the proto)"""
+
+    travel_mode: RouteTravelMode
+    vehicle: Optional[VehicleType] = None  # Transit steps only
+    stops: int = 0
+    origin: str = ""  # Departure stop name
+    destination: str = ""  # Arrival stop name
+
+
+@dataclass(frozen=True, slots=True)
+class LegSummary:
+    """Fare-relevant data of a route leg (read once from the proto)"""
+
+    start: Coordinate = (0.0, 0.0)
+    end: Coordinate = (0.0, 0.0)
+    distance: int = 0  # meters
+    duration: int = 0  # seconds
+    polyline: str = ""
+    steps: Tuple[StepSummary, ...] = ()
+    modes: FrozenSet[RouteTravelMode] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Distinct travel modes of the steps (checked by every estimator dispatch)
+        modes = frozenset(step.travel_mode for step in self.steps)
+        object.__setattr__(self, "modes", modes)
+
+    @property
+    def mode(self) -> Optional[RouteTravelMode]:
+        """Travel mode shared by all steps, if any"""
+        modes = self.modes
+        return next(iter(modes)) if len(modes) == 1 else None
+
+
+def summarize_step(step: RouteLegStep) -> StepSummary:
+    if step.travel_mode != RouteTravelMode.TRANSIT:
+        return StepSummary(travel_mode=step.travel_mode)
+
+    details = step.transit_details
+    return StepSummary(
+        travel_mode=step.travel_mode,
+        vehicle=details.transit_line.vehicle.type_,
+        stops=details.stop_count,
+        origin=details.stop_details.departure_stop.name,
+        destination=details.stop_details.arrival_stop.name,
+    )
+
+
+def summarize_leg(leg: RouteLeg) -> LegSummary:
+    """Extract an immutable summary of a leg for fare estimation.
+    Args:
+        leg (RouteLeg): Leg from a Routes API response (left untouched).
+    Returns:
+        LegSummary: Summary shared by the fare estimators and the route parser.
+    """
+    return LegSummary(
+        start=location_to_tuple(leg.start_location),
+        end=location_to_tuple(leg.end_location),
+        distance=leg.distance_meters,
+        duration=leg.duration.seconds,
+        polyline=leg.polyline.encoded_polyline,
+        steps=tuple(summarize_step(step) for step in leg.steps or []),
+    )
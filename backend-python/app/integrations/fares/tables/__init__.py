@@ -0,0 +1,40 @@
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+
+TABLES_DIR = Path(__file__).parent
+MANIFEST_FILE = "manifest.json"
+
+
+@cache
+def _load_manifest() -> Dict[str, Dict[str, Any]]:
+    with open(TABLES_DIR / MANIFEST_FILE, encoding="utf-8") as file:
+        return json.load(file)
+
+
+@cache
+def load_table(name: str) -> np.ndarray:
+    """Memory-map a compiled fare table (read-only, mapped on first use).
+    Args:
+        name (str): Table name in the manifest (e.g. "macau_lrt_distances").
+    Returns:
+        np.ndarray: Table backed by the compiled .npy file.
+    Raises:
+        KeyError: If the table is not in the manifest.
+        ValueError: If the compiled file does not match the manifest.
+    """
+    entry = _load_manifest()[name]
+    table = np.load(TABLES_DIR / entry["file"], mmap_mode="r", allow_pickle=False)
+    if str(table.dtype) != entry["dtype"] or list(table.shape) != entry["shape"]:
+        raise ValueError(
+            f"Compiled fare table '{name}' does not match the manifest. "
+            "Rebuild it with: python -m app.integrations.fares.tables.build"
+        )
+    return table
+
+
+__all__ = ["TABLES_DIR", "MANIFEST_FILE", "load_table"]
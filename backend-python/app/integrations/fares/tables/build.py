@@ -0,0 +1,64 @@
+"""Compile the source fare tables into .npy files and a manifest.
+
+Usage: python -m app.integrations.fares.tables.build [--output <dir>]
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from . import MANIFEST_FILE, TABLES_DIR
+from .data import HONG_KONG_MTR_FARE_TABLE, MACAU_LRT_DISTANCE_TABLE
+
+
+# Table name -> (source rows, compiled dtype)
+SOURCES = {
+    "macau_lrt_distances": (MACAU_LRT_DISTANCE_TABLE, "uint8"),
+    "hong_kong_mtr_fares": (HONG_KONG_MTR_FARE_TABLE, "float32"),
+}
+
+
+def compile_table(rows: Any, dtype: str) -> np.ndarray:
+    """Convert source rows into a compact, C-contiguous array"""
+    return np.ascontiguousarray(np.asarray(rows, dtype=dtype))
+
+
+def build_tables(output: Path = TABLES_DIR) -> Dict[str, Dict[str, Any]]:
+    """Compile every source table into `output`.
+    Args:
+        output (Path): Directory for the .npy files and the manifest.
+    Returns:
+        dict: Manifest entries by table name (file, dtype, shape, sha256).
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    manifest = {}
+    for name, (rows, dtype) in SOURCES.items():
+        table = compile_table(rows, dtype)
+        np.save(output / f"{name}.npy", table, allow_pickle=False)
+        manifest[name] = {
+            "file": f"{name}.npy",
+            "dtype": str(table.dtype),
+            "shape": list(table.shape),
+            "sha256": hashlib.sha256(table.tobytes()).hexdigest(),
+        }
+    (output / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n")
+    return manifest
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile the offline fare tables.")
+    parser.add_argument(
+        "--output", type=Path, default=TABLES_DIR, help="Output directory"
+    )
+    args = parser.parse_args(argv)
+
+    manifest = build_tables(args.output)
+    print(f"Compiled {len(manifest)} fare tables to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Source fare tables, compiled into .npy files by build.py (not imported at runtime)."""
+
+# Stations between MACAU_LRT_STATIONS
+MACAU_LRT_DISTANCE_TABLE = [
+    [0, 2, 3, 4, 5, 6, 7, 8, 8, 9,10,11,12, 9, 9],
+    [2, 0, 1, 2, 3, 4, 5, 6, 6, 7, 8, 9,10, 7, 7],
+    [3, 1, 0, 1, 2, 3, 4, 5, 5, 6, 7, 8, 9, 6, 6],
+    [4, 2, 1, 0, 1, 2, 3, 4, 4, 5, 6, 7, 8, 5, 5],
+    [5, 3, 2, 1, 0, 1, 2, 3, 3, 4, 5, 6, 7, 4, 4],
+    [6, 4, 3, 2, 1, 0, 1, 2, 2, 3, 4, 5, 6, 3, 3],
+    [7, 5, 4, 3, 2, 1, 0, 1, 1, 2, 3, 4, 5, 2, 2],
+    [8, 6, 5, 4, 3, 2, 1, 0, 1, 2, 3, 4, 5, 1, 3],
+    [8, 6, 5, 4, 3, 2, 1, 1, 0, 1, 2, 3, 4, 2, 3],
+    [9, 7, 6, 5, 4, 3, 2, 2, 1, 0, 1, 2, 3, 3, 4],
+    [10,8, 7, 6, 5, 4, 3, 3, 2, 1, 0, 1, 2, 4, 5],
+    [11,9, 8, 7, 6, 5, 4, 4, 3, 2, 1, 0, 1, 5, 6],
+    [12,10,9, 8, 7, 6, 5, 5, 4, 3, 2, 1, 0, 6, 7],
+    [9, 7, 6, 5, 4, 3, 2, 1, 2, 3, 4, 5, 6, 0, 4],
+    [9, 7, 6, 5, 4, 3, 2, 3, 3, 4, 5, 6, 7, 4, 0],
+]  # fmt: skip
+
+
+# Approximate adult Octopus fares (HKD) between HONG_KONG_MTR_STATIONS
+HONG_KONG_MTR_FARE_TABLE = [
+    [ 0.0,  5.5,  6.0,  7.0,  8.0,  8.0, 10.5, 11.0, 12.0, 12.5, 13.5, 11.5, 11.0, 14.5, 14.5, 17.5, 17.0, 25.0, 17.5],
+    [ 5.5,  0.0,  5.5,  6.5,  7.5,  7.5, 10.5, 11.0, 12.0, 12.5, 13.5, 11.5, 11.0, 14.5, 14.0, 17.5, 17.5, 25.5, 18.5],
+    [ 6.0,  5.5,  0.0,  6.0,  7.5,  7.5, 10.5, 11.0, 12.5, 13.0, 13.5, 11.0, 11.5, 14.5, 14.0, 17.5, 17.5, 26.0, 19.0],
+    [ 7.0,  6.5,  6.0,  0.0,  6.5,  7.5, 10.5, 11.0, 12.0, 12.5, 13.5, 11.0, 11.5, 14.0, 13.0, 17.0, 18.0, 27.0, 19.5],
+    [ 8.0,  7.5,  7.5,  6.5,  0.0,  9.0, 11.0, 11.5, 12.0, 12.5, 13.0, 10.5, 12.0, 13.0, 11.5, 16.5, 18.0, 28.0, 20.5],
+    [ 8.0,  7.5,  7.5,  7.5,  9.0,  0.0, 13.0, 13.5, 14.5, 15.0, 16.0, 13.5, 13.5, 16.5, 15.5, 19.5, 20.0, 26.5, 20.0],
+    [10.5, 10.5, 10.5, 10.5, 11.0, 13.0,  0.0,  5.5,  6.5,  7.0,  8.0,  6.0,  6.0,  9.0,  9.0, 12.0, 12.5, 22.0, 14.5],
+    [11.0, 11.0, 11.0, 11.0, 11.5, 13.5,  5.5,  0.0,  6.0,  6.5,  7.5,  6.0,  5.5,  8.5,  9.0, 11.5, 11.5, 22.0, 14.5],
+    [12.0, 12.0, 12.5, 12.0, 12.0, 14.5,  6.5,  6.0,  0.0,  5.5,  6.5,  6.5,  6.5,  8.0,  9.0, 10.0, 11.0, 22.0, 14.0],
+    [12.5, 12.5, 13.0, 12.5, 12.5, 15.0,  7.0,  6.5,  5.5,  0.0,  6.0,  7.0,  6.5,  7.5,  9.5, 10.0, 10.5, 22.0, 14.0],
+    [13.5, 13.5, 13.5, 13.5, 13.0, 16.0,  8.0,  7.5,  6.5,  6.0,  0.0,  7.5,  8.0,  7.0,  9.0,  8.5, 10.0, 22.5, 15.0],
+    [11.5, 11.5, 11.0, 11.0, 10.5, 13.5,  6.0,  6.0,  6.5,  7.0,  7.5,  0.0,  6.5,  8.5,  8.5, 11.5, 12.5, 22.5, 15.0],
+    [11.0, 11.0, 11.5, 11.5, 12.0, 13.5,  6.0,  5.5,  6.5,  6.5,  8.0,  6.5,  0.0,  9.0, 10.0, 11.5, 11.5, 21.0, 13.5],
+    [14.5, 14.5, 14.5, 14.0, 13.0, 16.5,  9.0,  8.5,  8.0,  7.5,  7.0,  8.5,  9.0,  0.0,  8.0,  8.5, 11.5, 24.5, 16.5],
+    [14.5, 14.0, 14.0, 13.0, 11.5, 15.5,  9.0,  9.0,  9.0,  9.5,  9.0,  8.5, 10.0,  8.0,  0.0, 11.5, 14.5, 26.0, 18.5],
+    [17.5, 17.5, 17.5, 17.0, 16.5, 19.5, 12.0, 11.5, 10.0, 10.0,  8.5, 11.5, 11.5,  8.5, 11.5,  0.0, 10.0, 24.5, 16.5],
+    [17.0, 17.5, 17.5, 18.0, 18.0, 20.0, 12.5, 11.5, 11.0, 10.5, 10.0, 12.5, 11.5, 11.5, 14.5, 10.0,  0.0, 19.5, 12.0],
+    [25.0, 25.5, 26.0, 27.0, 28.0, 26.5, 22.0, 22.0, 22.0, 22.0, 22.5, 22.5, 21.0, 24.5, 26.0, 24.5, 19.5,  0.0, 13.0],
+    [17.5, 18.5, 19.0, 19.5, 20.5, 20.0, 14.5, 14.5, 14.0, 14.0, 15.0, 15.0, 13.5, 16.5, 18.5, 16.5, 12.0, 13.0,  0.0],
+]  # fmt: skip
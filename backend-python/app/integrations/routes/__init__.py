@@ -0,0 +1,11 @@
+from .client import RoutesClientManager, RoutesClientStats, routes_pool
+from .policy import CallPolicy, RoutesCaller, routes_caller
+
+__all__ = [
+    "RoutesClientManager",
+    "RoutesClientStats",
+    "routes_pool",
+    "CallPolicy",
+    "RoutesCaller",
+    "routes_caller",
+]
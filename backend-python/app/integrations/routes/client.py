@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from google.api_core.client_options import ClientOptions
+from google.maps import routing_v2
+
+from app.core.config import settings
+
+from .local import LocalRoutesClient, RoadGraph
+
+type RoutesClient = routing_v2.RoutesAsyncClient | LocalRoutesClient
+
+
+# Snapshot of pool usage
+@dataclass(frozen=True)
+class RoutesClientStats:
+    pool_size: int
+    channels_created: int
+    requests: int
+    requests_per_channel: List[int] = field(default_factory=list)
+
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests served by an already-open channel."""
+        if self.requests == 0:
+            return 0.0
+        return max(0.0, 1 - self.channels_created / self.requests)
+
+
+class RoutesClientManager:
+    def __init__(
+        self,
+        api_key: str,
+        pool_size: int = 1,
+        graph_path: Optional[str] = None,
+    ):
+        self.api_key = api_key
+        self.pool_size = max(1, pool_size)
+        self.graph_path = graph_path  # Local routing engine (WALK/DRIVE) if set
+        self.graph: Optional[RoadGraph] = None
+        self.clients: List[RoutesClient] = []
+        self._cursor = 0
+        self._channels_created = 0
+        self._requests: List[int] = []
+
+    def get_client(self) -> RoutesClient:
+        """
+        Get a pooled Routes client instance (round-robin over the pool).
+        """
+        if not self.clients:
+            self._open_pool()
+        idx = self._cursor % len(self.clients)
+        self._cursor = idx + 1
+        self._requests[idx] += 1
+        return self.clients[idx]
+
+    def stats(self) -> RoutesClientStats:
+        """
+        Get a snapshot of the pool usage counters.
+        """
+        return RoutesClientStats(
+            pool_size=self.pool_size,
+            channels_created=self._channels_created,
+            requests=sum(self._requests),
+            requests_per_channel=list(self._requests),
+        )
+
+    async def connect(self) -> None:
+        """
+        Open the client pool. Called once on startup.
+        """
+        if not self.clients:
+            self._open_pool()
+
+    async def close(self) -> None:
+        """
+        Close all pooled channels on shutdown.
+        """
+        clients, self.clients = self.clients, []
+        for client in clients:
+            await client.transport.close()
+        self._cursor = 0
+
+    def _open_pool(self) -> None:
+        options = ClientOptions(api_key=self.api_key)
+        self.clients = [
+            routing_v2.RoutesAsyncClient(client_options=options)
+            for _ in range(self.pool_size)
+        ]
+        if self.graph_path:  # Answer WALK/DRIVE locally, loading the graph once
+            self.graph = self.graph or RoadGraph.load(self.graph_path)
+            self.clients = [LocalRoutesClient(self.graph, c) for c in self.clients]
+        self._channels_created += len(self.clients)
+        self._requests = [0] * len(self.clients)
+
+
+routes_pool = RoutesClientManager(
+    api_key=settings.GOOGLE_MAPS_API_KEY,
+    pool_size=settings.ROUTES_CLIENT_POOL_SIZE,
+    graph_path=(
+        settings.LOCAL_ROUTING_GRAPH if settings.ROUTING_PROVIDER == "local" else None
+    ),
+)
@@ -0,0 +1,4 @@
+from .client import LocalRoutesClient
+from .graph import DRIVE, WALK, PathResult, RoadGraph
+
+__all__ = ["LocalRoutesClient", "RoadGraph", "PathResult", "WALK", "DRIVE"]
@@ -0,0 +1,206 @@
+"""Build a routing graph from an OpenStreetMap XML extract.
+
+Usage: python -m app.integrations.routes.local.build <extract.osm[.bz2]> <graph.npz>
+"""
+
+import argparse
+import bz2
+import re
+import xml.etree.ElementTree as ET
+from array import array
+from pathlib import Path
+from typing import IO, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.utils.geometry import haversine_array
+
+from .graph import DRIVE, WALK, RoadGraph
+
+
+# Default driving speeds by highway type (unit: km/h)
+DRIVE_SPEEDS = {
+    "motorway": 80,
+    "trunk": 70,
+    "primary": 50,
+    "secondary": 50,
+    "tertiary": 40,
+    "unclassified": 30,
+    "residential": 30,
+    "service": 15,
+    "living_street": 10,
+    "motorway_link": 50,
+    "trunk_link": 45,
+    "primary_link": 35,
+    "secondary_link": 35,
+    "tertiary_link": 30,
+}
+
+WALK_HIGHWAYS = {
+    "primary",
+    "secondary",
+    "tertiary",
+    "unclassified",
+    "residential",
+    "service",
+    "living_street",
+    "primary_link",
+    "secondary_link",
+    "tertiary_link",
+    "pedestrian",
+    "footway",
+    "path",
+    "steps",
+    "track",
+    "cycleway",
+    "corridor",
+}
+
+
+##### Tag Rules #####
+
+
+def _access(tags: Dict[str, str]) -> int:
+    highway = tags.get("highway")
+    flags = 0
+    if highway in WALK_HIGHWAYS and tags.get("foot") != "no":
+        flags |= WALK
+    restriction = tags.get("motor_vehicle", tags.get("access"))
+    if highway in DRIVE_SPEEDS and restriction not in ("no", "private"):
+        flags |= DRIVE
+    return flags
+
+
+def _speed(tags: Dict[str, str]) -> float:
+    """Driving speed in m/s, from `maxspeed` when numeric."""
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)", tags.get("maxspeed", ""))
+    kmh = float(match.group(1)) if match else DRIVE_SPEEDS.get(tags["highway"], 30)
+    return kmh / 3.6
+
+
+def _oneway(tags: Dict[str, str]) -> int:
+    """Driving direction: 1 (forward only), -1 (backward only) or 0 (both)."""
+    value = tags.get("oneway")
+    if value in ("yes", "true", "1"):
+        return 1
+    if value == "-1":
+        return -1
+    if value == "no":
+        return 0
+    if tags.get("junction") == "roundabout" or tags.get("highway") == "motorway":
+        return 1
+    return 0
+
+
+##### Builder #####
+
+
+def _open(path: Path) -> IO[bytes]:
+    return bz2.open(path, "rb") if path.suffix == ".bz2" else open(path, "rb")
+
+
+def build_graph(source: IO[bytes]) -> RoadGraph:
+    """Parse an OSM XML stream into a RoadGraph.
+    Args:
+        source (IO[bytes]): OSM XML byte stream.
+    Returns:
+        RoadGraph: Graph with walkable and drivable edges.
+    """
+    coords: Dict[int, Tuple[float, float]] = {}
+    sources, targets = array("q"), array("q")
+    flags, speeds = array("B"), array("f")
+
+    def _add_edge(a: int, b: int, access: int, speed: float) -> None:
+        sources.append(a)
+        targets.append(b)
+        flags.append(access)
+        speeds.append(speed if access & DRIVE else 0.0)
+
+    for _, element in ET.iterparse(source, events=("end",)):
+        if element.tag == "node":
+            coords[int(element.get("id"))] = (
+                float(element.get("lat")),
+                float(element.get("lon")),
+            )
+        elif element.tag == "way":
+            tags = {t.get("k"): t.get("v") for t in element.iter("tag")}
+            access = _access(tags) if "highway" in tags else 0
+            if access:
+                refs = [int(nd.get("ref")) for nd in element.iter("nd")]
+                speed = _speed(tags) if access & DRIVE else 0.0
+                oneway = _oneway(tags)
+                for a, b in zip(refs, refs[1:]):
+                    # Walking ignores driving direction restrictions
+                    forward = access if oneway >= 0 else access & ~DRIVE
+                    backward = access if oneway <= 0 else access & ~DRIVE
+                    if forward:
+                        _add_edge(a, b, forward, speed)
+                    if backward:
+                        _add_edge(b, a, backward, speed)
+        if element.tag in ("node", "way", "relation"):
+            element.clear()  # Keep memory flat while streaming
+
+    return _compact(coords, sources, targets, flags, speeds)
+
+
+def _compact(
+    coords: Dict[int, Tuple[float, float]],
+    sources: array,
+    targets: array,
+    flags: array,
+    speeds: array,
+) -> RoadGraph:
+    src_ids = np.frombuffer(sources, dtype=np.int64)
+    dst_ids = np.frombuffer(targets, dtype=np.int64)
+
+    # Drop edges referencing nodes missing from the extract
+    known = np.array(
+        [a in coords and b in coords for a, b in zip(src_ids, dst_ids)], dtype=bool
+    )
+    src_ids, dst_ids = src_ids[known], dst_ids[known]
+    edge_flags = np.frombuffer(flags, dtype=np.uint8)[known]
+    edge_speeds = np.frombuffer(speeds, dtype=np.float32)[known]
+
+    # Renumber used OSM node IDs to 0..N-1
+    node_ids, inverse = np.unique(
+        np.concatenate([src_ids, dst_ids]), return_inverse=True
+    )
+    src, dst = inverse[: len(src_ids)], inverse[len(src_ids) :]
+    lat = np.array([coords[int(n)][0] for n in node_ids], dtype=np.float64)
+    lon = np.array([coords[int(n)][1] for n in node_ids], dtype=np.float64)
+    lengths = haversine_array(lat[src], lon[src], lat[dst], lon[dst])
+
+    # Sort edges by source into CSR layout
+    order = np.argsort(src, kind="stable")
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=len(node_ids)), out=indptr[1:])
+
+    return RoadGraph(
+        lat=lat,
+        lon=lon,
+        indptr=indptr,
+        indices=dst[order],
+        lengths=lengths[order],
+        speeds=edge_speeds[order],
+        flags=edge_flags[order],
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Build a local routing graph from OSM."
+    )
+    parser.add_argument("source", type=Path, help="OSM XML extract (.osm or .osm.bz2)")
+    parser.add_argument("output", type=Path, help="Output graph file (.npz)")
+    args = parser.parse_args(argv)
+
+    with _open(args.source) as source:
+        graph = build_graph(source)
+    graph.save(args.output)
+    print(
+        f"Saved {graph.node_count} nodes and {graph.edge_count} edges to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import asyncio
+from datetime import timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from google.maps import routing_v2
+
+from app.utils.geometry import Coordinate, haversine
+from app.utils.polyline import encode_polyline
+
+from .graph import DRIVE, WALK, WALK_SPEED, RoadGraph
+
+
+ENGINE_MODES = {
+    routing_v2.RouteTravelMode.WALK: WALK,
+    routing_v2.RouteTravelMode.DRIVE: DRIVE,
+}
+
+
+class LocalRoutesClient:
+    """Drop-in for RoutesAsyncClient that answers WALK/DRIVE requests from a local
+    road graph. Other travel modes (TRANSIT) are forwarded to the fallback client.
+
+    Graph searches are CPU-bound, so they run in worker threads to keep the event
+    loop responsive.
+    """
+
+    def __init__(self, graph: RoadGraph, fallback: routing_v2.RoutesAsyncClient):
+        self.graph = graph
+        self.fallback = fallback
+
+    @property
+    def transport(self):
+        return self.fallback.transport
+
+    async def compute_routes(
+        self,
+        request: routing_v2.ComputeRoutesRequest,
+        metadata=(),
+        **kwargs,
+    ) -> routing_v2.ComputeRoutesResponse:
+        mode = ENGINE_MODES.get(request.travel_mode)
+        if mode is None:
+            return await self.fallback.compute_routes(
+                request=request, metadata=metadata, **kwargs
+            )
+
+        waypoints = [request.origin, *request.intermediates, request.destination]
+        legs = await asyncio.to_thread(
+            self._compute_legs, list(map(self._point, waypoints)), request.travel_mode
+        )
+        if legs is None:  # Unreachable: same as an empty API response
+            return routing_v2.ComputeRoutesResponse()
+
+        return routing_v2.ComputeRoutesResponse(
+            routes=[
+                routing_v2.Route(
+                    legs=legs,
+                    distance_meters=sum(leg.distance_meters for leg in legs),
+                    duration=sum((leg.duration for leg in legs), timedelta()),
+                )
+            ]
+        )
+
+    async def compute_route_matrix(
+        self,
+        request: routing_v2.ComputeRouteMatrixRequest,
+        metadata=(),
+        **kwargs,
+    ) -> AsyncIterator[routing_v2.RouteMatrixElement]:
+        mode = ENGINE_MODES.get(request.travel_mode)
+        if mode is None:
+            return await self.fallback.compute_route_matrix(
+                request=request, metadata=metadata, **kwargs
+            )
+
+        origins = [self._point(o.waypoint) for o in request.origins]
+        destinations = [self._point(d.waypoint) for d in request.destinations]
+        return self._matrix_elements(origins, destinations, mode)
+
+    ##### Helpers #####
+
+    @staticmethod
+    def _point(waypoint: routing_v2.Waypoint) -> Coordinate:
+        lat_lng = waypoint.location.lat_lng
+        return (lat_lng.latitude, lat_lng.longitude)
+
+    def _compute_legs(
+        self,
+        points: List[Coordinate],
+        travel_mode: routing_v2.RouteTravelMode,
+    ) -> Optional[List[routing_v2.RouteLeg]]:
+        legs: List[routing_v2.RouteLeg] = []
+        for origin, destination in zip(points, points[1:]):
+            leg = self._compute_leg(origin, destination, travel_mode)
+            if leg is None:
+                return None
+            legs.append(leg)
+        return legs
+
+    def _compute_leg(
+        self,
+        origin: Coordinate,
+        destination: Coordinate,
+        travel_mode: routing_v2.RouteTravelMode,
+    ) -> Optional[routing_v2.RouteLeg]:
+        mode = ENGINE_MODES[travel_mode]
+        source = self.graph.nearest_node(origin, mode)
+        target = self.graph.nearest_node(destination, mode)
+        if source is None or target is None:
+            return None
+        path = self.graph.route(source, target, mode)
+        if path is None:
+            return None
+
+        # Walk to/from the snapped nodes
+        access = haversine(origin, self.graph.coordinate(source)) + haversine(
+            destination, self.graph.coordinate(target)
+        )
+        points = [origin, *map(self.graph.coordinate, path.nodes), destination]
+
+        return routing_v2.RouteLeg(
+            distance_meters=round(path.distance + access),
+            duration=timedelta(seconds=round(path.duration + access / WALK_SPEED)),
+            polyline=routing_v2.Polyline(encoded_polyline=encode_polyline(points)),
+            start_location=self._location(origin),
+            end_location=self._location(destination),
+            steps=[routing_v2.RouteLegStep(travel_mode=travel_mode)],
+        )
+
+    def _matrix_costs(
+        self,
+        origins: List[Coordinate],
+        destinations: List[Coordinate],
+        mode: int,
+    ) -> Tuple[List[Optional[int]], List[Dict[int, Tuple[float, float]]]]:
+        """Snap the destinations and search from each origin."""
+        targets = [self.graph.nearest_node(d, mode) for d in destinations]
+        reachable = [t for t in targets if t is not None]
+        costs = []
+        for origin in origins:
+            source = self.graph.nearest_node(origin, mode)
+            costs.append(
+                self.graph.costs_from(source, reachable, mode)
+                if source is not None
+                else {}
+            )
+        return targets, costs
+
+    async def _matrix_elements(
+        self,
+        origins: List[Coordinate],
+        destinations: List[Coordinate],
+        mode: int,
+    ) -> AsyncIterator[routing_v2.RouteMatrixElement]:
+        targets, costs = await asyncio.to_thread(
+            self._matrix_costs, origins, destinations, mode
+        )
+        for o_idx, reachable in enumerate(costs):
+            for d_idx, target in enumerate(targets):
+                if target not in reachable:
+                    yield routing_v2.RouteMatrixElement(
+                        origin_index=o_idx,
+                        destination_index=d_idx,
+                        condition=routing_v2.RouteMatrixElementCondition.ROUTE_NOT_FOUND,
+                    )
+                    continue
+                duration, distance = reachable[target]
+                yield routing_v2.RouteMatrixElement(
+                    origin_index=o_idx,
+                    destination_index=d_idx,
+                    condition=routing_v2.RouteMatrixElementCondition.ROUTE_EXISTS,
+                    distance_meters=round(distance),
+                    duration=timedelta(seconds=round(duration)),
+                )
+
+    @staticmethod
+    def _location(point: Coordinate) -> routing_v2.Location:
+        return routing_v2.Location(
+            lat_lng={"latitude": point[0], "longitude": point[1]}
+        )
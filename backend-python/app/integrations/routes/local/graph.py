@@ -0,0 +1,266 @@
+import heapq
+import math
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.geometry import Coordinate, haversine, haversine_array
+
+
+# Edge access flags
+WALK, DRIVE = 1, 2
+
+WALK_SPEED = 1.4  # Unit: m/s (about 5 km/h)
+CELL_SIZE = 0.005  # Unit: degrees (about 500 m) for the nearest-node grid
+MAX_SNAP_RINGS = 20  # Give up snapping beyond ~10 km
+
+GRAPH_ARRAYS = ("lat", "lon", "indptr", "indices", "lengths", "speeds", "flags")
+
+
+@dataclass(frozen=True)
+class PathResult:
+    nodes: List[int]
+    distance: float  # Unit: meters
+    duration: float  # Unit: seconds
+
+
+class RoadGraph:
+    """Directed road network stored as compressed sparse row (CSR) arrays.
+
+    Node `n` owns edges `indptr[n]:indptr[n + 1]`; each edge has a target node
+    (`indices`), a length in meters, a driving speed in m/s and access flags.
+    """
+
+    def __init__(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        lengths: np.ndarray,
+        speeds: np.ndarray,
+        flags: np.ndarray,
+    ):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.indptr = np.asarray(indptr, dtype=np.int32)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.lengths = np.asarray(lengths, dtype=np.float32)
+        self.speeds = np.asarray(speeds, dtype=np.float32)
+        self.flags = np.asarray(flags, dtype=np.uint8)
+
+        # Compact array views for the search loops (cheaper scalar access than numpy)
+        self._indptr = array("i", self.indptr.tobytes())
+        self._indices = array("i", self.indices.tobytes())
+        self._lengths = array("f", self.lengths.tobytes())
+        self._lat = array("d", self.lat.tobytes())
+        self._lon = array("d", self.lon.tobytes())
+        self._costs: Dict[int, Tuple[array, float]] = {}
+
+        self._build_grid()
+
+    @property
+    def node_count(self) -> int:
+        return len(self.lat)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    ##### Persistence #####
+
+    @classmethod
+    def load(cls, path: str | Path) -> "RoadGraph":
+        with np.load(path) as data:
+            return cls(**{key: data[key] for key in GRAPH_ARRAYS})
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(path, **{key: getattr(self, key) for key in GRAPH_ARRAYS})
+
+    ##### Queries #####
+
+    def coordinate(self, node: int) -> Coordinate:
+        return (self._lat[node], self._lon[node])
+
+    def nearest_node(self, point: Coordinate, mode: int) -> Optional[int]:
+        """Snap a coordinate to the closest node with an edge usable in `mode`.
+        Args:
+            point (Coordinate): (latitude, longitude) to snap.
+            mode (int): Access flag (WALK or DRIVE).
+        Returns:
+            Optional[int]: Node index, or None if no usable node is nearby.
+        """
+        ci, cj = self._cell(point[0]), self._cell(point[1])
+        best, best_distance = None, math.inf
+        for ring in range(MAX_SNAP_RINGS + 1):
+            candidates = self._ring_nodes(ci, cj, ring)
+            candidates = candidates[(self._node_modes[candidates] & mode) != 0]
+            if len(candidates):
+                distances = haversine_array(
+                    point[0], point[1], self.lat[candidates], self.lon[candidates]
+                )
+                idx = int(np.argmin(distances))
+                if distances[idx] < best_distance:
+                    best, best_distance = int(candidates[idx]), float(distances[idx])
+            # Nodes beyond this ring are at least `ring` cells away
+            if best is not None and best_distance <= ring * self._cell_meters:
+                break
+        return best
+
+    def route(self, source: int, target: int, mode: int) -> Optional[PathResult]:
+        """Fastest path between two nodes using A* search.
+        Args:
+            source (int): Start node index.
+            target (int): End node index.
+            mode (int): Access flag (WALK or DRIVE).
+        Returns:
+            Optional[PathResult]: Path with its distance and duration, or None if unreachable.
+        """
+        costs, max_speed = self._mode_costs(mode)
+        indptr, indices = self._indptr, self._indices
+        target_point = self.coordinate(target)
+
+        def _heuristic(node: int) -> float:  # Admissible: straight line at top speed
+            return haversine(self.coordinate(node), target_point) / max_speed
+
+        best: Dict[int, float] = {source: 0.0}
+        previous: Dict[int, Tuple[int, int]] = {}  # node -> (parent, edge)
+        heap = [(_heuristic(source), 0.0, source)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == target:
+                return self._path(source, target, cost, previous)
+            if cost > best[node]:  # Stale entry
+                continue
+            for edge in range(indptr[node], indptr[node + 1]):
+                edge_cost = costs[edge]
+                if edge_cost == math.inf:
+                    continue
+                neighbor, new_cost = indices[edge], cost + edge_cost
+                if new_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = new_cost
+                    previous[neighbor] = (node, edge)
+                    heapq.heappush(
+                        heap, (new_cost + _heuristic(neighbor), new_cost, neighbor)
+                    )
+        return None
+
+    def costs_from(
+        self,
+        source: int,
+        targets: Sequence[int],
+        mode: int,
+    ) -> Dict[int, Tuple[float, float]]:
+        """One-to-many fastest paths using Dijkstra's algorithm (for matrices).
+        Args:
+            source (int): Start node index.
+            targets (Sequence[int]): Node indices to reach.
+            mode (int): Access flag (WALK or DRIVE).
+        Returns:
+            Dict[int, Tuple[float, float]]: Reachable target -> (duration, distance).
+        """
+        costs, _ = self._mode_costs(mode)
+        indptr, indices, lengths = self._indptr, self._indices, self._lengths
+        remaining = set(targets)
+        best: Dict[int, float] = {source: 0.0}
+        distance: Dict[int, float] = {source: 0.0}
+        results: Dict[int, Tuple[float, float]] = {}
+        heap = [(0.0, source)]
+        while heap and remaining:
+            cost, node = heapq.heappop(heap)
+            if cost > best[node]:  # Stale entry
+                continue
+            if node in remaining:
+                remaining.discard(node)
+                results[node] = (cost, distance[node])
+            for edge in range(indptr[node], indptr[node + 1]):
+                edge_cost = costs[edge]
+                if edge_cost == math.inf:
+                    continue
+                neighbor, new_cost = indices[edge], cost + edge_cost
+                if new_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = new_cost
+                    distance[neighbor] = distance[node] + lengths[edge]
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return results
+
+    ##### Helpers #####
+
+    def _mode_costs(self, mode: int) -> Tuple[array, float]:
+        """Per-edge travel time in seconds (inf if not allowed) and the top speed."""
+        if mode not in self._costs:
+            allowed = (self.flags & mode) != 0
+            speeds = (
+                np.full(self.edge_count, WALK_SPEED, dtype=np.float64)
+                if mode == WALK
+                else self.speeds.astype(np.float64)
+            )
+            costs = np.full(self.edge_count, np.inf)
+            usable = allowed & (speeds > 0)
+            costs[usable] = self.lengths[usable] / speeds[usable]
+            max_speed = float(speeds[usable].max()) if usable.any() else WALK_SPEED
+            self._costs[mode] = (array("d", costs.tobytes()), max_speed)
+        return self._costs[mode]
+
+    def _path(
+        self,
+        source: int,
+        target: int,
+        duration: float,
+        previous: Dict[int, Tuple[int, int]],
+    ) -> PathResult:
+        nodes, distance, node = [target], 0.0, target
+        while node != source:
+            node, edge = previous[node]
+            nodes.append(node)
+            distance += self._lengths[edge]
+        nodes.reverse()
+        return PathResult(nodes=nodes, distance=distance, duration=duration)
+
+    def _cell(self, degrees: float) -> int:
+        return math.floor(degrees / CELL_SIZE)
+
+    def _build_grid(self) -> None:
+        # Sort nodes by grid cell for range lookups
+        keys = self._cell_keys(
+            np.floor(self.lat / CELL_SIZE).astype(np.int64),
+            np.floor(self.lon / CELL_SIZE).astype(np.int64),
+        )
+        order = np.argsort(keys, kind="stable")
+        self._grid_keys = keys[order]
+        self._grid_nodes = order.astype(np.int32)
+        self._cell_meters = (
+            CELL_SIZE
+            * 111_000
+            * math.cos(
+                math.radians(float(np.mean(self.lat))) if self.node_count else 0.0
+            )
+        )
+
+        # Modes usable from each node (union of outgoing edge flags)
+        self._node_modes = np.zeros(self.node_count, dtype=np.uint8)
+        sources = np.repeat(np.arange(self.node_count), np.diff(self.indptr))
+        np.bitwise_or.at(self._node_modes, sources, self.flags)
+
+    @staticmethod
+    def _cell_keys(ci, cj):
+        return ci * 100_000 + cj  # |cj| < 36,000 for any longitude
+
+    def _ring_nodes(self, ci: int, cj: int, ring: int) -> np.ndarray:
+        cells = [
+            (ci + di, cj + dj)
+            for di in range(-ring, ring + 1)
+            for dj in range(-ring, ring + 1)
+            if max(abs(di), abs(dj)) == ring
+        ]
+        chunks = []
+        for i, j in cells:
+            key = self._cell_keys(i, j)
+            lo = np.searchsorted(self._grid_keys, key, side="left")
+            hi = np.searchsorted(self._grid_keys, key, side="right")
+            if hi > lo:
+                chunks.append(self._grid_nodes[lo:hi])
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
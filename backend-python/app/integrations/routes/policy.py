@@ -0,0 +1,151 @@
+import asyncio
+import random
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import grpc
+
+from app.core.config import settings
+
+
+type CallFactory[T] = Callable[[], Awaitable[T]]
+
+RETRYABLE_STATUS_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED,
+}
+
+
+# Call policy configuration
+@dataclass(frozen=True)
+class CallPolicy:
+    timeout: float = 10.0  # Per-attempt deadline (seconds)
+    max_retries: int = 2  # Retries after the first attempt
+    backoff_base: float = 0.2  # First retry delay (seconds), doubled per retry
+    backoff_max: float = 2.0  # Retry delay cap (seconds)
+    hedge_percentile: Optional[float] = None  # e.g. 95; None disables hedging
+    hedge_min_samples: int = 20  # Latency samples required before hedging
+
+    def __post_init__(self):
+        if self.max_retries < 0:  # Would skip every attempt
+            raise ValueError("max_retries (ROUTES_MAX_RETRIES) must be >= 0")
+
+    @classmethod
+    def from_settings(cls) -> "CallPolicy":
+        return cls(
+            timeout=settings.ROUTES_TIMEOUT,
+            max_retries=settings.ROUTES_MAX_RETRIES,
+            backoff_base=settings.ROUTES_RETRY_BACKOFF,
+            hedge_percentile=settings.ROUTES_HEDGE_PERCENTILE,
+        )
+
+
+class RoutesCaller:
+    """Runs Routes API calls with deadlines, retries and optional hedging."""
+
+    def __init__(self, policy: CallPolicy):
+        self.policy = policy
+        self.counters: Counter[str] = Counter()
+        self._latencies: deque[float] = deque(maxlen=512)  # Recent successes
+
+    async def call[T](self, factory: CallFactory[T]) -> T:
+        """Run a call under the policy.
+        Args:
+            factory (CallFactory[T]): Zero-argument callable starting a fresh call attempt.
+        Returns:
+            T: Result of the first successful attempt.
+        Raises:
+            Exception: The last error, once retries are exhausted or on a non-retryable error.
+        """
+        for attempt in range(self.policy.max_retries + 1):
+            try:
+                result = await self._attempt_hedged(factory)
+            except Exception as e:
+                if attempt == self.policy.max_retries or not self.is_retryable(e):
+                    self.counters["failure"] += 1
+                    raise
+                self.counters["retry"] += 1
+                await asyncio.sleep(self.backoff(attempt))
+            else:
+                self.counters["success"] += 1
+                return result
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get outcome counters (success, failure, retry, timeout, hedged, hedge_won).
+        """
+        return dict(self.counters)
+
+    @staticmethod
+    def is_retryable(error: Exception) -> bool:
+        if isinstance(error, TimeoutError):  # Local deadline
+            return True
+        return getattr(error, "grpc_status_code", None) in RETRYABLE_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given (zero-based) retry."""
+        cap = min(self.policy.backoff_max, self.policy.backoff_base * 2**attempt)
+        return random.uniform(cap / 2, cap)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Latency percentile after which a duplicate request is sent, if enabled."""
+        if self.policy.hedge_percentile is None:
+            return None
+        if len(self._latencies) < self.policy.hedge_min_samples:
+            return None
+        samples = sorted(self._latencies)
+        rank = round(self.policy.hedge_percentile / 100 * (len(samples) - 1))
+        return samples[min(max(rank, 0), len(samples) - 1)]
+
+    ##### Helpers #####
+
+    async def _attempt[T](self, factory: CallFactory[T]) -> T:
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.policy.timeout):
+                result = await factory()
+        except TimeoutError:
+            self.counters["timeout"] += 1
+            raise
+        self._latencies.append(time.perf_counter() - start)
+        return result
+
+    async def _attempt_hedged[T](self, factory: CallFactory[T]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._attempt(factory)
+
+        tasks = [asyncio.create_task(self._attempt(factory))]
+        try:
+            # Primary finished within the threshold
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+
+            # Race a duplicate request against the slow primary
+            self.counters["hedged"] += 1
+            tasks.append(asyncio.create_task(self._attempt(factory)))
+            pending, error = set(tasks), None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is tasks[1]:
+                            self.counters["hedge_won"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellations and retrieve the losers' errors
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+routes_caller = RoutesCaller(policy=CallPolicy.from_settings())
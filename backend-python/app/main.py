@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
@@ -11,18 +12,33 @@ from app.core.exceptions import (
     unhandled_exception_handler,
 )
 from app.core.mongo import db
+from app.integrations.routes import routes_pool
 from app.features.categories import categories_router
 from app.features.places import places_router
 from app.features.routing import routing_router
+from app.features.routing.warmup import RouteWarmer, warmup_loop
 from app.features.itinerary import itinerary_router
+from app.features.fares import fares_router
+from app.features.metrics import metrics_router
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     # Startup
     await db.connect()
+    await routes_pool.connect()
+    warmup = None
+    if settings.ROUTES_WARMUP_ENABLED:  # Precompute popular routes in the background
+        warmup = asyncio.create_task(
+            warmup_loop(RouteWarmer.from_settings(), settings.ROUTES_WARMUP_INTERVAL)
+        )
     yield
     # Shutdown
+    if warmup is not None:
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+    await routes_pool.close()
     await db.close()
 
 
@@ -53,3 +69,5 @@ app.include_router(categories_router, prefix="/categories", tags=["Categories"])
 app.include_router(places_router, prefix="/places", tags=["Places"])
 app.include_router(routing_router, prefix="/routes", tags=["Routes"])
 app.include_router(itinerary_router, prefix="/itinerary", tags=["Itinerary"])
+app.include_router(fares_router, prefix="/fares", tags=["Fares"])
+app.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
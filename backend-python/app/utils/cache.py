@@ -0,0 +1,145 @@
+import inspect
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .concurrency import SingleFlight
+
+
+MISSING = object()  # Sentinel for cache misses (None is a valid value)
+
+# Live caches by name, for metrics (dropped with their owner)
+_registry: "weakref.WeakValueDictionary[str, BoundedCache]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+class BoundedCache[K: Hashable, V]:
+    """In-process LRU cache bounded by entry count and, optionally, entry age."""
+
+    def __init__(self, name: str, max_size: int = 1024, ttl: Optional[float] = None):
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.ttl = ttl  # Unit: seconds (None: no expiry)
+        self.counters: Counter[str] = Counter()
+        self._entries: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()  # Sync routes run in the threadpool
+        _registry[name] = self
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """Get a cached value, counting the hit or miss.
+        Args:
+            key (K): Cache key.
+            default (Any): Returned on a miss (use `MISSING` when None can be cached).
+        Returns:
+            V | Any: Cached value, or `default` if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():  # Expired
+                del self._entries[key]
+                self.counters["expirations"] += 1
+                entry = None
+            if entry is None:
+                self.counters["misses"] += 1
+                return default
+            self._entries.move_to_end(key)  # Mark as recently used
+            self.counters["hits"] += 1
+            return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:  # Evict least recently used
+                self._entries.popitem(last=False)
+                self.counters["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Get counters (hits, misses, evictions, expirations), size and hit rate.
+        """
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.counters["hits"],
+            "misses": self.counters["misses"],
+            "evictions": self.counters["evictions"],
+            "expirations": self.counters["expirations"],
+            "hit_rate": self.counters["hits"] / lookups if lookups else 0.0,
+        }
+
+
+def memoize(
+    name: str,
+    max_size: int = 1024,
+    ttl: Optional[float] = None,
+    key: Optional[Callable[..., Hashable]] = None,
+) -> Callable[[Callable], Callable]:
+    """Memoize a sync or async function in a `BoundedCache`.
+    Args:
+        name (str): Cache name reported by `cache_stats`.
+        max_size (int): Maximum number of entries.
+        ttl (Optional[float]): Entry lifetime in seconds (None: no expiry).
+        key (Optional[Callable[..., Hashable]]): Builds the key from the call arguments\\
+                                                 (default: the arguments themselves).
+    Returns:
+        Callable: Decorator. The wrapper exposes `cache` and `cache_clear`.\\
+                  Concurrent async misses for the same key share one call.
+    """
+
+    def _key(args: tuple, kwargs: dict) -> Hashable:
+        if key is not None:
+            return key(*args, **kwargs)
+        return (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+    def decorator(func: Callable) -> Callable:
+        cache: BoundedCache = BoundedCache(name, max_size=max_size, ttl=ttl)
+
+        if inspect.iscoroutinefunction(func):
+            flight: SingleFlight = SingleFlight()
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                cache_key = _key(args, kwargs)
+                value = cache.get(cache_key, MISSING)
+                if value is MISSING:
+                    value = await flight.do(cache_key, lambda: func(*args, **kwargs))
+                    cache.set(cache_key, value)
+                return value
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                cache_key = _key(args, kwargs)
+                value = cache.get(cache_key, MISSING)
+                if value is MISSING:
+                    value = func(*args, **kwargs)
+                    cache.set(cache_key, value)
+                return value
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+def cache_stats() -> Dict[str, dict[str, int | float]]:
+    """
+    Get the stats of every live cache, by name.
+    """
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
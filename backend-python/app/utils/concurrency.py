@@ -0,0 +1,136 @@
+import asyncio
+from collections import Counter
+from functools import partial
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Tuple,
+)
+
+
+type AsyncFactory[T] = Callable[[], Awaitable[T]]
+
+
+async def gather_bounded[T](
+    factories: Iterable[AsyncFactory[T]],
+    limit: int,
+) -> List[T]:
+    """Run awaitables concurrently with at most `limit` of them in flight.
+    Args:
+        factories (Iterable[AsyncFactory[T]]): Zero-argument callables creating the awaitables.
+        limit (int): Maximum number of awaitables running at the same time.
+    Returns:
+        List[T]: Results in the same order as `factories`.
+    Raises:
+        Exception: The first exception raised by any awaitable. Pending siblings are cancelled.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(factory: AsyncFactory[T]) -> T:
+        async with semaphore:
+            return await factory()
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_run(factory)) for factory in factories]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0]  # Fail fast with the original error
+
+    return [task.result() for task in tasks]
+
+
+async def iterate_bounded[T](
+    factories: Iterable[AsyncFactory[T]],
+    limit: int,
+) -> AsyncIterator[Tuple[int, T]]:
+    """Run awaitables concurrently and yield results as soon as each completes.
+    Args:
+        factories (Iterable[AsyncFactory[T]]): Zero-argument callables creating the awaitables.
+        limit (int): Maximum number of awaitables running at the same time.
+    Yields:
+        Tuple[int, T]: (index in `factories`, result) in completion order.
+    Raises:
+        Exception: The first exception raised by any awaitable. Pending siblings are cancelled,\\
+                   as they are when the consumer stops iterating early.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(idx: int, factory: AsyncFactory[T]) -> Tuple[int, T]:
+        async with semaphore:
+            return idx, await factory()
+
+    tasks = [asyncio.create_task(_run(idx, f)) for idx, f in enumerate(factories)]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            yield await completed
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class SingleFlight[T]:
+    """Coalesces concurrent calls sharing a key into one in-flight computation."""
+
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+        self._calls: Dict[Hashable, asyncio.Task[T]] = {}
+
+    async def do(self, key: Hashable, factory: AsyncFactory[T]) -> T:
+        """Await the in-flight computation for `key`, starting it if there is none.
+        Args:
+            key (Hashable): Normalized identity of the computation.
+            factory (AsyncFactory[T]): Zero-argument callable creating the awaitable.
+        Returns:
+            T: Result shared by every caller that joined the same flight.
+        Raises:
+            Exception: The error raised by the shared computation, for every caller.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.counters["leader"] += 1
+            task = asyncio.create_task(factory())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._forget, key))
+        else:
+            self.counters["shared"] += 1
+
+        # A cancelled caller must not cancel the computation shared with others
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get counters (leader: computations started, shared: callers that joined one).
+        """
+        return {**self.counters, "in_flight": len(self._calls)}
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved if every caller went away
+
+
+class RateLimiter:
+    """Spaces out operations to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait until the next operation is allowed to start.
+        """
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+            if delay > 0:
+                await asyncio.sleep(delay)
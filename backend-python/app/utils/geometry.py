@@ -1,12 +1,21 @@
-from functools import cache
+import math
+from typing import Mapping, Optional, Sequence
 
-from polyline import decode
-from shapely.geometry import Point, Polygon
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import LineString, Point, Polygon
 from google.maps.routing_v2 import Location
 
+from .cache import memoize
+from .polyline import decode_polyline, encode_polyline
+
 
 type Coordinate = tuple[float, float]  # (lat, lon)
 
+EARTH_RADIUS = 6_371_008.8  # Unit: meters (mean radius)
+GEOFENCE_CACHE_SIZE = 256  # Static geofences only (route polylines are not cached)
+
 
 def location_to_tuple(location: Location) -> Coordinate:
     """
@@ -15,26 +24,180 @@ def location_to_tuple(location: Location) -> Coordinate:
     return (location.lat_lng.latitude, location.lat_lng.longitude)
 
 
-@cache
-def decode_polyline(polyline: str) -> list[Coordinate]:
+def haversine(a: Coordinate, b: Coordinate) -> float:
     """
-    Decode an encoded polyline string into a list of (latitude, longitude) tuples with caching.
+    Great-circle distance between two (latitude, longitude) coordinates in meters.
     """
-    return decode(polyline)
+    lat1, lon1, lat2, lon2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(h))
 
 
-def in_geofence(point: Coordinate, polyline: str) -> bool:
+def haversine_array(
+    lat1: np.ndarray,
+    lon1: np.ndarray,
+    lat2: np.ndarray,
+    lon2: np.ndarray,
+) -> np.ndarray:
     """
-    Check if a coordinate is inside or on the boundary of a polygon defined by an encoded polyline string.
+    Element-wise (broadcasting) great-circle distances in meters.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    h = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+@memoize("geometry.geofences", max_size=GEOFENCE_CACHE_SIZE)
+def geofence_polygon(polyline: str) -> Optional[Polygon]:
+    """
+    Build a prepared polygon from an encoded polyline string once (None if invalid).
     """
     coords = decode_polyline(polyline)
 
     # Invalid polygon
     if len(coords) < 3:
+        return None
+
+    # Shapely expects (lon, lat) rows
+    polygon = Polygon(coords[:, ::-1])
+    shapely.prepare(polygon)  # Speeds up repeated predicates
+    return polygon
+
+
+def in_geofence(point: Coordinate, polyline: str) -> bool:
+    """
+    Check if a coordinate is inside or on the boundary of a polygon defined by an encoded polyline string.
+    """
+    polygon = geofence_polygon(polyline)
+    if polygon is None:
         return False
+    return bool(shapely.intersects_xy(polygon, point[1], point[0]))
+
+
+def in_geofence_array(points: np.ndarray, polyline: str) -> np.ndarray:
+    """
+    Vectorized `in_geofence` for an (N, 2) array of (latitude, longitude) rows.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    polygon = geofence_polygon(polyline)
+    if polygon is None:
+        return np.zeros(len(points), dtype=bool)
+    return shapely.intersects_xy(polygon, points[:, 1], points[:, 0])
+
+
+class GeofenceIndex:
+    """Named geofences (encoded polylines) prepared once and indexed in an STRtree."""
+
+    def __init__(self, polylines: Mapping[str, str]):
+        valid = {
+            name: polygon
+            for name, polyline in polylines.items()
+            if (polygon := geofence_polygon(polyline)) is not None
+        }
+        self.names = tuple(valid)
+        self._polygons = np.array(list(valid.values()), dtype=object)
+        self._tree = STRtree(self._polygons)
+
+    def areas(self, point: Coordinate) -> frozenset[str]:
+        """
+        Names of all geofences containing a coordinate (inside or on the boundary).
+        """
+        target = Point(point[1], point[0])
+        hits = self._tree.query(target, predicate="intersects")
+        return frozenset(self.names[idx] for idx in hits)
+
+    def areas_along(self, path: Sequence[Coordinate]) -> frozenset[str]:
+        """
+        Names of all geofences crossed by a path of (latitude, longitude) coordinates.
+        """
+        if len(path) < 2:
+            return self.areas(tuple(path[0])) if len(path) else frozenset()
+        target = LineString(np.asarray(path, dtype=np.float64)[:, ::-1])
+        hits = self._tree.query(target, predicate="intersects")
+        return frozenset(self.names[idx] for idx in hits)
+
+    def contains(self, point: Coordinate, *areas: str) -> bool:
+        """
+        Check if a coordinate is within any of the named geofences.
+        """
+        return not self.areas(point).isdisjoint(areas)
+
+    def membership(self, points: np.ndarray) -> np.ndarray:
+        """Classify many coordinates against every geofence in one vectorized pass.
+        Args:
+            points (np.ndarray): (N, 2) array of (latitude, longitude) rows.
+        Returns:
+            np.ndarray: (N, M) boolean matrix; column j corresponds to `names[j]`.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        # Broadcast (1, M) polygons against (N, 1) points; boundary counts as inside
+        return shapely.intersects_xy(
+            self._polygons[np.newaxis, :],
+            points[:, 1, np.newaxis],
+            points[:, 0, np.newaxis],
+        )
+
+    def areas_many(self, points: np.ndarray) -> list[frozenset[str]]:
+        """
+        Names of the geofences containing each coordinate of an (N, 2) array.
+        """
+        names = np.array(self.names, dtype=object)
+        return [frozenset(names[row]) for row in self.membership(points)]
+
+
+##### Simplification #####
+
+
+def simplify_points(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Simplify a path with the Douglas-Peucker algorithm.
+    Args:
+        points (np.ndarray): (N, 2) array of (latitude, longitude) rows.
+        tolerance (float): Maximum deviation from the original path (unit: meters).
+    Returns:
+        np.ndarray: Subset of the original rows (first and last are always kept).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) < 3 or tolerance <= 0:
+        return points
+
+    # Local equirectangular projection (unit: meters): accurate at city scale
+    xy = np.radians(points[:, ::-1]) * EARTH_RADIUS
+    xy[:, 0] *= math.cos(math.radians(points[:, 0].mean()))
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        distances = _segment_distances(xy[first + 1 : last], xy[first], xy[last])
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = first + 1 + farthest
+            keep[split] = True
+            stack.extend(((first, split), (split, last)))
+    return points[keep]
+
+
+def simplify_polyline(polyline: str, tolerance: float) -> str:
+    """
+    Simplify an encoded polyline string (see `simplify_points`; tolerance in meters).
+    """
+    if tolerance <= 0:
+        return polyline
+    return encode_polyline(simplify_points(decode_polyline(polyline), tolerance))
 
-    # Shapely expects (lon, lat) tuples
-    polygon = Polygon([(lon, lat) for lat, lon in coords])
-    target = Point(point[1], point[0])
 
-    return polygon.contains(target) or polygon.touches(target)
+def _segment_distances(points: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Distances from projected points to the segment a-b
+    ab = b - a
+    length = float(ab @ ab)
+    t = np.clip((points - a) @ ab / length, 0.0, 1.0) if length else 0.0
+    return np.linalg.norm(points - (a + np.multiply.outer(t, ab)), axis=1)
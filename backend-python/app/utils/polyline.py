@@ -0,0 +1,67 @@
+import numpy as np
+
+
+PRECISION = 5  # Google Maps polylines: 5 decimal places
+
+# Encoding: 5-bit chunks, continuation flag 0x20, ASCII offset 63
+CHUNK_BITS, CHUNK_MASK, CONTINUE, OFFSET = 5, 0x1F, 0x20, 63
+MAX_CHUNKS = 7  # Enough for any 32-bit value
+
+
+def decode_polyline(polyline: str, precision: int = PRECISION) -> np.ndarray:
+    """Decode an encoded polyline string in one vectorized pass.
+    Args:
+        polyline (str): Encoded polyline string.
+        precision (int): Decimal places of the encoded coordinates.
+    Returns:
+        np.ndarray: (N, 2) float array of (latitude, longitude) rows.
+    """
+    chars = np.frombuffer(polyline.encode("ascii"), dtype=np.uint8)
+    if chars.size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+
+    # Split into values: a chunk without the continuation flag ends a value
+    chunks = chars.astype(np.int64) - OFFSET
+    ends = np.flatnonzero(chunks < CONTINUE)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    # Reassemble each value from its little-endian 5-bit chunks
+    value_index = np.repeat(np.arange(len(starts)), ends - starts + 1)
+    shifts = (np.arange(len(value_index)) - starts[value_index]) * CHUNK_BITS
+    values = np.add.reduceat((chunks[: ends[-1] + 1] & CHUNK_MASK) << shifts, starts)
+
+    # Zigzag-decoded deltas -> absolute coordinates
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    deltas = deltas[: len(deltas) // 2 * 2].reshape(-1, 2)
+    return np.cumsum(deltas, axis=0) / float(10**precision)
+
+
+def encode_polyline(points: np.ndarray, precision: int = PRECISION) -> str:
+    """Encode coordinates into a polyline string in one vectorized pass.
+    Args:
+        points (np.ndarray): (N, 2) array (or sequence) of (latitude, longitude) rows.
+        precision (int): Decimal places to keep.
+    Returns:
+        str: Encoded polyline string (same output as the `polyline` package).
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return ""
+
+    # Round half away from zero, then delta- and zigzag-encode
+    scaled = points * 10**precision
+    fixed = np.copysign(np.floor(np.abs(scaled) + 0.5), scaled).astype(np.int64)
+    deltas = np.diff(fixed, axis=0, prepend=0).ravel()
+    values = np.where(deltas < 0, ~(deltas << 1), deltas << 1)
+
+    # Split each value into 5-bit chunks; all but the last carry the continuation flag
+    chunks = (
+        values[:, np.newaxis] >> (np.arange(MAX_CHUNKS) * CHUNK_BITS)
+    ) & CHUNK_MASK
+    counts = 1 + np.count_nonzero(
+        values[:, np.newaxis] >> (np.arange(1, MAX_CHUNKS) * CHUNK_BITS), axis=1
+    )
+    positions = np.arange(MAX_CHUNKS)[np.newaxis, :]
+    flags = np.where(positions < counts[:, np.newaxis] - 1, CONTINUE, 0)
+    used = positions < counts[:, np.newaxis]
+    return (chunks + flags + OFFSET)[used].astype(np.uint8).tobytes().decode("ascii")
@@ -0,0 +1,242 @@
+"""Microbenchmarks for the per-leg fare hot paths.
+
+Usage: python -m benchmarks.fares [--save] [--baseline <file>] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from google.maps import routing_v2
+
+from app.core.common import Region
+from app.integrations.fares import compute_fares, summarize_leg
+from app.integrations.fares import macau as macau_module
+from app.integrations.fares.data import MACAU_GEOFENCE_POLYLINES
+from app.utils.geometry import in_geofence
+
+
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 0.25  # Allowed slowdown/growth before failing (25%)
+MIN_BYTES_SLACK = 256  # Ignore allocation noise on tiny numbers
+BATCH_SIZE = 1000
+ENVIRONMENT_KEY = "_environment"  # Baseline entry describing the recording host
+
+TravelMode = routing_v2.RouteTravelMode
+VehicleType = routing_v2.TransitVehicle.TransitVehicleType
+
+
+##### Fixtures #####
+
+
+def _location(lat: float, lng: float) -> routing_v2.Location:
+    return routing_v2.Location(lat_lng={"latitude": lat, "longitude": lng})
+
+
+def drive_leg(origin, destination, distance: int, duration: int) -> routing_v2.RouteLeg:
+    return routing_v2.RouteLeg(
+        start_location=_location(*origin),
+        end_location=_location(*destination),
+        distance_meters=distance,
+        duration=f"{duration}s",
+        steps=[routing_v2.RouteLegStep(travel_mode=TravelMode.DRIVE)],
+    )
+
+
+def transit_leg(*steps) -> routing_v2.RouteLeg:
+    """Leg from (vehicle, stops, origin, destination) tuples; None is a walk"""
+    return routing_v2.RouteLeg(steps=[_step(step) for step in steps])
+
+
+def _step(step) -> routing_v2.RouteLegStep:
+    if step is None:
+        return routing_v2.RouteLegStep(travel_mode=TravelMode.WALK)
+    vehicle, stops, origin, destination = step
+    details = routing_v2.RouteLegStepTransitDetails(
+        transit_line=routing_v2.TransitLine(
+            vehicle=routing_v2.TransitVehicle(type_=vehicle)
+        ),
+        stop_count=stops,
+        stop_details=routing_v2.RouteLegStepTransitDetails.TransitStopDetails(
+            departure_stop=routing_v2.TransitStop(name=origin),
+            arrival_stop=routing_v2.TransitStop(name=destination),
+        ),
+    )
+    return routing_v2.RouteLegStep(
+        travel_mode=TravelMode.TRANSIT, transit_details=details
+    )
+
+
+# Macau legs (same trips as the estimator tests)
+TAXI = drive_leg((22.198, 113.541), (22.187, 113.553), 3100, 520)  # Peninsula
+TAXI_PORT = drive_leg((22.158, 113.5743), (22.117, 113.5514), 6101, 701)  # Airport
+BUS = transit_leg(
+    None, (VehicleType.BUS, 6, "", ""), None, (VehicleType.BUS, 4, "", "")
+)
+LRT_MERGE = transit_leg(
+    (VehicleType.TRAM, 2, "Hengqin", "Posto Fronteiriço de Lótus"),
+    (VehicleType.TRAM, 2, "Posto Fronteiriço de Lótus", "Hospital Union"),
+    (VehicleType.TRAM, 2, "Hospital Union", "Est. Seak Pai Van / Praia Park"),
+)
+TAXI_BATCH = [TAXI, TAXI_PORT] * (BATCH_SIZE // 2)
+
+
+##### Cases #####
+
+
+@dataclass
+class Result:
+    ns_per_op: float
+    peak_bytes: int  # Peak memory allocated by one operation
+
+
+def _taxi(leg):
+    return lambda: macau_module.MacauTaxiFareEstimator.compute(summarize_leg(leg))
+
+
+def _transit(leg):
+    return lambda: macau_module.MacauTransitFareEstimator.compute(summarize_leg(leg))
+
+
+CASES: Dict[str, Callable[[], object]] = {
+    "taxi": _taxi(TAXI),
+    "taxi_port_surcharge": _taxi(TAXI_PORT),
+    "transit_bus": _transit(BUS),
+    "transit_lrt_merge": _transit(LRT_MERGE),
+    "in_geofence": lambda: in_geofence(
+        (22.158, 113.5743), MACAU_GEOFENCE_POLYLINES["AIRPORT"]
+    ),
+    "station_key_exact": lambda: macau_module._get_station_key("Hospital Union"),
+    "station_key_partial": lambda: macau_module._get_station_key(
+        "Est. Seak Pai Van / Praia Park"
+    ),
+    f"taxi_batch_{BATCH_SIZE}": lambda: compute_fares(
+        [Region.MACAU] * len(TAXI_BATCH), [summarize_leg(leg) for leg in TAXI_BATCH]
+    ),
+}
+
+
+##### Runner #####
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> Result:
+    """Time a case (best of `repeat`) and trace the memory it allocates.
+    Args:
+        func (Callable[[], object]): Zero-argument operation.
+        repeat (int): Timing rounds (the fastest one is reported).
+    Returns:
+        Result: Nanoseconds per operation and peak bytes allocated per operation.
+    """
+    func()  # Warm caches and lazy tables
+
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(ns_per_op=best / number * 1e9, peak_bytes=max(0, peak - base))
+
+
+def environment() -> Dict[str, str]:
+    """
+    Describe the host and interpreter (timings only compare on the same ones).
+    """
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def compare(
+    results: Dict[str, Result],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """List the cases that regressed against a baseline.
+    Args:
+        results (Dict[str, Result]): Current results by case.
+        baseline (Dict[str, Dict[str, float]]): Stored results by case.
+        tolerance (float): Allowed relative growth of time and memory.
+    Returns:
+        List[str]: One message per regression (empty if none).
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result.ns_per_op > base["ns_per_op"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: {result.ns_per_op:,.0f} ns/op "
+                f"(baseline {base['ns_per_op']:,.0f})"
+            )
+        limit = max(
+            base["peak_bytes"] * (1 + tolerance), base["peak_bytes"] + MIN_BYTES_SLACK
+        )
+        if result.peak_bytes > limit:
+            regressions.append(
+                f"{name}: {result.peak_bytes:,} B/op (baseline {base['peak_bytes']:,})"
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the fare hot paths.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--save", action="store_true", help="Overwrite the baseline")
+    parser.add_argument("cases", nargs="*", help="Cases to run (default: all)")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    recorded = baseline.pop(ENVIRONMENT_KEY, None)
+    results = {name: measure(CASES[name]) for name in args.cases or CASES}
+
+    print(f"{'case':<24} {'ns/op':>12} {'B/op':>10} {'vs baseline':>12}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        change = f"{result.ns_per_op / base['ns_per_op'] - 1:+.0%}" if base else "new"
+        print(
+            f"{name:<24} {result.ns_per_op:>12,.0f} {result.peak_bytes:>10,} {change:>12}"
+        )
+
+    current = environment()
+    if args.save:
+        baseline.update({name: asdict(result) for name, result in results.items()})
+        baseline = {ENVIRONMENT_KEY: current, **baseline}
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+        return
+
+    if recorded != current:  # Absolute timings from another host mean nothing here
+        print(
+            f"Baseline recorded on {recorded or 'an unknown host'}, running on "
+            f"{current}: not comparing. Save a baseline on this host first.",
+            file=sys.stderr,
+        )
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
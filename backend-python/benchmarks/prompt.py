@@ -0,0 +1,195 @@
+"""Compare the full and compact itinerary prompts (size, and plan quality when live).
+
+Usage: python -m benchmarks.prompt [--places 30] [--days 3] [--live] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from bson import ObjectId
+
+from app.core.common import Category
+from app.features.itinerary.assigner import (
+    HeuristicAssigner,
+    HybridAssigner,
+    ModelAssigner,
+)
+from app.features.places.schemas import Hours, RegularHours
+from app.utils.geometry import haversine
+
+try:  # Optional: exact token counts (OpenAI tokenizer)
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except ImportError:
+    _ENCODING = None
+
+FORMATS = ("full", "compact")
+ASSIGNERS = {"model": ModelAssigner, "hybrid": HybridAssigner}
+CHARS_PER_TOKEN = 4  # Rough estimate without a tokenizer
+
+
+##### Fixtures #####
+
+
+def synthetic_places(count: int, seed: int = 0) -> List[SimpleNamespace]:
+    """Random places around Hong Kong (most with opening hours)."""
+    rng = random.Random(seed)
+    categories = list(Category)
+    places = []
+    for idx in range(count):
+        open_days = [day for day in range(7) if rng.random() < 0.85]
+        hours = Hours(
+            timezone="Asia/Hong_Kong",
+            regular=[
+                RegularHours(day=d, open="10:00", close="18:00") for d in open_days
+            ],
+        )
+        places.append(
+            SimpleNamespace(
+                id=ObjectId(),
+                name=f"Sample Attraction {idx}",
+                category=rng.choice(categories),
+                location=SimpleNamespace(
+                    latitude=22.2 + rng.random() * 0.2,
+                    longitude=114.0 + rng.random() * 0.25,
+                ),
+                hours=hours if rng.random() < 0.8 else None,
+            )
+        )
+    return places
+
+
+##### Metrics #####
+
+
+def count_tokens(text: str) -> int:
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    return len(text) // CHARS_PER_TOKEN
+
+
+def route_length(assignments: List[List[ObjectId]], places) -> float:
+    """Total in-day travel distance in km (straight lines)."""
+    by_id = {place.id: place for place in places}
+    total = 0.0
+    for day in assignments:
+        points = [by_id[pid].location for pid in day]
+        for a, b in zip(points, points[1:]):
+            total += haversine((a.latitude, a.longitude), (b.latitude, b.longitude))
+    return total / 1000
+
+
+def closed_visits(assignments, places, dates: List[date]) -> int:
+    """Visits on a day the place is closed."""
+    by_id = {place.id: place for place in places}
+    count = 0
+    for day_date, day in zip(dates, assignments):
+        weekday = (day_date.weekday() + 1) % 7  # Sunday is day 0
+        for pid in day:
+            hours = by_id[pid].hours
+            if hours and weekday not in {row.day % 7 for row in hours.regular}:
+                count += 1
+    return count
+
+
+def prompt_sizes(dates, places) -> Dict[str, Dict[str, int]]:
+    """Tokens per prompt (system and user messages) for each assigner and format."""
+    sizes = {}
+    for name, assigner in ASSIGNERS.items():
+        for prompt_format in FORMATS:
+            payload = assigner._build_payload(
+                dates, places, compact=prompt_format == "compact"
+            )
+            system, user = (message.content for message in payload.messages)
+            sizes[f"{name}/{prompt_format}"] = {
+                "system": count_tokens(system),
+                "user": count_tokens(user),
+            }
+    return sizes
+
+
+def _usage(raw: dict) -> Optional[int]:
+    # Prompt tokens reported by OpenAI or Gemini
+    if usage := raw.get("usage"):
+        return usage.get("prompt_tokens")
+    if usage := raw.get("usage_metadata"):
+        return usage.get("prompt_token_count")
+    return None
+
+
+async def live_run(dates, places, runs: int) -> None:
+    """Plan with the configured model in both formats and compare the results."""
+    print(
+        f"\n{'assigner':<16} {'ok':>4} {'tokens':>8} {'sec':>6} {'km':>8} {'closed':>7}"
+    )
+    for name, assigner_cls in ASSIGNERS.items():
+        for prompt_format in FORMATS:
+            assigner = assigner_cls(prompt_format=prompt_format)
+            generate = assigner._client.generate
+            usage: List[int] = []
+
+            async def _generate(payload):
+                response = await generate(payload)
+                if (tokens := _usage(response.raw)) is not None:
+                    usage.append(tokens)
+                return response
+
+            assigner._client.generate = _generate
+
+            ok, seconds, km, closed = 0, 0.0, 0.0, 0
+            for _ in range(runs):
+                start = time.perf_counter()
+                try:
+                    assignments = await assigner.assign(dates, places)
+                except RuntimeError:
+                    continue
+                seconds += time.perf_counter() - start
+                km += route_length(assignments, places)
+                closed += closed_visits(assignments, places, dates)
+                ok += 1
+
+            tokens = f"{sum(usage) / len(usage):,.0f}" if usage else "n/a"
+            n = max(ok, 1)
+            print(
+                f"{name + '/' + prompt_format:<16} {ok:>4} {tokens:>8} "
+                f"{seconds / n:>6.1f} {km / n:>8.1f} {closed / n:>7.1f}"
+            )
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare itinerary prompt formats.")
+    parser.add_argument("--places", type=int, default=30)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--live", action="store_true", help="Call the configured model")
+    parser.add_argument("--runs", type=int, default=3, help="Live runs per format")
+    args = parser.parse_args(argv)
+
+    places = synthetic_places(args.places)
+    dates = [date(2026, 1, 5) + timedelta(days=idx) for idx in range(args.days)]
+
+    unit = "tokens" if _ENCODING is not None else f"~tokens (chars/{CHARS_PER_TOKEN})"
+    print(f"{args.places} places, {args.days} days, {unit}")
+    print(f"{'prompt':<16} {'system':>8} {'user':>8} {'total':>8}")
+    for name, size in prompt_sizes(dates, places).items():
+        total = size["system"] + size["user"]
+        print(f"{name:<16} {size['system']:>8,} {size['user']:>8,} {total:>8,}")
+
+    # Reference: local solver on the same input
+    reference = HeuristicAssigner.assign(dates, places)
+    print(
+        f"\nheuristic route: {route_length(reference, places):.1f} km, "
+        f"{closed_visits(reference, places, dates)} closed visits"
+    )
+
+    if args.live:
+        asyncio.run(live_run(dates, places, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.exceptions import ErrorCode
+from app.features.fares.schemas import FareLeg
+from app.features.fares.service import FareService
+from app.integrations.fares import compute_fare
+
+
+##### Constants #####
+
+
+MACAU_TAXI = {  # U.M. -> Seac Pai Van
+    "region": "macau",
+    "start": [22.128, 113.5464],
+    "end": [22.130, 113.5632],
+    "distance": 3355,
+    "duration": 569,
+    "steps": [{"mode": "drive"}],
+}
+MACAU_TRANSIT = {
+    "region": "macau",
+    "start": [22.187, 113.531],
+    "end": [22.158, 113.553],
+    "distance": 4200,
+    "duration": 1200,
+    "steps": [
+        {"mode": "walk"},
+        {"mode": "transit", "vehicle": "bus"},
+        {"mode": "walk"},
+        {
+            "mode": "transit",
+            "vehicle": "tram",
+            "stops": 4,
+            "origin": "Barra",
+            "destination": "Estádio",
+        },
+    ],
+}
+HONG_KONG_TAXI = {  # Central -> Causeway Bay
+    "region": "hong-kong",
+    "start": [22.2820, 114.1580],
+    "end": [22.2845, 114.1805],
+    "distance": 5000,
+    "duration": 600,
+    "steps": [{"mode": "drive"}],
+}
+HONG_KONG_TRANSIT = {  # MTR only, no walking
+    "region": "hong-kong",
+    "start": [22.2820, 114.1580],
+    "end": [22.3190, 114.1695],
+    "distance": 6000,
+    "duration": 1100,
+    "steps": [
+        {
+            "mode": "transit",
+            "vehicle": "metro",
+            "stops": 5,
+            "origin": "Central",
+            "destination": "Mong Kok",
+        }
+    ],
+}
+HONG_KONG_WALK = {**HONG_KONG_TAXI, "steps": [{"mode": "walk"}]}
+MIXED = {**HONG_KONG_TAXI, "steps": [{"mode": "walk"}, {"mode": "drive"}]}
+
+
+##### Regular Requests #####
+
+
+@pytest.mark.asyncio
+async def test_estimate_fares(client: AsyncClient):
+    legs = [
+        MACAU_TAXI,
+        HONG_KONG_TRANSIT,
+        MACAU_TRANSIT,
+        HONG_KONG_TAXI,
+        HONG_KONG_WALK,
+        MIXED,
+    ]
+
+    # Status
+    response = await client.post("/fares/estimate", json={"legs": legs})
+    assert response.status_code == 200
+
+    # Content: same order as the request
+    assert response.json()["fares"] == [58.0, 12.0, 14.0, 60.5, 0.0, None]
+
+
+def test_estimate_matches_single_leg():
+    legs = [FareLeg.model_validate(leg) for leg in [MACAU_TAXI, HONG_KONG_TAXI] * 3]
+
+    # Batched estimates equal one-by-one estimates
+    expected = [compute_fare(leg.region, FareService.summarize(leg)) for leg in legs]
+    assert FareService.estimate(legs) == expected
+
+
+##### Invalid Requests #####
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "legs",
+    [
+        [],  # Empty
+        [{**MACAU_TAXI, "distance": -1}],  # Negative distance
+        [{**MACAU_TAXI, "start": [22.1]}],  # Not a coordinate
+        [{**MACAU_TAXI, "steps": [{"mode": "transit", "vehicle": "mixed"}]}],
+        [{**MACAU_TAXI, "steps": [{"mode": "transit"}]}],  # Transit without vehicle
+    ],
+)
+async def test_estimate_fares_invalid(client: AsyncClient, legs):
+    response = await client.post("/fares/estimate", json={"legs": legs})
+    assert response.status_code == 422
+    assert response.json()["code"] == ErrorCode.FARES_LEGS_FORMAT
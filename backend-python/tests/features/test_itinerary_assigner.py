@@ -1,8 +1,19 @@
+import json
 import pytest
-from datetime import date
+import random
+import numpy as np
+from datetime import date, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
-from app.features.itinerary.assigner import ModelAssigner, RoundRobinAssigner
+from app.core.config import settings
+from app.features.itinerary.assigner import (
+    HeuristicAssigner,
+    HybridAssigner,
+    ModelAssigner,
+    RoundRobinAssigner,
+)
+from app.features.itinerary.prompt import ItineraryPrompt
 from app.integrations.model.contracts import ModelResponse
 
 
@@ -14,6 +25,19 @@ class DummyClient:
         self.generate = AsyncMock(side_effect=responses)
 
 
+def _place(pid, lat, lng, open_days=None):
+    # open_days: weekday numbers (Sunday is 0); None means always open
+    hours = None
+    if open_days is not None:
+        regular = [SimpleNamespace(day=day) for day in open_days]
+        hours = SimpleNamespace(regular=regular)
+    location = SimpleNamespace(latitude=lat, longitude=lng)
+    category = SimpleNamespace(value="landmarks")
+    return SimpleNamespace(
+        id=pid, name=f"Place {pid}", category=category, location=location, hours=hours
+    )
+
+
 ##### ModelAssigner #####
 
 
@@ -24,6 +48,37 @@ def test_build_payload(test_places):
     assert payload.response_type == ModelAssigner.RESPONSE_SCHEMA
 
 
+def test_build_payload_compact(test_places):
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]  # Thursday, Friday
+    places = test_places[:3]
+    compact = ModelAssigner._build_payload(dates=dates, places=places, compact=True)
+    full = ModelAssigner._build_payload(dates=dates, places=places)
+
+    # Static instruction (cacheable prefix), data only in the user message
+    system, user = (message.content for message in compact.messages)
+    assert system == ItineraryPrompt.compact_instruction()
+    header, *rows = user.split("\n")
+    assert header == "DAYS (2): 1=Thu 2=Fri"
+
+    # One JSON object per place, with rounded coordinates
+    for idx, (row, place) in enumerate(zip(rows, places, strict=True)):
+        data = json.loads(row)
+        assert data["i"] == idx and data["n"] == place.name
+        assert data["ll"] == [
+            round(place.location.latitude, 3),
+            round(place.location.longitude, 3),
+        ]
+        assert len(data["o"]) == 7
+
+    assert len(user) < len(full.messages[1].content) / 2
+
+
+def test_prompt_open_days():
+    hours = SimpleNamespace(regular=[SimpleNamespace(day=day) for day in (1, 2, 3, 7)])
+    assert ItineraryPrompt._open_days(hours) == "SMTW---"  # Day 7 is Sunday
+    assert ItineraryPrompt._open_days(None) == "SMTWTFS"
+
+
 def test_parse_json():
     text = '```json\n{"assignments": [[0, 1]]}\n```'
     schema = ModelAssigner.RESPONSE_SCHEMA
@@ -73,6 +128,192 @@ def test_round_robin_assign(test_places):
     assert assignments == [[places[0].id, places[2].id], [places[1].id, places[3].id]]
 
 
+@pytest.mark.parametrize(
+    ("assignments", "expected_days", "expected"),
+    [
+        # Valid: unchanged
+        ([["a", "b"], ["c", "d"]], 2, [["a", "b"], ["c", "d"]]),
+        # Duplicates dropped (first occurrence wins)
+        ([["a", "b", "a"], ["c", "d", "b"]], 2, [["a", "b"], ["c", "d"]]),
+        # Missing place: next to the nearest place
+        ([["a", "b"], ["c"]], 2, [["a", "b"], ["c", "d"]]),
+        ([["b", "a"], ["d"]], 2, [["b", "a"], ["d", "c"]]),
+        # Missing places fill empty days first
+        ([["a", "b"], []], 2, [["a", "b"], ["c", "d"]]),
+        # Too many days: smallest day merged into its nearest day
+        ([["a", "b"], ["c"], ["d"]], 2, [["a", "b"], ["d", "c"]]),
+        # Too few days: padded, then filled
+        ([["a", "b", "c"]], 2, [["a", "b", "c"], ["d"]]),
+    ],
+)
+def test_repair_assignments(assignments, expected_days, expected):
+    # a-b near each other, c-d far from both (and near each other)
+    places = [
+        _place("a", 22.28, 114.15),
+        _place("b", 22.28, 114.16),
+        _place("c", 22.19, 113.54),
+        _place("d", 22.20, 113.55),
+    ]
+    dates = [date(2026, 1, 1) + timedelta(days=idx) for idx in range(expected_days)]
+    repaired = ModelAssigner._repair_assignments(assignments, dates, places)
+    assert repaired == expected
+    ModelAssigner._validate_assignments(repaired, expected_days, len(places))
+
+
+def test_repair_assignments_open_days():
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]  # Thursday, Friday
+    places = [
+        _place("a", 22.28, 114.15),
+        _place("b", 22.28, 114.16),
+        _place("c", 22.19, 113.54),
+        _place("d", 22.20, 113.55, open_days=[4]),  # Thursday only
+    ]
+    repair = ModelAssigner._repair_assignments
+
+    # Not into an empty day it is closed on
+    assert repair([["a", "b", "c"], []], dates, places) == [["a", "b", "c", "d"], []]
+    # Not next to the nearest place ("c") when that day is closed
+    assert repair([["a", "b"], ["c"]], dates, places) == [["a", "d", "b"], ["c"]]
+
+
+##### HeuristicAssigner #####
+
+
+def test_heuristic_assign_clusters():
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]
+    places = [
+        _place("mo-1", 22.19, 113.54),
+        _place("hk-1", 22.28, 114.16),
+        _place("mo-2", 22.20, 113.55),
+        _place("hk-2", 22.30, 114.17),
+    ]
+
+    # One day per area
+    assignments = HeuristicAssigner.assign(dates=dates, places=places)
+    assert sorted(map(sorted, assignments)) == [["hk-1", "hk-2"], ["mo-1", "mo-2"]]
+
+
+def test_heuristic_assign_shared_coordinates():
+    # Places at the same spot (e.g. shops in one mall) still seed distinct groups
+    labels = HeuristicAssigner._cluster(np.zeros((4, 4)), 2)
+    assert sorted(np.bincount(labels).tolist()) == [2, 2]
+    labels = HeuristicAssigner._cluster(np.zeros((3, 3)), 3)
+    assert sorted(labels.tolist()) == [0, 1, 2]
+
+    dates = [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+    places = [_place(pid, 22.28, 114.16) for pid in "abc"]
+    assignments = HeuristicAssigner.assign(dates=dates, places=places)
+    assert sorted(map(len, assignments)) == [1, 1, 1]
+
+
+def test_heuristic_assign_closed_days():
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]  # Thursday, Friday
+    places = [
+        _place("a", 22.28, 114.16, open_days=[5]),  # Friday only
+        _place("b", 22.28, 114.17),
+        _place("c", 22.29, 114.16, open_days=[0]),  # Closed on all trip days
+    ]
+
+    assignments = HeuristicAssigner.assign(dates=dates, places=places)
+    assert "a" in assignments[1]
+    assert sorted(pid for day in assignments for pid in day) == ["a", "b", "c"]
+
+
+def test_heuristic_assign_route_order():
+    # Points along a line, shuffled: the route visits them end to end
+    rng = random.Random(0)
+    points = [(22.28, 114.10 + 0.01 * idx) for idx in range(12)]
+    places = [_place(idx, *point) for idx, point in enumerate(points)]
+    rng.shuffle(places)
+
+    [route] = HeuristicAssigner.assign(dates=[date(2026, 1, 1)], places=places)
+    assert route in (list(range(12)), list(range(11, -1, -1)))
+
+
+def test_heuristic_assign_completeness():
+    rng = random.Random(1)
+    dates = [date(2026, 1, day) for day in range(1, 5)]
+    places = [
+        _place(idx, 22.2 + rng.random() * 0.2, 113.9 + rng.random() * 0.3)
+        for idx in range(60)
+    ]
+
+    # Every place once, balanced days
+    assignments = HeuristicAssigner.assign(dates=dates, places=places)
+    assert sorted(pid for day in assignments for pid in day) == list(range(60))
+    assert all(len(day) == 15 for day in assignments)
+
+    # More days than places: some days stay empty
+    assignments = HeuristicAssigner.assign(dates=dates, places=places[:2])
+    assert sorted(pid for day in assignments for pid in day) == [0, 1]
+    assert HeuristicAssigner.assign(dates=dates, places=[]) == [[], [], [], []]
+
+
+def test_heuristic_order():
+    places = [_place(idx, 22.28, 114.10 + 0.01 * idx) for idx in range(5)]
+
+    # Days and membership kept, each day reordered
+    ordered = HeuristicAssigner.order([[3, 0, 4], [], [2, 1]], places)
+    assert ordered[0] in ([0, 3, 4], [4, 3, 0])
+    assert ordered[1] == []
+    assert sorted(ordered[2]) == [1, 2]
+
+
+##### HybridAssigner #####
+
+
+@pytest.mark.asyncio
+async def test_assign_prompt_format(test_places, monkeypatch):
+    dates = [date(2026, 1, 1)]
+    places = test_places[:2]
+    response = ModelResponse(text='{"assignments": [[0, 1]]}', raw={})
+
+    # Format chosen per assigner, defaulting to the setting
+    monkeypatch.setattr(settings, "ITINERARY_PROMPT", "compact")
+    for assigner_cls in (ModelAssigner, HybridAssigner):
+        client = DummyClient(responses=[response])
+        await assigner_cls(client=client).assign(dates, places)
+        user = client.generate.await_args.args[0].messages[1].content
+        assert user.startswith("DAYS (1): 1=Thu")
+
+    client = DummyClient(responses=[response])
+    await ModelAssigner(client=client, prompt_format="full").assign(dates, places)
+    assert client.generate.await_args.args[0].messages[1].content.startswith("# Task")
+
+
+def test_hybrid_build_payload(test_places):
+    dates = [date(2026, 1, 1)]
+    hybrid = HybridAssigner._build_payload(dates=dates, places=test_places[:3])
+    full = ModelAssigner._build_payload(dates=dates, places=test_places[:3])
+
+    # Grouping only: much shorter than the full routing prompt
+    length = lambda payload: sum(len(m.content) for m in payload.messages)  # noqa: E731
+    assert length(hybrid) < length(full) / 2
+    assert "route" not in hybrid.messages[1].content.lower()
+    assert hybrid.response_type == ModelAssigner.RESPONSE_SCHEMA
+
+
+@pytest.mark.asyncio
+async def test_hybrid_assign():
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]
+    places = [_place(idx, 22.28, 114.10 + 0.01 * idx) for idx in range(4)]
+    places.append(_place(4, 22.19, 113.54))
+
+    # Model groups days in a zig-zag order: each day is reordered locally
+    response = ModelResponse(text='{"assignments": [[2, 0, 3, 1], [4]]}', raw={})
+    client = DummyClient(responses=[response])
+    assignments = await HybridAssigner(client=client).assign(dates, places)
+    assert assignments[0] in ([0, 1, 2, 3], [3, 2, 1, 0])
+    assert assignments[1] == [4]
+
+    # Grouping prompt sent
+    payload = client.generate.await_args.args[0]
+    assert (
+        payload.messages[0].content
+        == HybridAssigner._build_payload(dates, places).messages[0].content
+    )
+
+
 @pytest.mark.asyncio
 async def test_assign_retries(test_places):
     # Prepare
@@ -81,7 +322,7 @@ async def test_assign_retries(test_places):
 
     # Dummy responses
     success_response = ModelResponse(text='{"assignments": [[0], [1]]}', raw={})
-    error_response = ModelResponse(text='{"assignments": [[0], [0]]}', raw={})
+    error_response = ModelResponse(text='{"assignments": [[0], [1]', raw={})
 
     # Test: retries then succeeds
     success_client = DummyClient(responses=[error_response, success_response])
@@ -93,6 +334,19 @@ async def test_assign_retries(test_places):
     # Test: retries exhausted then fails with last error
     failed_client = DummyClient(responses=[error_response] * 3)
     failed_assigner = ModelAssigner(client=failed_client)
-    with pytest.raises(RuntimeError, match="Duplicate place assignment"):
+    with pytest.raises(RuntimeError, match="not valid JSON"):
         await failed_assigner.assign(dates=dates, places=places)
     assert failed_client.generate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_assign_repairs_without_retry(test_places):
+    dates = [date(2026, 1, 1), date(2026, 1, 2)]
+    places = test_places[:2]
+
+    # Near miss (duplicate and missing place): repaired, no second generation
+    response = ModelResponse(text='{"assignments": [[0], [0]]}', raw={})
+    client = DummyClient(responses=[response])
+    assignments = await ModelAssigner(client=client).assign(dates=dates, places=places)
+    assert assignments == [[places[0].id], [places[1].id]]
+    assert client.generate.await_count == 1
@@ -41,10 +41,20 @@ async def test_plan_itinerary_success(client: AsyncClient, test_places, monkeypa
 
     # Function call
     plan_mock.assert_awaited_once()
-    _dates, _places, _skip = plan_mock.await_args.kwargs.values()
+    _dates, _places, _skip, _assigner, _cache = plan_mock.await_args.kwargs.values()
     assert _dates == [today, today + timedelta(days=1)]  # Today and tomorrow
     assert [str(p.id) for p in _places] == ids[:3]
     assert _skip is True
+    assert _assigner is None  # Default from settings
+    assert _cache is True
+
+    # Assigner override
+    response = await client.post(
+        "/itinerary/plan", json={**params, "assigner": "heuristic", "use_cache": False}
+    )
+    assert response.status_code == 200
+    assert plan_mock.await_args.kwargs["assigner"] == "heuristic"
+    assert plan_mock.await_args.kwargs["use_cache"] is False
 
 
 ##### Exception Handling #####
@@ -76,6 +86,15 @@ async def test_plan_itinerary_exceptions(client: AsyncClient, test_places):
     assert response.status_code == 422
     assert response.json().get("code") == ErrorCode.ITINERARY_PLACES_FORMAT
 
+    # Invalid assigner
+    response = await client.post(
+        "/itinerary/plan",
+        json={"places": hk_ids, "start_date": today.isoformat(), "duration": 1}
+        | {"assigner": "magic"},
+    )
+    assert response.status_code == 422
+    assert response.json().get("code") == ErrorCode.ITINERARY_ASSIGNER_INVALID
+
     # Places across different regions
     response = await _request(places=[hk_ids[0], mo_ids[0]])
     assert response.status_code == 422
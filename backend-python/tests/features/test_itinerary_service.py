@@ -1,8 +1,12 @@
 import pytest
 from datetime import date, timedelta
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
-from app.features.itinerary.assigner import ModelAssigner
+from app.core.cache import MemoryCacheBackend
+from app.core.config import settings
+from app.features.itinerary import service as service_module
+from app.features.itinerary.assigner import HeuristicAssigner, ModelAssigner
+from app.features.itinerary.cache import PlanCache
 from app.features.itinerary.service import ItineraryService
 
 
@@ -15,6 +19,17 @@ yesterday = today - timedelta(days=1)
 week_ago = today - timedelta(days=7)
 
 
+##### Fixtures #####
+
+
+@pytest.fixture(autouse=True)
+def plan_cache(monkeypatch):
+    # Plan cache disabled unless a test adds backends
+    cache = PlanCache(backends=[])
+    monkeypatch.setattr(service_module, "plan_cache", cache)
+    return cache
+
+
 ##### Tests #####
 
 
@@ -61,6 +76,95 @@ async def test_plan(
     assert [p.places for p in plans] == expected_plan
 
 
+@pytest.mark.asyncio
+async def test_plan_assigner_selection(test_places, monkeypatch):
+    places = [p for p in test_places if p.region == "hong-kong"][:3]
+    model_mock = AsyncMock(return_value=[[p.id for p in places]])
+    monkeypatch.setattr(ModelAssigner, "assign", model_mock)
+
+    # Per-request choice: local solver, no model call
+    plans = await ItineraryService.plan([today], places, assigner="heuristic")
+    assert sorted(plans[0].places) == sorted(p.id for p in places)
+    model_mock.assert_not_awaited()
+
+    # Setting as default
+    monkeypatch.setattr(settings, "ITINERARY_ASSIGNER", "heuristic")
+    monkeypatch.setattr(HeuristicAssigner, "assign", lambda **kw: [[places[0].id]])
+    await ItineraryService.plan([today], places)
+    model_mock.assert_not_awaited()
+
+    # Request overrides the setting
+    await ItineraryService.plan([today], places, assigner="model")
+    model_mock.assert_awaited_once()
+
+    # Hybrid: model grouping, local ordering
+    order_mock = MagicMock(side_effect=lambda assignments, places: assignments)
+    monkeypatch.setattr(HeuristicAssigner, "order", order_mock)
+    plans = await ItineraryService.plan([today], places, assigner="hybrid")
+    assert model_mock.await_count == 2
+    order_mock.assert_called_once_with([[p.id for p in places]], places)
+    assert plans[0].places == [p.id for p in places]
+
+
+@pytest.mark.asyncio
+async def test_plan_cache(test_places, plan_cache, monkeypatch):
+    plan_cache.backends = [MemoryCacheBackend("test.plans", ttl=60, max_size=10)]
+    places = [p for p in test_places if p.region == "hong-kong"][:3]
+    assign_mock = AsyncMock(return_value=[[places[2].id, places[0].id], [places[1].id]])
+    monkeypatch.setattr(ModelAssigner, "assign", assign_mock)
+
+    # Miss, then hit for the same place set in another order (same weekdays)
+    first = await ItineraryService.plan(
+        [today, tomorrow], places, skip_past_dates=False
+    )
+    later = [today + timedelta(days=7), tomorrow + timedelta(days=7)]
+    second = await ItineraryService.plan(later, places[::-1], skip_past_dates=False)
+    assert assign_mock.await_count == 1
+    assert [p.places for p in second] == [p.places for p in first]
+    assert [p.date for p in second] == later
+
+    # Different weekdays, strategy, or bypass: new generation
+    await ItineraryService.plan([tomorrow, today], places, skip_past_dates=False)
+    await ItineraryService.plan(
+        [today, tomorrow], places, skip_past_dates=False, assigner="hybrid"
+    )
+    await ItineraryService.plan(
+        [today, tomorrow], places, skip_past_dates=False, use_cache=False
+    )
+    assert assign_mock.await_count == 4
+
+    # Local solver: never cached
+    await ItineraryService.plan([today], places, assigner="heuristic")
+    assert len(plan_cache.backends[0]._entries) == 3
+
+
+def test_plan_cache_key(monkeypatch):
+    ids = ["b", "a", "c"]
+    monday, tuesday = date(2026, 1, 5), date(2026, 1, 6)
+    monkeypatch.setattr(settings, "ITINERARY_PROMPT", "full")
+    monkeypatch.setattr(settings, "MODEL_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "OPENAI_MODEL", "gpt-4o-mini")
+
+    key = PlanCache.key("model", [monday, tuesday], ids)
+    assert key.startswith("model:full:openai:gpt-4o-mini:12:")
+    assert key == PlanCache.key(
+        "model", [monday + timedelta(days=7), tuesday], ids[::-1]
+    )
+    assert key != PlanCache.key("model", [tuesday, monday], ids)
+    assert key != PlanCache.key("hybrid", [monday, tuesday], ids)
+    assert key != PlanCache.key("model", [monday, tuesday], ids[:2])
+
+    # Prompt format and model are part of the key
+    keys = {key}
+    monkeypatch.setattr(settings, "ITINERARY_PROMPT", "compact")
+    keys.add(PlanCache.key("model", [monday, tuesday], ids))
+    monkeypatch.setattr(settings, "OPENAI_MODEL", "gpt-4o")
+    keys.add(PlanCache.key("model", [monday, tuesday], ids))
+    monkeypatch.setattr(settings, "MODEL_PROVIDER", "gemini")
+    keys.add(PlanCache.key("model", [monday, tuesday], ids))
+    assert len(keys) == 4
+
+
 @pytest.mark.asyncio
 async def test_plan_errors(test_places, monkeypatch):
     # Mock: ModelAssigner.assign
@@ -0,0 +1,56 @@
+import pytest
+from httpx import AsyncClient
+
+from app.integrations.fares.macau import MACAU_LRT_STATION_INDEX
+from app.integrations.routes import RoutesClientStats, routes_caller, routes_pool
+
+
+@pytest.mark.asyncio
+async def test_get_metrics(client: AsyncClient):
+    MACAU_LRT_STATION_INDEX.lookup("Posto Fronteiriço de Lótus")
+
+    # Status
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+
+    # Content: application caches with their counters
+    caches = response.json()["caches"]
+    assert {"geometry.geofences", "stations.macau_lrt.fallback"} <= caches.keys()
+    geofences = caches["geometry.geofences"]
+    assert geofences["size"] > 0
+    assert geofences["size"] <= geofences["max_size"]
+    assert set(geofences) >= {"hits", "misses", "evictions", "hit_rate"}
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_routes_client(client: AsyncClient, monkeypatch):
+    stats = RoutesClientStats(
+        pool_size=2, channels_created=2, requests=8, requests_per_channel=[4, 4]
+    )
+    monkeypatch.setattr(routes_pool, "stats", lambda: stats)
+
+    # Pool usage, including connection reuse
+    response = await client.get("/metrics")
+    assert response.json()["routes_client"] == {
+        "pool_size": 2,
+        "channels_created": 2,
+        "requests": 8,
+        "requests_per_channel": [4, 4],
+        "reuse_rate": 0.75,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_routes_calls(client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(routes_caller, "stats", lambda: {"success": 5, "retry": 2})
+
+    # Call outcomes (missing counters are zero)
+    response = await client.get("/metrics")
+    assert response.json()["routes_calls"] == {
+        "success": 5,
+        "failure": 0,
+        "retry": 2,
+        "timeout": 0,
+        "hedged": 0,
+        "hedge_won": 0,
+    }
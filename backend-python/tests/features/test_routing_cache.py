@@ -0,0 +1,78 @@
+import pytest
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.features.routing.cache import (
+    LegCache,
+    MemoryLegCacheBackend,
+    MongoLegCacheBackend,
+)
+from app.features.routing.schemas import DriveRoute, TravelMode
+
+
+##### Helpers #####
+
+
+def _route(distance: int = 100) -> DriveRoute:
+    return DriveRoute(
+        origin="507f1f77bcf86cd799439011",
+        destination="507f1f77bcf86cd799439012",
+        distance=distance,
+        duration=10,
+        polyline="abc",
+        fare=21.0,
+    )
+
+
+##### Tests #####
+
+
+def test_bucket():
+    cache = LegCache(backends=[], bucket_minutes=60)
+    monday = datetime(2026, 1, 5, 9, 15, tzinfo=settings.TIMEZONE)
+    next_monday = monday + timedelta(days=7, minutes=30)
+
+    # DRIVE/WALK: same hour of the week shares a bucket
+    drive = TravelMode.DRIVE
+    assert cache.bucket(drive, monday) == cache.bucket(drive, next_monday)
+    assert cache.bucket(drive, monday) != cache.bucket(drive, monday.replace(hour=10))
+
+    # TRANSIT: buckets are date-specific
+    transit = TravelMode.TRANSIT
+    assert cache.bucket(transit, monday) != cache.bucket(transit, next_monday)
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_lru_and_ttl(monkeypatch):
+    backend = MemoryLegCacheBackend(ttl=60, max_size=2)
+
+    # LRU eviction
+    await backend.set("a", _route(1))
+    await backend.set("b", _route(2))
+    await backend.get("a")  # Touch "a"
+    await backend.set("c", _route(3))
+    assert await backend.get("b") is None
+    assert (await backend.get("a")).distance == 1
+
+    # TTL expiry
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: 1e12)
+    assert await backend.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache(test_app):
+    memory = MemoryLegCacheBackend(ttl=60, max_size=10)
+    mongo = MongoLegCacheBackend(ttl=60, collection="test_route_cache")
+    cache = LegCache(backends=[memory, mongo])
+
+    # Shared tier round trip
+    await mongo.set("k", _route(42))
+    route = await cache.get("k")
+    assert isinstance(route, DriveRoute)
+    assert route.distance == 42 and route.fare == 21.0
+
+    # Promoted to the in-process tier
+    assert (await memory.get("k")).distance == 42
+
+    await cache.clear()
+    assert await cache.get("k") is None
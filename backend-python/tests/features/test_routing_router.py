@@ -1,10 +1,20 @@
+import json
 import pytest
 from httpx import AsyncClient
+from polyline import decode, encode
 from datetime import date, timedelta
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 from app.core.exceptions import ErrorCode
-from app.features.routing.schemas import TransitRoute, TravelMode
+from app.features.routing import router as router_module
+from app.features.routing.schemas import (
+    MatrixRequest,
+    RouteEvent,
+    RouteMatrix,
+    TransitRoute,
+    TravelMode,
+)
 from app.features.routing.service import RouteService
 
 
@@ -54,6 +64,118 @@ async def test_compute_routes_success(client: AsyncClient, test_places, monkeypa
     assert data["routes"][0]["polyline"] == "#%$"
 
 
+@pytest.mark.asyncio
+async def test_compute_routes_simplify(client: AsyncClient, test_places, monkeypatch):
+    # Prepare: a dense, almost straight polyline
+    ids = [str(p.id) for p in test_places if p.region == "hong-kong"][:2]
+    points = [(22.28 + i * 1e-4, 114.15 + (i % 2) * 1e-5) for i in range(200)]
+    route = TransitRoute(
+        origin=ids[0],
+        destination=ids[1],
+        distance=2200,
+        duration=600,
+        polyline=encode(points),
+    )
+    monkeypatch.setattr(RouteService, "compute", AsyncMock(return_value=[route]))
+
+    # Status
+    params = {"places": ids, "date": date.today().isoformat(), "simplify": 5}
+    response = await client.post("/routes/compute", json=params)
+    assert response.status_code == 200
+
+    # Content: endpoints only, computed route left untouched
+    polyline = response.json()["routes"][0]["polyline"]
+    original = decode(encode(points))
+    assert decode(polyline) == [original[0], original[-1]]
+    assert route.polyline == encode(points)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("application/x-ndjson", "application/x-ndjson"),
+        ("text/event-stream;q=0.5, application/x-ndjson", "application/x-ndjson"),
+        ("application/x-ndjson;q=0, text/event-stream", "text/event-stream"),
+        ("application/x-ndjson;q=0", None),  # Excluded
+        ("application/json, application/x-ndjson;q=0.9", None),  # Prefers JSON
+        ("*/*", None),
+        ("", None),
+    ],
+)
+def test_negotiate_stream(accept, expected):
+    request = SimpleNamespace(headers={"accept": accept})
+    assert router_module._negotiate_stream(request) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept", ["application/x-ndjson", "text/event-stream"])
+async def test_compute_routes_stream(
+    client: AsyncClient, test_places, monkeypatch, accept
+):
+    # Prepare
+    ids = [str(p.id) for p in test_places if p.region == "hong-kong"][:3]
+    today = date.today()
+
+    # Mock: RouteService.compute_stream (second leg finishes first)
+    async def fake_compute_stream(places, date, mode):
+        for leg in (1, 0):
+            route = TransitRoute(
+                origin=ids[leg],
+                destination=ids[leg + 1],
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            yield RouteEvent(leg=leg, route=route)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(RouteService, "compute_stream", fake_compute_stream)
+
+    # Status
+    params = {"places": ids, "date": today.isoformat()}
+    headers = {"Accept": accept}
+    response = await client.post("/routes/compute", json=params, headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(accept)
+
+    # Content: routes in completion order, then in-band error
+    if accept == "text/event-stream":
+        frames = [f for f in response.text.split("\n\n") if f]
+        events = [f.split("\n")[0].removeprefix("event: ") for f in frames]
+        payloads = [json.loads(f.split("\n")[1].removeprefix("data: ")) for f in frames]
+        assert events == ["route", "route", "error"]
+    else:
+        payloads = [json.loads(line) for line in response.text.splitlines()]
+    assert [p.get("leg") for p in payloads[:2]] == [1, 0]
+    assert payloads[0]["route"]["origin"] == ids[1]
+    assert payloads[2]["code"] == ErrorCode.ROUTES_COMPUTE_FAILED
+
+
+@pytest.mark.asyncio
+async def test_compute_route_matrix_success(
+    client: AsyncClient, test_places, monkeypatch
+):
+    # Prepare
+    ids = [str(p.id) for p in test_places if p.region == "hong-kong"][:2]
+    today = date.today()
+
+    # Mock: RouteService.compute_matrix
+    fake_matrix = RouteMatrix(durations=[[0, 60], [70, 0]], distances=[[0, 5], [6, 0]])
+    compute_mock = AsyncMock(return_value=fake_matrix)
+    monkeypatch.setattr(RouteService, "compute_matrix", compute_mock)
+
+    # Status
+    params = {"places": ids, "date": today.isoformat(), "mode": TravelMode.DRIVE}
+    response = await client.post("/routes/matrix", json=params)
+    assert response.status_code == 200
+
+    # Content
+    data = response.json()
+    assert data["places"] == ids
+    assert data["matrix"]["durations"] == [[0, 60], [70, 0]]
+    assert compute_mock.await_args.kwargs["mode"] == TravelMode.DRIVE
+
+
 ##### Exception Handling #####
 
 
@@ -97,3 +219,30 @@ async def test_compute_routes_exceptions(client: AsyncClient, test_places):
     response = await _request(places=[hk_ids[0], "507f1f77bcf86cd799439011"])
     assert response.status_code == 404
     assert response.json().get("code") == ErrorCode.ROUTES_PLACES_NOTFOUND
+
+    # Negative simplification tolerance
+    json = {"places": hk_ids, "date": today.isoformat(), "simplify": -1}
+    response = await client.post("/routes/compute", json=json)
+    assert response.status_code == 422
+    assert response.json().get("code") == ErrorCode.ROUTES_SIMPLIFY_INVALID
+
+
+@pytest.mark.asyncio
+async def test_compute_route_matrix_exceptions(client: AsyncClient, test_places):
+    hk_ids = [str(p.id) for p in test_places if p.region == "hong-kong"]
+    today = date.today().isoformat()
+
+    # Too many places
+    json = {"places": hk_ids[:1] * 51, "date": today}
+    response = await client.post("/routes/matrix", json=json)
+    assert response.status_code == 422
+    assert response.json().get("code") == ErrorCode.ROUTES_PLACES_FORMAT
+
+    # Places not found
+    json = {"places": [hk_ids[0], "507f1f77bcf86cd799439011"], "date": today}
+    response = await client.post("/routes/matrix", json=json)
+    assert response.status_code == 404
+    assert response.json().get("code") == ErrorCode.ROUTES_PLACES_NOTFOUND
+
+    # Matrices have no polylines to simplify
+    assert "simplify" not in MatrixRequest.model_fields
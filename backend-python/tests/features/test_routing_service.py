@@ -1,11 +1,22 @@
+import asyncio
 import pytest
 from datetime import datetime, date, time
 from types import SimpleNamespace
+from beanie import PydanticObjectId
 from google.maps.routing_v2 import RouteTravelMode, TransitVehicle
 
 from app.core.config import settings
+from app.features.routing.cache import leg_cache
 from app.features.routing.schemas import DriveRoute, TravelMode, Vehicle
 from app.features.routing.service import RouteService, Segment
+from app.integrations.fares import StepSummary
+
+
+@pytest.fixture(autouse=True)
+async def clear_leg_cache():
+    await leg_cache.clear()
+    yield
+    await leg_cache.clear()
 
 
 @pytest.mark.parametrize(
@@ -58,16 +69,36 @@ def test_create_segments(test_places):
     assert segments[0].departure == expected_departure[0]
     assert segments[1].departure == expected_departure[1]
 
-    # Verify drive mode
-    places = test_places + [test_places[0]]  # 11 places
+    # Verify drive mode (up to 25 intermediates per segment)
+    places = (test_places * 3)[:28]  # 28 places, no consecutive repeats
     segments = RouteService.create_segments(places, base_date, TravelMode.DRIVE)
 
     assert len(segments) == 2
-    assert segments[0].places == places[:10]
-    assert segments[1].places == places[9:]
+    assert segments[0].places == places[:27]
+    assert segments[1].places == places[26:]
     assert all(s.departure >= now for s in segments)
 
 
+def test_plan_segments(test_places):
+    base_date = date(2026, 1, 2)
+    a, b, c = test_places[:3]
+
+    # Consecutive repeats are dropped
+    plan = RouteService.plan_segments([a, a, b, b, b, c, a], base_date, TravelMode.WALK)
+    assert plan.places == [a, b, c, a]
+    assert plan.calls == 1
+
+    # Same coordinates under a different ID: zero-length leg
+    twin = b.model_copy(update={"id": PydanticObjectId()})
+    plan = RouteService.plan_segments([a, b, twin, c], base_date, TravelMode.TRANSIT)
+    assert plan.places == [a, b, c]
+    assert plan.calls == 2
+
+    # Nothing to route
+    plan = RouteService.plan_segments([a, a], base_date, TravelMode.DRIVE)
+    assert plan.calls == 0
+
+
 @pytest.mark.parametrize(
     ("steps", "expected"),  # step = list[vehicle_type]
     [
@@ -85,16 +116,10 @@ def test_extract_vehicle_mapping(steps, expected):
     # Helper to build a step with given vehicle type
     def _build_step(type):
         if type == "WALK":
-            mode = RouteTravelMode.WALK
-            type_ = TransitVehicle.TransitVehicleType.TRANSIT_VEHICLE_TYPE_UNSPECIFIED
-        else:
-            mode = RouteTravelMode.TRANSIT
-            type_ = TransitVehicle.TransitVehicleType[type]
-        return SimpleNamespace(
-            travel_mode=mode,
-            transit_details=SimpleNamespace(
-                transit_line=SimpleNamespace(vehicle=SimpleNamespace(type_=type_))
-            ),
+            return StepSummary(travel_mode=RouteTravelMode.WALK)
+        return StepSummary(
+            travel_mode=RouteTravelMode.TRANSIT,
+            vehicle=TransitVehicle.TransitVehicleType[type],
         )
 
     # Verify correctness
@@ -110,11 +135,16 @@ def test_extract_vehicle_mapping(steps, expected):
     ],
 )
 async def test_compute_segment(monkeypatch, test_places, step_modes, expected_mode):
-    # Mock: RoutesAsyncClient.compute_routes
+    # Mock: Pooled RoutesAsyncClient.compute_routes
     class FakeClient:
         async def compute_routes(self, request, metadata):
+            location = SimpleNamespace(
+                lat_lng=SimpleNamespace(latitude=22.2, longitude=113.5)
+            )
             legs = [
                 SimpleNamespace(
+                    start_location=location,
+                    end_location=location,
                     distance_meters=100 * (idx + 1),
                     duration=SimpleNamespace(seconds=10),
                     polyline=SimpleNamespace(encoded_polyline="poly"),
@@ -125,8 +155,8 @@ async def test_compute_segment(monkeypatch, test_places, step_modes, expected_mo
             return SimpleNamespace(routes=[SimpleNamespace(legs=legs)])
 
     monkeypatch.setattr(
-        "app.features.routing.service.routing_v2.RoutesAsyncClient",
-        lambda client_options: FakeClient(),
+        "app.features.routing.service.routes_pool.get_client",
+        lambda: FakeClient(),
     )
 
     # Run test
@@ -143,6 +173,81 @@ async def test_compute_segment(monkeypatch, test_places, step_modes, expected_mo
     assert routes[1].distance == 200  # Correctness
 
 
+@pytest.mark.asyncio
+async def test_compute_segment_cached(monkeypatch, test_places):
+    requested = []
+
+    # Mock: RouteService.request_segment
+    async def fake_request_segment(segment: Segment):
+        requested.append(segment.places)
+        return [
+            DriveRoute(
+                origin=segment.places[idx].id,
+                destination=segment.places[idx + 1].id,
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            for idx in range(len(segment.places) - 1)
+        ]
+
+    monkeypatch.setattr(RouteService, "request_segment", fake_request_segment)
+
+    def _segment(places):
+        departure = datetime(2026, 1, 2, 9, 0, tzinfo=settings.TIMEZONE)
+        return Segment(places=places, mode=TravelMode.DRIVE, departure=departure)
+
+    # Warm the middle leg only
+    await RouteService.compute_segment(_segment(test_places[1:3]))
+    assert requested == [test_places[1:3]]
+
+    # Only the span of uncached legs is requested
+    routes = await RouteService.compute_segment(_segment(test_places[:4]))
+    assert requested[-1] == test_places[:4]  # First and last legs missing
+    assert [r.origin for r in routes] == [p.id for p in test_places[:3]]
+
+    # Fully cached segment: no request
+    routes = await RouteService.compute_segment(_segment(test_places[:4]))
+    assert len(requested) == 2
+    assert len(routes) == 3
+
+
+@pytest.mark.asyncio
+async def test_compute_segment_cached_gap(monkeypatch, test_places):
+    limit = None  # Legs returned per request (None: all)
+
+    # Mock: RouteService.request_segment
+    async def fake_request_segment(segment: Segment):
+        pairs = list(zip(segment.places, segment.places[1:]))[:limit]
+        return [
+            DriveRoute(
+                origin=origin.id,
+                destination=destination.id,
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            for origin, destination in pairs
+        ]
+
+    monkeypatch.setattr(RouteService, "request_segment", fake_request_segment)
+
+    def _segment(places):
+        departure = datetime(2026, 1, 2, 9, 0, tzinfo=settings.TIMEZONE)
+        return Segment(places=places, mode=TravelMode.DRIVE, departure=departure)
+
+    # Warm the last leg
+    await RouteService.compute_segment(_segment(test_places[2:4]))
+
+    # Truncated response: cached legs are not joined across the gap
+    limit = 1
+    assert await RouteService.compute_segment(_segment(test_places[:4])) == []
+
+    # No route at all
+    limit = 0
+    assert await RouteService.compute_segment(_segment(test_places[1:4])) == []
+
+
 @pytest.mark.asyncio
 async def test_compute(monkeypatch, test_places):
     # Mock: RouteService.compute_segment
@@ -169,3 +274,144 @@ async def test_compute(monkeypatch, test_places):
     assert routes[0].destination == places[1].id
     assert routes[1].origin == places[1].id
     assert routes[1].destination == places[2].id
+
+
+@pytest.mark.asyncio
+async def test_compute_coalesced(monkeypatch, test_places):
+    requested = []
+
+    # Mock: RouteService.request_segment
+    async def fake_request_segment(segment: Segment):
+        requested.append(segment.places)
+        await asyncio.sleep(0.01)
+        return [
+            DriveRoute(
+                origin=segment.places[idx].id,
+                destination=segment.places[idx + 1].id,
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            for idx in range(len(segment.places) - 1)
+        ]
+
+    monkeypatch.setattr(RouteService, "request_segment", fake_request_segment)
+
+    # Identical concurrent requests: one upstream call
+    places = test_places[:3]
+    results = await asyncio.gather(
+        *(
+            RouteService.compute(places, date(2026, 1, 2), TravelMode.DRIVE)
+            for _ in range(3)
+        )
+    )
+    assert len(requested) == 1
+    assert results[0] == results[1] == results[2]
+    assert results[0] is not results[1]  # Callers get their own list
+
+    # Identical segments of different requests share one upstream call
+    await leg_cache.clear()
+    requested.clear()
+    segment = Segment(
+        places=places,
+        mode=TravelMode.WALK,
+        departure=datetime(2026, 1, 2, 9, 0, tzinfo=settings.TIMEZONE),
+    )
+    await asyncio.gather(
+        RouteService.compute_segment(segment),
+        RouteService.compute_segment(segment.model_copy()),
+    )
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_compute_stream(monkeypatch, test_places):
+    # Mock: RouteService.compute_segment
+    async def fake_compute_segment(segment: Segment):
+        return [
+            DriveRoute(
+                origin=segment.places[idx].id,
+                destination=segment.places[idx + 1].id,
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            for idx in range(len(segment.places) - 1)
+        ]
+
+    monkeypatch.setattr(RouteService, "compute_segment", fake_compute_segment)
+
+    # Run test: 4 places in transit mode = 3 segments
+    places = test_places[:4]
+    events = [
+        event
+        async for event in RouteService.compute_stream(
+            places, date(2026, 1, 2), TravelMode.TRANSIT
+        )
+    ]
+
+    assert sorted(e.leg for e in events) == [0, 1, 2]
+    assert all(e.route.origin == places[e.leg].id for e in events)
+
+    # Repeated places: leg indices still refer to the requested places
+    places = [test_places[0], test_places[0], test_places[1], test_places[2]]
+    places += [test_places[2], test_places[2], test_places[3]]
+    events = [
+        event
+        async for event in RouteService.compute_stream(
+            places, date(2026, 1, 2), TravelMode.TRANSIT
+        )
+    ]
+    assert sorted(e.leg for e in events) == [1, 2, 5]
+    assert all(e.route.origin == places[e.leg].id for e in events)
+    assert all(e.route.destination == places[e.leg + 1].id for e in events)
+
+
+@pytest.mark.parametrize(
+    ("count", "mode", "expected"),
+    [
+        (1, TravelMode.DRIVE, 0),  # Diagonal only
+        (25, TravelMode.DRIVE, 1),  # 625 elements
+        (26, TravelMode.DRIVE, 3),  # 25x25, 25x1, 1x25 (1x1 diagonal skipped)
+        (12, TravelMode.TRANSIT, 4),  # 10x10, 10x2, 2x10, 2x2
+    ],
+)
+def test_create_matrix_chunks(count, mode, expected):
+    chunks = RouteService.create_matrix_chunks(count, mode)
+    assert len(chunks) == expected
+    assert all(len(o) * len(d) <= 625 for o, d in chunks)
+
+
+@pytest.mark.asyncio
+async def test_compute_matrix(monkeypatch, test_places):
+    # Mock: Pooled RoutesAsyncClient.compute_route_matrix (streaming)
+    class FakeClient:
+        async def compute_route_matrix(self, request, metadata):
+            async def _stream():
+                for o in range(len(request.origins)):
+                    for d in range(len(request.destinations)):
+                        yield SimpleNamespace(
+                            origin_index=o,
+                            destination_index=d,
+                            status=SimpleNamespace(code=0),
+                            condition=1 if (o, d) != (0, 1) else 2,  # 0 -> 1: no route
+                            duration=SimpleNamespace(seconds=60 * (o + d)),
+                            distance_meters=100 * (o + d),
+                        )
+
+            return _stream()
+
+    monkeypatch.setattr(
+        "app.features.routing.service.routes_pool.get_client",
+        lambda: FakeClient(),
+    )
+
+    # Run test
+    places = test_places[:3]
+    matrix = await RouteService.compute_matrix(
+        places, date(2026, 1, 2), TravelMode.DRIVE
+    )
+
+    assert matrix.durations[0] == [0, None, 120]
+    assert matrix.distances[2][1] == 300
+    assert all(matrix.durations[i][i] == 0 for i in range(3))
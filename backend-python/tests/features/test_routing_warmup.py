@@ -0,0 +1,147 @@
+import pytest
+from datetime import date
+
+from app.core.common import Region
+from app.features.routing.cache import LegCache, MemoryLegCacheBackend
+from app.features.routing.schemas import DriveRoute, TravelMode
+from app.features.routing.service import RouteService, Segment
+from app.features.routing.warmup import WARMUP_HOURS, RouteWarmer, warmup_loop
+
+
+##### Helpers #####
+
+
+def _warmer(budget: int = 100, modes=(TravelMode.DRIVE,), days: int = 1):
+    cache = LegCache(backends=[MemoryLegCacheBackend(ttl=60, max_size=1000)])
+    return RouteWarmer(
+        cache=cache, top_k=3, modes=modes, days=days, budget=budget, rate=0
+    )
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    requested = []
+
+    # Mock: RouteService.fetch_segment
+    async def fake_fetch_segment(segment: Segment):
+        requested.append(segment)
+        return [
+            DriveRoute(
+                origin=segment.places[idx].id,
+                destination=segment.places[idx + 1].id,
+                distance=100,
+                duration=10,
+                polyline="abc",
+            )
+            for idx in range(len(segment.places) - 1)
+        ]
+
+    monkeypatch.setattr(RouteService, "fetch_segment", fake_fetch_segment)
+    return requested
+
+
+##### Tests #####
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 6])
+def test_tour(count):
+    tour = RouteWarmer.tour(count)
+    pairs = list(zip(tour, tour[1:]))
+
+    # Every ordered pair exactly once
+    expected = {(a, b) for a in range(count) for b in range(count) if a != b}
+    assert len(pairs) == len(expected)
+    assert set(pairs) == expected
+
+
+def test_departures():
+    warmer = _warmer(days=14)
+    start = date(2026, 1, 5)
+
+    # DRIVE/WALK buckets repeat weekly
+    assert len(warmer.departures(TravelMode.DRIVE, start)) == 7 * len(WARMUP_HOURS)
+
+    # TRANSIT buckets are date-specific
+    departures = warmer.departures(TravelMode.TRANSIT, start)
+    assert len(departures) == 14 * len(WARMUP_HOURS)
+    assert departures == sorted(departures)
+
+
+@pytest.mark.asyncio
+async def test_top_places(test_places):
+    places = await RouteWarmer.top_places(Region.HONG_KONG, 3)
+    assert [p.ranking for p in places] == sorted(p.ranking for p in places)
+    assert all(p.region == Region.HONG_KONG for p in places)
+    assert len(places) == 3
+
+
+@pytest.mark.asyncio
+async def test_run(test_places, requested):
+    warmer = _warmer()
+
+    # 3 places: 6 legs packed into one DRIVE request per departure bucket
+    report = await warmer.run(regions=[Region.MACAU], start=date(2026, 1, 5))
+    assert report.calls == len(WARMUP_HOURS)
+    assert report.legs == 6 * len(WARMUP_HOURS)
+    assert all(len(segment.places) == 7 for segment in requested)
+
+    # Warmed legs are served from the cache
+    origin, destination = requested[0].places[:2]
+    key = warmer.cache.key(
+        origin.id, destination.id, TravelMode.DRIVE, requested[0].departure
+    )
+    assert await warmer.cache.get(key) is not None
+
+    # Second run: nothing left to request
+    report = await warmer.run(regions=[Region.MACAU], start=date(2026, 1, 5))
+    assert report.calls == 0
+    assert report.skipped == len(WARMUP_HOURS)
+
+
+@pytest.mark.asyncio
+async def test_run_budget(test_places, requested):
+    warmer = _warmer(budget=4, modes=(TravelMode.TRANSIT,))
+
+    # TRANSIT: one leg per request, so the budget runs out
+    report = await warmer.run(regions=[Region.MACAU], start=date(2026, 1, 5))
+    assert report.calls == len(requested) == 4
+    assert report.exhausted
+
+    # Nearest departures go first
+    assert all(segment.departure.hour == 9 for segment in requested)
+
+
+@pytest.mark.asyncio
+async def test_run_budget_spent_skips_lookups(test_places, requested, monkeypatch):
+    warmer = _warmer(budget=0)
+    lookups = []
+
+    async def fake_get(key):
+        lookups.append(key)
+
+    monkeypatch.setattr(warmer.cache, "get", fake_get)
+
+    # No budget: no cache round trips either
+    report = await warmer.run(regions=[Region.MACAU], start=date(2026, 1, 5))
+    assert report.exhausted
+    assert not lookups and not requested
+
+
+@pytest.mark.asyncio
+async def test_run_cache_disabled(test_places, requested):
+    warmer = RouteWarmer(
+        cache=LegCache(backends=[]),
+        top_k=3,
+        modes=[TravelMode.DRIVE],
+        days=1,
+        budget=100,
+        rate=0,
+    )
+
+    # No cache to fill: no Routes API calls
+    report = await warmer.run(regions=[Region.MACAU], start=date(2026, 1, 5))
+    assert report.calls == 0
+    assert not requested
+
+    # The background loop exits instead of waking up every interval
+    await warmup_loop(warmer, interval=3600)
@@ -0,0 +1,70 @@
+import json
+import pytest
+
+from benchmarks import fares as benchmarks_module
+
+
+##### Cases #####
+
+
+@pytest.mark.parametrize(
+    ("case", "expected"),
+    [
+        ("taxi", 49.0),
+        ("taxi_port_surcharge", 87.0),  # Airport pickup
+        ("transit_bus", 12.0),
+        ("transit_lrt_merge", 8.0),  # One journey across interchanges
+        ("in_geofence", True),
+    ],
+)
+def test_cases_exercise_fares(case, expected):
+    assert benchmarks_module.CASES[case]() == expected
+
+
+##### Runner #####
+
+
+def test_measure():
+    result = benchmarks_module.measure(lambda: [0] * 1000, repeat=1)
+    assert result.ns_per_op > 0
+    assert result.peak_bytes >= 8000
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "fast": {"ns_per_op": 100.0, "peak_bytes": 1000},
+        "slow": {"ns_per_op": 100.0, "peak_bytes": 1000},
+        "heavy": {"ns_per_op": 100.0, "peak_bytes": 10000},
+    }
+    results = {
+        "fast": benchmarks_module.Result(ns_per_op=120.0, peak_bytes=1200),
+        "slow": benchmarks_module.Result(ns_per_op=130.0, peak_bytes=1000),
+        "heavy": benchmarks_module.Result(ns_per_op=100.0, peak_bytes=13000),
+        "new": benchmarks_module.Result(ns_per_op=1e9, peak_bytes=10**9),  # No baseline
+    }
+
+    regressions = benchmarks_module.compare(results, baseline, tolerance=0.25)
+    assert [message.split(":")[0] for message in regressions] == ["slow", "heavy"]
+
+
+def test_baseline_records_environment(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    benchmarks_module.main(["--save", "--baseline", str(baseline), "in_geofence"])
+
+    saved = json.loads(baseline.read_text())
+    assert saved[benchmarks_module.ENVIRONMENT_KEY] == benchmarks_module.environment()
+    assert set(saved[benchmarks_module.ENVIRONMENT_KEY]) >= {"node", "python"}
+    assert "in_geofence" in saved
+
+
+def test_baseline_from_other_host_not_compared(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    stale = {"node": "elsewhere", "python": "CPython 3.0.0"}
+    timings = {"in_geofence": {"ns_per_op": 0.001, "peak_bytes": 0}}  # Unbeatable
+    baseline.write_text(
+        json.dumps({benchmarks_module.ENVIRONMENT_KEY: stale, **timings})
+    )
+
+    # Warns instead of failing on another host's timings
+    benchmarks_module.main(["--baseline", str(baseline), "in_geofence"])
+    assert "not comparing" in capsys.readouterr().err
@@ -1,4 +1,14 @@
-from app.integrations.fares.data import MACAU_LRT_STATIONS, MACAU_LRT_DISTANCE_TABLE
+import json
+
+import numpy as np
+
+from app.integrations.fares.data import HONG_KONG_MTR_STATIONS, MACAU_LRT_STATIONS
+from app.integrations.fares.tables import MANIFEST_FILE, TABLES_DIR, load_table
+from app.integrations.fares.tables.build import SOURCES, build_tables
+from app.integrations.fares.tables.data import (
+    HONG_KONG_MTR_FARE_TABLE,
+    MACAU_LRT_DISTANCE_TABLE,
+)
 
 
 def test_lrt_distance_table_format():
@@ -15,3 +25,23 @@ def test_lrt_distance_table_format():
         for i in range(station_count)
         for j in range(station_count)
     )
+
+
+def test_mtr_fare_table_format():
+    station_count = len(HONG_KONG_MTR_STATIONS)
+    table = np.array(HONG_KONG_MTR_FARE_TABLE)
+    assert table.shape == (station_count, station_count)
+    assert (table == table.T).all()  # Symmetric
+    assert (np.diag(table) == 0).all()
+
+
+def test_compiled_tables_up_to_date(tmp_path):
+    # Rebuild with: python -m app.integrations.fares.tables.build
+    committed = json.loads((TABLES_DIR / MANIFEST_FILE).read_text())
+    assert build_tables(tmp_path) == committed
+
+    for name, (rows, dtype) in SOURCES.items():
+        table = load_table(name)
+        assert isinstance(table, np.memmap)  # Mapped, not parsed
+        assert table.dtype == dtype
+        assert table.tolist() == np.asarray(rows, dtype=dtype).tolist()
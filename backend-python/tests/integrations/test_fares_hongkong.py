@@ -0,0 +1,186 @@
+import pytest
+from google.maps.routing_v2 import RouteTravelMode, TransitVehicle
+from polyline import encode
+
+from app.core.common import Region
+from app.integrations.fares import LegSummary, StepSummary, compute_fare
+from app.integrations.fares import hongkong as hongkong_module
+
+
+##### Constants #####
+
+
+WALK = None  # No vehicle type for walking
+BUS = TransitVehicle.TransitVehicleType.BUS
+TRAM = TransitVehicle.TransitVehicleType.TRAM
+CABLE_CAR = TransitVehicle.TransitVehicleType.CABLE_CAR
+SUBWAY = TransitVehicle.TransitVehicleType.SUBWAY
+
+CENTRAL = (22.2820, 114.1580)
+CAUSEWAY_BAY = (22.2845, 114.1805)
+HUNG_HOM = (22.3025, 114.1810)
+MONG_KOK = (22.3190, 114.1695)
+SHA_TIN = (22.3825, 114.1870)
+TSUEN_WAN = (22.3735, 114.1175)
+TUNG_CHUNG = (22.2890, 113.9415)
+DISNEYLAND = (22.3155, 114.0450)
+
+
+##### Helpers #####
+
+
+def _drive_leg(origin, destination, distance, duration, path=None):
+    return LegSummary(
+        start=origin,
+        end=destination,
+        distance=distance,
+        duration=duration,
+        polyline=encode(path or [origin, destination]),
+        steps=(StepSummary(travel_mode=RouteTravelMode.DRIVE),),
+    )
+
+
+def _transit_step(vehicle, stops=0, origin="", destination=""):
+    return StepSummary(
+        travel_mode=RouteTravelMode.WALK
+        if vehicle is None
+        else RouteTravelMode.TRANSIT,
+        vehicle=vehicle,
+        stops=stops,
+        origin=origin,
+        destination=destination,
+    )
+
+
+##### Taxi #####
+
+
+@pytest.mark.parametrize(
+    ("tariff", "jumps", "expected"),
+    [
+        ("URBAN", 0, 29.0),  # Flag fare
+        ("URBAN", 15, 60.5),
+        ("URBAN", 35, 102.5),  # Threshold reached
+        ("URBAN", 140, 249.5),  # 35 jumps at $2.1, then $1.4
+        ("NEW_TERRITORIES", 30, 82.5),
+        ("LANTAU", 10, 43.0),
+    ],
+)
+def test_compute_meter_fare(tariff, jumps, expected):
+    estimator = hongkong_module.HongKongTaxiFareEstimator
+    fare = estimator._compute_meter_fare(hongkong_module.TAXI_TARIFFS[tariff], jumps)
+    assert fare == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ("origin", "destination", "expected"),
+    [
+        (TUNG_CHUNG, DISNEYLAND, "LANTAU"),
+        (SHA_TIN, TSUEN_WAN, "NEW_TERRITORIES"),
+        (CENTRAL, SHA_TIN, "URBAN"),  # Leaves the New Territories
+        (CENTRAL, MONG_KOK, "URBAN"),
+    ],
+)
+def test_select_tariff(origin, destination, expected):
+    estimator = hongkong_module.HongKongTaxiFareEstimator
+    assert estimator._select_tariff(origin, destination) == expected
+
+
+@pytest.mark.parametrize(
+    ("origin", "destination", "path", "expected"),
+    [
+        # 5 km at 30 km/h: 15 jumps, no tolls
+        (CENTRAL, CAUSEWAY_BAY, None, 60.5),
+        # Through the Cross-Harbour Tunnel (passenger pays the toll)
+        (CAUSEWAY_BAY, HUNG_HOM, [CAUSEWAY_BAY, (22.294, 114.181), HUNG_HOM], 110.5),
+    ],
+)
+def test_compute_taxi(origin, destination, path, expected):
+    leg = _drive_leg(origin, destination, 5000, 600, path)
+    assert hongkong_module.HongKongTaxiFareEstimator.compute(leg) == expected
+
+
+def test_compute_tolls_sparse_path():
+    # Only the tunnel portals in the polyline: the crossing is still detected
+    polyline = encode([CAUSEWAY_BAY, HUNG_HOM])
+    estimator = hongkong_module.HongKongTaxiFareEstimator
+    assert estimator._compute_tolls(polyline) == hongkong_module.TOLLS["CROSS_HARBOUR"]
+    assert estimator._compute_tolls(encode([MONG_KOK, HUNG_HOM])) == 0.0
+
+
+##### Transit #####
+
+
+@pytest.mark.parametrize(
+    ("steps", "expected"),  # step = (vehicle, stops?, origin?, destination?)
+    [
+        ([(WALK,)], 0),  # Walking only
+        ([(WALK,), (SUBWAY, 5, "Central", "Mong Kok"), (WALK,)], 12.0),
+        # Interchange at Admiralty: one journey
+        ([(SUBWAY, 1, "Central", "Admiralty"), (SUBWAY, 5, "Admiralty", "旺角")], 12.0),
+        # Linked stations: walking does not end the journey
+        (
+            [
+                (SUBWAY, 3, "香港", "Tsim Sha Tsui"),
+                (WALK,),
+                (SUBWAY, 2, "尖東", "紅磡"),
+            ],
+            11.5,
+        ),
+        ([(SUBWAY, 2, "Mong Kok", "Jordan"), (BUS,)], 14.0),  # MTR + bus
+        ([(TRAM,), (WALK,), (TRAM,)], 6.6),  # Two tram rides
+        ([(SUBWAY, 4, "Yau Tong", "Tiu Keng Leng")], 9.8),  # Not in table: estimate
+        ([(SUBWAY, 2, "Mong Kok", "Jordan"), (CABLE_CAR,)], None),  # No fare: unpriced
+    ],
+)
+def test_compute_transit(steps, expected):
+    leg = LegSummary(steps=tuple(_transit_step(*s) for s in steps))
+    assert hongkong_module.HongKongTransitFareEstimator.compute(leg) == expected
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "Kowloon Bay",  # Not Kowloon
+        "九龍灣",
+        "Sha Tin Wai",  # Not Sha Tin
+        "Mong Kok East",  # Not Mong Kok
+        "Tsuen Wan West",  # Not Tsuen Wan
+        "Hong Kong University",  # Not Central (alias "Hong Kong")
+    ],
+)
+def test_mtr_station_no_partial_match(name):
+    index = hongkong_module.HONG_KONG_MTR_STATION_INDEX
+    assert index.lookup(name) == hongkong_module.NOT_FOUND
+
+
+def test_mtr_station_exact_and_alias():
+    index = hongkong_module.HONG_KONG_MTR_STATION_INDEX
+    assert index.lookup("mong kok") == index.lookup("旺角") != hongkong_module.NOT_FOUND
+    assert index.lookup("Hong Kong") == index.lookup("Central")
+
+
+##### Registry #####
+
+
+def test_compute_fare_hong_kong():
+    drive = _drive_leg(CENTRAL, CAUSEWAY_BAY, 5000, 600)
+    assert compute_fare(Region.HONG_KONG, drive) == 60.5
+
+    transit = LegSummary(
+        steps=(_transit_step(WALK), _transit_step(SUBWAY, 5, "Central", "Mong Kok"))
+    )
+    assert compute_fare(Region.HONG_KONG, transit) == 12.0
+
+
+def test_compute_taxi_many():
+    legs = [
+        _drive_leg(CENTRAL, CAUSEWAY_BAY, 5000, 600),
+        _drive_leg(SHA_TIN, TSUEN_WAN, 8000, 900),
+        _drive_leg(CAUSEWAY_BAY, HUNG_HOM, 5000, 600),  # Tunnel toll
+    ]
+
+    # Batch estimates match single-leg estimates
+    estimator = hongkong_module.HongKongTaxiFareEstimator
+    assert estimator.compute_many(legs) == [estimator.compute(leg) for leg in legs]
+    assert estimator.compute_many([]) == []
@@ -1,7 +1,8 @@
 import pytest
-from types import SimpleNamespace
-from google.maps.routing_v2 import TransitVehicle
+from google.maps import routing_v2
+from google.maps.routing_v2 import RouteTravelMode, TransitVehicle
 
+from app.integrations.fares import LegSummary, StepSummary, summarize_leg
 from app.integrations.fares import macau as macau_module
 
 
@@ -16,17 +17,17 @@ TRAM = TransitVehicle.TransitVehicleType.TRAM
 ##### Helper Unit #####
 
 
-def test_compare_station_names():
-    assert macau_module._compare_station_names("Jogos da Ásia", "Jogos Da Ásia")
-    assert macau_module._compare_station_names("Lótus", "Posto Fronteiriço de Lótus")
-    assert not macau_module._compare_station_names("Cotai Oeste", "Cotai Leste")
-
-
 def test_get_station_key():
-    assert macau_module._get_station_key("Barra") != -1
-    assert macau_module._get_station_key("媽閣") != -1  # Chinese
-    assert macau_module._get_station_key("ESTÁDIO") != -1  # Uppercase + accents
-    assert macau_module._get_station_key("Universidade de Macau") == -1  # Invalid
+    get_key = macau_module._get_station_key
+    assert get_key("Barra") != -1
+    assert get_key("媽閣") != -1  # Chinese
+    assert get_key("ESTÁDIO") != -1  # Uppercase + accents
+    assert get_key("Universidade de Macau") == -1  # Invalid
+
+    # Spellings of the same station
+    assert get_key("Jogos da Ásia") == get_key("Jogos Da Ásia") != -1
+    assert get_key("Lótus") == get_key("Posto Fronteiriço de Lótus") != -1
+    assert get_key("Cotai Oeste") != get_key("Cotai Leste")
 
 
 ##### Estimator Integration #####
@@ -34,29 +35,25 @@ def test_get_station_key():
 
 class DummyDataFactory:
     @staticmethod
-    def location(lat, lng):
-        return SimpleNamespace(lat_lng=SimpleNamespace(latitude=lat, longitude=lng))
-
-    @classmethod
-    def drive_leg(cls, origin, destination, distance, duration):
-        return SimpleNamespace(
-            start_location=cls.location(lat=origin[0], lng=origin[1]),
-            end_location=cls.location(lat=destination[0], lng=destination[1]),
-            distance_meters=distance,
-            duration=SimpleNamespace(seconds=duration),
+    def drive_leg(origin, destination, distance, duration):
+        return LegSummary(
+            start=origin,
+            end=destination,
+            distance=distance,
+            duration=duration,
+            steps=(StepSummary(travel_mode=RouteTravelMode.DRIVE),),
         )
 
-    @classmethod
-    def transit_step(cls, vehicle, stops=0, origin=None, destination=None):
-        return SimpleNamespace(
-            transit_details=SimpleNamespace(
-                transit_line=SimpleNamespace(vehicle=SimpleNamespace(type_=vehicle)),
-                stop_count=stops,
-                stop_details=SimpleNamespace(
-                    departure_stop=SimpleNamespace(name=origin),
-                    arrival_stop=SimpleNamespace(name=destination),
-                ),
-            )
+    @staticmethod
+    def transit_step(vehicle, stops=0, origin="", destination=""):
+        return StepSummary(
+            travel_mode=RouteTravelMode.WALK
+            if vehicle is None
+            else RouteTravelMode.TRANSIT,
+            vehicle=vehicle,
+            stops=stops,
+            origin=origin,
+            destination=destination,
         )
 
 
@@ -74,6 +71,21 @@ def test_compute_taxi(origin, destination, distance, duration, expected):
     assert macau_module.MacauTaxiFareEstimator.compute(leg) == expected
 
 
+def test_compute_taxi_many():
+    trips = [
+        ((22.128, 113.5464), (22.130, 113.5632), 3355, 569),
+        ((22.158, 113.5743), (22.117, 113.5514), 6101, 701),
+        ((22.215, 113.5493), (22.119, 113.5693), 15220, 1439),
+    ]
+    legs = [DummyDataFactory.drive_leg(*trip) for trip in trips]
+
+    # Batch estimates match single-leg estimates
+    estimator = macau_module.MacauTaxiFareEstimator
+    assert estimator.compute_many(legs) == [58, 87, 170]
+    assert estimator.compute_many(legs) == [estimator.compute(leg) for leg in legs]
+    assert estimator.compute_many([]) == []
+
+
 @pytest.mark.parametrize(
     ("steps", "expected"),  # step = (vehicle, stops?, origin?, destination?)
     [
@@ -92,5 +104,37 @@ def test_compute_taxi(origin, destination, distance, duration, expected):
     ],
 )
 def test_compute_transit(steps, expected):
-    leg = SimpleNamespace(steps=[DummyDataFactory.transit_step(*s) for s in steps])
+    leg = LegSummary(steps=tuple(DummyDataFactory.transit_step(*s) for s in steps))
     assert macau_module.MacauTransitFareEstimator.compute(leg) == expected
+
+
+def test_compute_transit_leaves_leg_untouched():
+    # LRT-only leg as returned by the Routes API
+    def _lrt_step(stops, origin, destination):
+        return routing_v2.RouteLegStep(
+            travel_mode=RouteTravelMode.TRANSIT,
+            transit_details=routing_v2.RouteLegStepTransitDetails(
+                transit_line=routing_v2.TransitLine(
+                    vehicle=routing_v2.TransitVehicle(type_=TRAM)
+                ),
+                stop_count=stops,
+                stop_details=routing_v2.RouteLegStepTransitDetails.TransitStopDetails(
+                    departure_stop=routing_v2.TransitStop(name=origin),
+                    arrival_stop=routing_v2.TransitStop(name=destination),
+                ),
+            ),
+        )
+
+    leg = routing_v2.RouteLeg(
+        steps=[
+            _lrt_step(2, "Hengqin", "Posto Fronteiriço de Lótus"),
+            _lrt_step(2, "Posto Fronteiriço de Lótus", "Hospital Union"),
+            _lrt_step(2, "Hospital Union", "Est. Seak Pai Van / Praia Park"),
+        ]
+    )
+    original = routing_v2.RouteLeg.serialize(leg)
+
+    # Same fare on every run, and the proto is not modified
+    estimator = macau_module.MacauTransitFareEstimator
+    assert [estimator.compute(summarize_leg(leg)) for _ in range(2)] == [8, 8]
+    assert routing_v2.RouteLeg.serialize(leg) == original
@@ -0,0 +1,72 @@
+import pytest
+
+from app.integrations.fares.data import MACAU_LRT_STATION_ALIASES, MACAU_LRT_STATIONS
+from app.integrations.fares.stations import StationIndex, normalize_name
+
+
+##### Helpers #####
+
+
+def _index() -> StationIndex:
+    return StationIndex(MACAU_LRT_STATIONS, MACAU_LRT_STATION_ALIASES)
+
+
+def _key(name: str) -> int:
+    return next(i for i, names in enumerate(MACAU_LRT_STATIONS) if name in names)
+
+
+##### Tests #####
+
+
+def test_normalize_name():
+    assert normalize_name("Jogos da Ásia Oriental") == "jogosdaasiaoriental"
+    assert normalize_name("  ESTÁDIO ") == "estadio"
+    assert normalize_name("Est. Seac Pai Van / Praia") == "estseacpaivanpraia"
+    assert normalize_name("協和醫院") == "協和醫院"
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Barra", "Barra"),  # Exact
+        ("媽閣", "Barra"),  # Chinese
+        ("estadio", "Estádio"),  # Case + accents
+        ("Macau Stadium", "Estádio"),  # Alias
+        ("Posto Fronteiriço de Lótus", "Lótus"),  # Partial: known name inside
+        ("Jogos da Ásia", "Jogos da Ásia Oriental"),  # Partial: prefix of a name
+        ("Est. Seak Pai Van / Praia Park", "Seac Pai Van"),  # Alias inside
+        ("Hospitol Union", "Hospital Union"),  # Fuzzy: typo
+    ],
+)
+def test_lookup(name, expected):
+    assert _index().lookup(name) == _key(expected)
+
+
+def test_lookup_unmatched():
+    index = _index()
+    assert index.lookup("Universidade de Macau") == -1  # Unknown
+    assert index.lookup("Cotai") == -1  # Ambiguous: Cotai Oeste/Leste
+    assert index.lookup("Universidade de Macau") == -1
+
+    # Unmatched names are reported for extending the table
+    assert index.unmatched == {"Universidade de Macau": 2, "Cotai": 1}
+    assert index.stats()["unmatched"] == 3
+
+
+def test_lookup_unmatched_bounded():
+    index = StationIndex(MACAU_LRT_STATIONS, max_unmatched=2)
+    for name in ("Nowhere 1", "Nowhere 2", "Nowhere 3", "Nowhere 1"):
+        assert index.lookup(name) == -1
+
+    # Only the first distinct names are kept; every miss is still counted
+    assert index.unmatched == {"Nowhere 1": 2, "Nowhere 2": 1}
+    assert index.stats()["unmatched"] == 4
+
+
+def test_lookup_fallback_memoized():
+    index = _index()
+    for _ in range(3):
+        index.lookup("Posto Fronteiriço de Lótus")
+    stats = index.stats()
+    assert stats["fallback_misses"] == 1
+    assert stats["fallback_hits"] == 2
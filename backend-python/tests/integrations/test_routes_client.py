@@ -0,0 +1,59 @@
+import pytest
+from types import SimpleNamespace
+
+from app.integrations.routes import client as client_module
+from app.integrations.routes.client import RoutesClientManager
+
+
+##### Helpers #####
+
+
+class FakeRoutesClient:
+    instances = []
+
+    def __init__(self, client_options):
+        self.closed = False
+        self.transport = SimpleNamespace(close=self._close)
+        FakeRoutesClient.instances.append(self)
+
+    async def _close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    FakeRoutesClient.instances = []
+    monkeypatch.setattr(client_module.routing_v2, "RoutesAsyncClient", FakeRoutesClient)
+    return FakeRoutesClient
+
+
+##### RoutesClientManager #####
+
+
+@pytest.mark.asyncio
+async def test_pool_round_robin(fake_client):
+    manager = RoutesClientManager(api_key="dummy", pool_size=2)
+    await manager.connect()
+
+    # Channels are reused in turn
+    clients = [manager.get_client() for _ in range(5)]
+    assert len(fake_client.instances) == 2
+    assert clients[0] is clients[2] is clients[4]
+    assert clients[1] is clients[3]
+
+    # Usage counters
+    stats = manager.stats()
+    assert stats.channels_created == 2
+    assert stats.requests == 5
+    assert stats.requests_per_channel == [3, 2]
+    assert stats.reuse_rate == pytest.approx(0.6)
+
+
+@pytest.mark.asyncio
+async def test_pool_close(fake_client):
+    manager = RoutesClientManager(api_key="dummy", pool_size=3)
+    manager.get_client()  # Lazily opened
+
+    await manager.close()
+    assert manager.clients == []
+    assert all(c.closed for c in fake_client.instances)
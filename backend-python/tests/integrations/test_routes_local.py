@@ -0,0 +1,211 @@
+import asyncio
+import io
+import threading
+
+import pytest
+from google.maps import routing_v2
+
+from app.integrations.routes.local import DRIVE, WALK, LocalRoutesClient, RoadGraph
+from app.integrations.routes.local.build import build_graph
+
+
+# Four nodes on a line (about 111 m apart); B→C is a one-way road, C→D a footway
+OSM_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <node id="1" lat="22.2000" lon="114.1000"/>
+  <node id="2" lat="22.2010" lon="114.1000"/>
+  <node id="3" lat="22.2020" lon="114.1000"/>
+  <node id="4" lat="22.2030" lon="114.1000"/>
+  <way id="10">
+    <nd ref="1"/><nd ref="2"/>
+    <tag k="highway" v="residential"/>
+  </way>
+  <way id="11">
+    <nd ref="2"/><nd ref="3"/>
+    <tag k="highway" v="residential"/>
+    <tag k="oneway" v="yes"/>
+  </way>
+  <way id="12">
+    <nd ref="3"/><nd ref="4"/>
+    <tag k="highway" v="footway"/>
+  </way>
+</osm>
+"""
+
+
+##### Helpers #####
+
+
+@pytest.fixture
+def graph() -> RoadGraph:
+    return build_graph(io.BytesIO(OSM_XML))
+
+
+def _node(graph: RoadGraph, lat: float) -> int:
+    return graph.nearest_node((lat, 114.1000), WALK)
+
+
+def _waypoint(lat: float, lng: float) -> routing_v2.Waypoint:
+    return routing_v2.Waypoint(
+        location={"lat_lng": {"latitude": lat, "longitude": lng}}
+    )
+
+
+class FakeFallback:
+    def __init__(self):
+        self.requests = []
+
+    async def compute_routes(self, request, metadata=(), **kwargs):
+        self.requests.append(request)
+        return routing_v2.ComputeRoutesResponse()
+
+
+##### RoadGraph #####
+
+
+def test_build_graph(graph):
+    assert graph.node_count == 4
+    # Two-way residential and footway, one-way (drive) + two-way (walk) for B-C
+    assert graph.edge_count == 6
+
+
+def test_save_load(graph, tmp_path):
+    path = tmp_path / "graph.npz"
+    graph.save(path)
+    loaded = RoadGraph.load(path)
+    assert loaded.node_count == graph.node_count
+    assert loaded.edge_count == graph.edge_count
+
+
+def test_nearest_node(graph):
+    a, d = _node(graph, 22.2000), _node(graph, 22.2030)
+    assert graph.coordinate(a) == (22.2000, 114.1000)
+
+    # Footway nodes cannot be used to drive
+    assert graph.nearest_node((22.2031, 114.1000), DRIVE) != d
+    assert graph.nearest_node((22.2031, 114.1000), WALK) == d
+
+
+def test_route_walk(graph):
+    a, d = _node(graph, 22.2000), _node(graph, 22.2030)
+    path = graph.route(a, d, WALK)
+    assert path is not None
+    assert len(path.nodes) == 4
+    assert path.distance == pytest.approx(333.6, abs=1)
+    assert path.duration == pytest.approx(path.distance / 1.4, rel=1e-3)
+
+
+def test_route_oneway(graph):
+    a, b, c = (_node(graph, lat) for lat in (22.2000, 22.2010, 22.2020))
+    assert graph.route(a, c, DRIVE) is not None
+    assert graph.route(c, a, DRIVE) is None  # Against the one-way
+    assert graph.route(c, a, WALK) is not None  # Walking ignores it
+    assert graph.route(a, b, DRIVE).duration < graph.route(a, b, WALK).duration
+
+
+def test_costs_from(graph):
+    a, c, d = (_node(graph, lat) for lat in (22.2000, 22.2020, 22.2030))
+    results = graph.costs_from(a, [c, d], DRIVE)
+    assert set(results) == {c}  # The footway is not drivable
+    assert results[c][1] == pytest.approx(222.4, abs=1)
+
+
+##### LocalRoutesClient #####
+
+
+@pytest.mark.asyncio
+async def test_compute_routes(graph):
+    client = LocalRoutesClient(graph, fallback=FakeFallback())
+    request = routing_v2.ComputeRoutesRequest(
+        origin=_waypoint(22.2000, 114.1000),
+        destination=_waypoint(22.2030, 114.1000),
+        intermediates=[_waypoint(22.2010, 114.1000)],
+        travel_mode=routing_v2.RouteTravelMode.WALK,
+    )
+    response = await client.compute_routes(request=request)
+
+    route = response.routes[0]
+    assert len(route.legs) == 2
+    assert route.distance_meters == sum(leg.distance_meters for leg in route.legs)
+    leg = route.legs[0]
+    assert leg.distance_meters == pytest.approx(111, abs=1)
+    assert leg.polyline.encoded_polyline
+    assert leg.steps[0].travel_mode == routing_v2.RouteTravelMode.WALK
+
+
+@pytest.mark.asyncio
+async def test_compute_routes_unreachable(graph):
+    client = LocalRoutesClient(graph, fallback=FakeFallback())
+    request = routing_v2.ComputeRoutesRequest(
+        origin=_waypoint(22.2000, 114.1000),
+        destination=_waypoint(22.5000, 114.1000),  # Too far from the network
+        travel_mode=routing_v2.RouteTravelMode.DRIVE,
+    )
+    response = await client.compute_routes(request=request)
+    assert not response.routes
+
+
+@pytest.mark.asyncio
+async def test_compute_routes_transit_fallback(graph):
+    fallback = FakeFallback()
+    client = LocalRoutesClient(graph, fallback=fallback)
+    request = routing_v2.ComputeRoutesRequest(
+        origin=_waypoint(22.2000, 114.1000),
+        destination=_waypoint(22.2030, 114.1000),
+        travel_mode=routing_v2.RouteTravelMode.TRANSIT,
+    )
+    await client.compute_routes(request=request)
+    assert fallback.requests == [request]
+
+
+@pytest.mark.asyncio
+async def test_compute_route_matrix(graph):
+    client = LocalRoutesClient(graph, fallback=FakeFallback())
+    points = [_waypoint(22.2000, 114.1000), _waypoint(22.2030, 114.1000)]
+    request = routing_v2.ComputeRouteMatrixRequest(
+        origins=[{"waypoint": p} for p in points],
+        destinations=[{"waypoint": p} for p in points],
+        travel_mode=routing_v2.RouteTravelMode.WALK,
+    )
+    stream = await client.compute_route_matrix(request=request)
+    elements = [element async for element in stream]
+
+    assert len(elements) == 4
+    found = routing_v2.RouteMatrixElementCondition.ROUTE_EXISTS
+    assert all(element.condition == found for element in elements)
+    forward = next(
+        e for e in elements if e.origin_index == 0 and e.destination_index == 1
+    )
+    assert forward.distance_meters == pytest.approx(334, abs=1)
+
+
+@pytest.mark.asyncio
+async def test_compute_route_matrix_does_not_block_loop(graph):
+    client = LocalRoutesClient(graph, fallback=FakeFallback())
+    ticked = threading.Event()
+    costs_from = graph.costs_from
+
+    def _slow_costs_from(*args):
+        # Only finishes once the event loop has run another coroutine
+        assert ticked.wait(timeout=2), "event loop blocked during the search"
+        return costs_from(*args)
+
+    graph.costs_from = _slow_costs_from
+
+    async def _ticker():
+        await asyncio.sleep(0)
+        ticked.set()
+
+    point = _waypoint(22.2000, 114.1000)
+    request = routing_v2.ComputeRouteMatrixRequest(
+        origins=[{"waypoint": point}],
+        destinations=[{"waypoint": point}],
+        travel_mode=routing_v2.RouteTravelMode.WALK,
+    )
+
+    async def _matrix():
+        stream = await client.compute_route_matrix(request=request)
+        return [element async for element in stream]
+
+    elements, _ = await asyncio.gather(_matrix(), _ticker())
+    assert len(elements) == 1
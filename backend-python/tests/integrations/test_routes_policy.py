@@ -0,0 +1,108 @@
+import asyncio
+import pytest
+from google.api_core import exceptions as api_exceptions
+
+from app.integrations.routes.policy import CallPolicy, RoutesCaller
+
+
+##### Helpers #####
+
+
+def _caller(**kwargs) -> RoutesCaller:
+    policy = CallPolicy(backoff_base=0.0, backoff_max=0.0, **kwargs)
+    return RoutesCaller(policy=policy)
+
+
+class ScriptedCall:
+    """Callable returning scripted outcomes (exception or value) per attempt."""
+
+    def __init__(self, *outcomes, delay: float = 0.0):
+        self.outcomes = list(outcomes)
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+##### CallPolicy #####
+
+
+def test_policy_rejects_negative_retries():
+    with pytest.raises(ValueError, match="must be >= 0"):
+        CallPolicy(max_retries=-1)
+
+
+##### RoutesCaller #####
+
+
+@pytest.mark.asyncio
+async def test_retry_on_retryable_status():
+    caller = _caller(max_retries=2)
+    call = ScriptedCall(api_exceptions.ServiceUnavailable("down"), "ok")
+
+    assert await caller.call(call) == "ok"
+    assert call.calls == 2
+    assert caller.stats() == {"retry": 1, "success": 1}
+
+
+@pytest.mark.asyncio
+async def test_no_retry_on_client_error():
+    caller = _caller(max_retries=2)
+    call = ScriptedCall(api_exceptions.InvalidArgument("bad request"))
+
+    with pytest.raises(api_exceptions.InvalidArgument):
+        await caller.call(call)
+    assert call.calls == 1
+    assert caller.stats() == {"failure": 1}
+
+
+@pytest.mark.asyncio
+async def test_deadline_and_exhausted_retries():
+    caller = _caller(timeout=0.01, max_retries=1)
+    call = ScriptedCall("late", delay=1)
+
+    with pytest.raises(TimeoutError):
+        await caller.call(call)
+    assert call.calls == 2
+    assert caller.stats() == {"timeout": 2, "retry": 1, "failure": 1}
+
+
+@pytest.mark.asyncio
+async def test_hedged_request():
+    caller = _caller(hedge_percentile=50, hedge_min_samples=1)
+    caller._latencies.append(0.01)  # Threshold: 10 ms
+
+    # Slow primary, fast duplicate
+    delays = iter([1.0, 0.0])
+
+    async def _call():
+        await asyncio.sleep(next(delays))
+        return "ok"
+
+    assert await caller.call(_call) == "ok"
+    assert caller.stats() == {"hedged": 1, "hedge_won": 1, "success": 1}
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_cleans_up_loser():
+    caller = _caller(hedge_percentile=50, hedge_min_samples=1)
+    caller._latencies.append(0.01)  # Threshold: 10 ms
+
+    # Slow primary, fast duplicate
+    delays = iter([1.0, 0.0])
+    tasks = []
+
+    async def _call():
+        tasks.append(asyncio.current_task())
+        await asyncio.sleep(next(delays))
+        return "ok"
+
+    assert await caller.call(_call) == "ok"
+    assert all(task.done() for task in tasks)  # Loser cancelled before returning
+    assert tasks[0].cancelled()
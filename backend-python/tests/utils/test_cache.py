@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from app.utils.cache import BoundedCache, cache_stats, memoize
+
+
+##### BoundedCache #####
+
+
+def test_bounded_cache_lru():
+    cache = BoundedCache("test.lru", max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # Touch "a"
+    cache.set("c", 3)
+
+    # Least recently used entry evicted
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_bounded_cache_ttl(monkeypatch):
+    cache = BoundedCache("test.ttl", ttl=60)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: 1e12)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+##### memoize #####
+
+
+def test_memoize_sync():
+    calls = []
+
+    @memoize("test.sync", max_size=2)
+    def square(x):
+        calls.append(x)
+        return x * x if x else None  # None is cached too
+
+    assert [square(2), square(2), square(0), square(0)] == [4, 4, None, None]
+    assert calls == [2, 0]
+
+    square.cache_clear()
+    square(2)
+    assert calls == [2, 0, 2]
+
+
+def test_memoize_key():
+    @memoize("test.key", key=lambda item: item["id"])
+    def name(item):
+        return item["name"]
+
+    assert name({"id": 1, "name": "a"}) == "a"
+    assert name({"id": 1, "name": "b"}) == "a"  # Same key
+
+
+@pytest.mark.asyncio
+async def test_memoize_async_coalesced():
+    calls = []
+
+    @memoize("test.async")
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x + 1
+
+    # Concurrent misses share one call
+    assert await asyncio.gather(fetch(1), fetch(1), fetch(2)) == [2, 2, 3]
+    assert await fetch(1) == 2
+    assert calls == [1, 2]
+    assert fetch.cache.stats()["hits"] == 1
+
+
+def test_cache_stats():
+    cache = BoundedCache("test.stats")
+    cache.get("a")
+    assert cache_stats()["test.stats"]["misses"] == 1
+
+    # Dropped caches are no longer reported
+    del cache
+    assert "test.stats" not in cache_stats()
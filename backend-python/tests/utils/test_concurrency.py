@@ -0,0 +1,119 @@
+import asyncio
+import pytest
+
+from app.utils.concurrency import (
+    RateLimiter,
+    SingleFlight,
+    gather_bounded,
+    iterate_bounded,
+)
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_order_and_limit():
+    running, peak = 0, 0
+
+    async def _job(idx: int, delay: float) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return idx
+
+    # Later jobs finish first
+    delays = [0.03, 0.02, 0.01, 0.0]
+    factories = [lambda i=i, d=d: _job(i, d) for i, d in enumerate(delays)]
+    results = await gather_bounded(factories, limit=2)
+
+    assert results == [0, 1, 2, 3]  # Input order preserved
+    assert peak == 2  # Concurrency capped
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_fail_fast():
+    cancelled = asyncio.Event()
+
+    async def _slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def _boom():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    # Original error is raised and siblings are cancelled
+    with pytest.raises(RuntimeError, match="boom"):
+        await gather_bounded([_slow, _boom], limit=4)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_iterate_bounded_completion_order():
+    async def _job(idx: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return idx * 10
+
+    delays = [0.02, 0.0, 0.01]
+    factories = [lambda i=i, d=d: _job(i, d) for i, d in enumerate(delays)]
+    results = [item async for item in iterate_bounded(factories, limit=3)]
+
+    assert results == [(1, 10), (2, 20), (0, 0)]  # Yielded as completed
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces():
+    flight, calls = SingleFlight(), []
+
+    async def _job(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    # Identical keys share one computation; distinct keys do not
+    results = await asyncio.gather(
+        flight.do("a", lambda: _job("a")),
+        flight.do("a", lambda: _job("a")),
+        flight.do("b", lambda: _job("b")),
+    )
+    assert results == ["A", "A", "B"]
+    assert calls == ["a", "b"]
+    assert flight.stats() == {"leader": 2, "shared": 1, "in_flight": 0}
+
+    # Finished flights are not reused
+    await flight.do("a", lambda: _job("a"))
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_errors_and_cancellation():
+    flight, release = SingleFlight(), asyncio.Event()
+
+    async def _boom():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    # A cancelled caller leaves the shared computation running
+    first = asyncio.create_task(flight.do("k", _boom))
+    second = asyncio.create_task(flight.do("k", _boom))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    # Errors reach every remaining caller
+    with pytest.raises(RuntimeError, match="boom"):
+        await second
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter():
+    limiter = RateLimiter(rate=100)  # One start every 10 ms
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+    assert loop.time() - start >= 0.03  # First start is immediate
@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+from polyline import decode, encode
+
+from app.utils.geometry import (
+    GeofenceIndex,
+    in_geofence,
+    in_geofence_array,
+    simplify_points,
+    simplify_polyline,
+)
+
+
+##### Helpers #####
+
+
+def _square(lat: float, lon: float, size: float) -> str:
+    return encode(
+        [(lat, lon), (lat + size, lon), (lat + size, lon + size), (lat, lon + size)]
+    )
+
+
+GEOFENCES = {
+    "A": _square(22.0, 113.0, 1.0),
+    "B": _square(22.5, 113.5, 1.0),  # Overlaps A
+    "LINE": encode([(22.0, 113.0), (23.0, 114.0)]),  # Invalid polygon
+}
+
+
+##### Tests #####
+
+
+@pytest.mark.parametrize(
+    ("point", "expected"),
+    [
+        ((22.2, 113.2), {"A"}),
+        ((22.7, 113.7), {"A", "B"}),  # Overlap
+        ((23.0, 113.2), {"A"}),  # On the boundary
+        ((21.0, 113.0), set()),  # Outside
+    ],
+)
+def test_geofence_index_areas(point, expected):
+    index = GeofenceIndex(GEOFENCES)
+    assert index.areas(point) == expected
+
+    # Consistent with single-geofence checks
+    for name, polyline in GEOFENCES.items():
+        assert in_geofence(point, polyline) == (name in expected)
+
+
+def test_geofence_index_contains():
+    index = GeofenceIndex(GEOFENCES)
+    assert index.names == ("A", "B")  # Invalid polygons are skipped
+    assert index.contains((22.2, 113.2), "B", "A")
+    assert not index.contains((22.2, 113.2), "B", "LINE")
+
+
+def test_geofence_index_membership():
+    index = GeofenceIndex(GEOFENCES)
+    points = np.array([(22.2, 113.2), (22.7, 113.7), (23.0, 113.2), (21.0, 113.0)])
+
+    # One row per point, one column per geofence
+    matrix = index.membership(points)
+    assert matrix.shape == (4, 2)
+    assert matrix.tolist() == [
+        [True, False],
+        [True, True],
+        [True, False],
+        [False, False],
+    ]
+
+    # Same answers as the per-point queries
+    assert index.areas_many(points) == [index.areas(tuple(p)) for p in points]
+    assert in_geofence_array(points, GEOFENCES["B"]).tolist() == matrix[:, 1].tolist()
+    assert not in_geofence_array(points, GEOFENCES["LINE"]).any()
+
+
+def test_geofence_index_areas_along():
+    index = GeofenceIndex(GEOFENCES)
+    assert index.areas_along([(21.5, 113.2), (22.2, 113.2)]) == {"A"}  # Enters A
+    assert index.areas_along([(21.8, 113.2), (22.7, 113.7)]) == {"A", "B"}
+    assert index.areas_along([(21.0, 113.0), (21.5, 114.0)]) == set()  # Outside
+
+
+def test_simplify_points():
+    # Dense, almost straight path: 1 m wiggles over ~2 km
+    points = np.array([(22.28 + i * 1e-4, 114.15 + (i % 2) * 1e-5) for i in range(200)])
+    assert simplify_points(points, 5).tolist() == [
+        points[0].tolist(),
+        points[-1].tolist(),
+    ]
+    assert len(simplify_points(points, 0.5)) == len(points)  # Below the wiggles
+    assert len(simplify_points(points, 0)) == len(points)  # Disabled
+
+    # A corner deviating more than the tolerance is kept
+    corner = np.array([(22.0, 114.0), (22.0, 114.01), (22.01, 114.01)])
+    assert simplify_points(corner, 100).tolist() == corner.tolist()
+    assert len(simplify_points(corner, 2000)) == 2
+
+
+def test_simplify_polyline():
+    path = [(22.28 + i * 1e-4, 114.15) for i in range(50)]  # Straight line
+    assert decode(simplify_polyline(encode(path), 1)) == [path[0], path[-1]]
+    assert simplify_polyline(encode(path), 0) == encode(path)
@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+import polyline
+import pytest
+
+from app.integrations.fares.data import (
+    HONG_KONG_GEOFENCE_POLYLINES,
+    MACAU_GEOFENCE_POLYLINES,
+)
+from app.utils.polyline import decode_polyline, encode_polyline
+
+
+##### Tests #####
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [*MACAU_GEOFENCE_POLYLINES.values(), *HONG_KONG_GEOFENCE_POLYLINES.values()],
+)
+def test_decode_geofences(encoded):
+    # Same coordinates as the reference implementation
+    decoded = decode_polyline(encoded)
+    assert decoded.shape[1] == 2
+    assert np.allclose(decoded, polyline.decode(encoded))
+    assert np.allclose(decode_polyline(encode_polyline(decoded)), decoded)
+
+
+@pytest.mark.parametrize("precision", [5, 6])
+def test_round_trip(precision):
+    rng = random.Random(precision)
+    for _ in range(100):
+        points = [
+            (rng.uniform(-90, 90), rng.uniform(-180, 180))
+            for _ in range(rng.randint(1, 30))
+        ]
+        encoded = polyline.encode(points, precision)
+        assert encode_polyline(points, precision) == encoded
+        assert np.allclose(
+            decode_polyline(encoded, precision), polyline.decode(encoded, precision)
+        )
+
+
+def test_rounding_and_empty():
+    # Half away from zero, like the reference implementation
+    points = [(0.000005, -0.000005), (0.000015, -0.000025)]
+    assert encode_polyline(points) == polyline.encode(points)
+
+    assert encode_polyline([]) == ""
+    assert decode_polyline("").shape == (0, 2)